@@ -2,6 +2,7 @@ from __future__ import print_function, division
 
 import sys
 import collections
+from numbers import Integral
 
 import numpy as np
 
@@ -149,3 +150,55 @@ def dtype_real_to_complex(dtype):
     elif dtype == np.float32:
         return np.complex64
     return dtype
+
+
+def _fork_context():
+    """ A `multiprocessing` context which creates the processes by forking, ``None`` if forking is not possible
+
+    Forked processes inherit the state of the parent, hence (closure) functions need not be picklable.
+    """
+    import multiprocessing
+    try:
+        return multiprocessing.get_context('fork')
+    except AttributeError:
+        # Python 2 always forks, except on Windows
+        if sys.platform.startswith('win'):
+            return None
+        return multiprocessing
+    except ValueError:
+        return None
+
+
+def _imap(func, n, pool=None):
+    """ Iterate ``func(i)`` for ``i in range(n)`` (in order), possibly in parallel
+
+    Parameters
+    ----------
+    func : callable
+       function called with the index as the only argument
+    n : int
+       number of calls
+    pool : int or object, optional
+       if an integer, the calls are distributed on this number of threads (beneficial when
+       `func` is dominated by numpy/LAPACK routines that release the GIL), otherwise
+       an object with an ``imap`` method (e.g. `multiprocessing.Pool`).
+    """
+    if isinstance(pool, Integral):
+        if pool <= 1 or n <= 1:
+            pool = None
+        else:
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(pool)
+            try:
+                for v in pool.imap(func, _range(n)):
+                    yield v
+            finally:
+                pool.terminate()
+                pool.join()
+            return
+    if pool is None:
+        for i in _range(n):
+            yield func(i)
+    else:
+        for v in pool.imap(func, _range(n)):
+            yield v
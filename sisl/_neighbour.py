@@ -0,0 +1,208 @@
+""" Spatial index of the atoms in a geometry, including all supercell images
+
+This module implements a lazily created KD-tree over all atoms in the
+supercell of a `Geometry`. It is used to speed up `Geometry.close`,
+`Geometry.within` and their supercell equivalents.
+
+The index stores the state of the geometry at creation and it is
+the responsibility of the owner to check `NeighbourIndex.is_valid`
+before querying it.
+"""
+from __future__ import print_function, division
+
+import numpy as np
+from numpy import dot, square, sqrt
+from scipy.spatial import cKDTree
+
+import sisl._array as _a
+
+
+__all__ = ['NeighbourIndex']
+
+
+class NeighbourIndex(object):
+    """ KD-tree of all supercell atomic coordinates in a geometry
+
+    The tree contains ``geometry.na_s`` points where point ``ia + na * s``
+    is atom ``ia`` translated by the supercell offset ``geometry.sc.sc_off[s, :]``.
+    Thus the indices returned from the tree are the supercell atomic indices.
+
+    Parameters
+    ----------
+    geometry : Geometry
+       the geometry to create the index for
+    """
+    __slots__ = ['_xyz', '_cell', '_sc_off', '_offset', '_tree', '_uc_tree']
+
+    # The tree queries are performed with a slightly larger (relative) radius.
+    # The final decision is made on the distances calculated here
+    # to be consistent with the brute force method.
+    _R_pad = 1e-8
+
+    def __init__(self, geometry):
+        xyz = geometry.xyz
+        sc = geometry.sc
+        self._xyz = xyz.copy()
+        self._cell = sc.cell.copy()
+        self._sc_off = sc.sc_off.copy()
+        # Calculate offsets in the same way as `SuperCell.offset`
+        self._offset = _a.arrayd([sc.offset(isc) for isc in self._sc_off]).reshape(-1, 3)
+
+        # Create all supercell coordinates (same ordering as supercell indices)
+        axyz = (self._xyz.reshape(1, -1, 3) + self._offset.reshape(-1, 1, 3)).reshape(-1, 3)
+        self._tree = cKDTree(axyz)
+        # Tree of the unit-cell atoms, only created when needed
+        self._uc_tree = None
+
+    @property
+    def na(self):
+        """ Number of atoms in the unit-cell """
+        return self._xyz.shape[0]
+
+    def is_valid(self, geometry):
+        """ Whether the index still reflects the atomic coordinates and supercell of `geometry`
+
+        The coordinates are compared against a copy taken at creation so that in-place
+        changes of ``geometry.xyz`` are detected (a single memory comparison, which is
+        cheap compared to the query itself).
+        """
+        xyz = geometry.xyz
+        sc = geometry.sc
+        if xyz.shape != self._xyz.shape or sc.sc_off.shape != self._sc_off.shape:
+            return False
+        if not (np.array_equal(sc.cell, self._cell) and np.array_equal(sc.sc_off, self._sc_off)):
+            return False
+        # Atomic coordinates may have been changed in-place
+        return np.array_equal(xyz, self._xyz)
+
+    def _pad(self, R):
+        """ Padded radius used for tree queries """
+        return R + self._R_pad * max(1., R)
+
+    def _candidates(self, center, R, isc=None):
+        """ Atoms within a (padded) radius `R` of `center`
+
+        Returns
+        -------
+        index : ascending supercell indices (or unit-cell indices if `isc` is passed)
+        ia : unit-cell indices of the atoms
+        off : supercell offsets of the atoms
+        """
+        na = self.na
+        if isc is None:
+            idx = np.sort(_a.asarrayi(self._tree.query_ball_point(center, self._pad(R))))
+            ia = idx % na
+            return idx, ia, self._offset[idx // na, :]
+
+        # Search around the shifted center and only retain the primary unit-cell atoms
+        off = dot(isc, self._cell)
+        idx = np.sort(_a.asarrayi(self._tree.query_ball_point(center - off, self._pad(R))))
+        s = (self._sc_off == 0).all(1).nonzero()[0][0]
+        idx = idx[idx // na == s] - na * s
+        return idx, idx, off.reshape(1, 3)
+
+    def within_sphere(self, center, R, isc=None):
+        """ Indices, distances and offset coordinates of all atoms within a sphere
+
+        Parameters
+        ----------
+        center : (3, ) array_like
+           center of the sphere
+        R : float
+           radius of the sphere
+        isc : (3, ) array_like, optional
+           only return atoms in the supercell with offset `isc`. In this case
+           the returned indices are unit-cell indices.
+           If not specified all supercell atoms are considered and the returned
+           indices are supercell indices.
+
+        Returns
+        -------
+        index : indices of atoms within the sphere (ascending)
+        dist : distance to `center` for each of the atoms in `index`
+        dxyz : coordinates of the atoms in `index` relative to `center`
+        """
+        if R < 0.:
+            return _a.emptyi([0]), _a.emptyd([0]), _a.emptyd([0, 3])
+        center = _a.asarrayd(center).ravel()
+        idx, ia, off = self._candidates(center, R, isc)
+        dxyz = self._xyz[ia, :] + (off - center.reshape(1, 3))
+        d2 = square(dxyz).sum(1)
+        ix = (d2 <= R * R).nonzero()[0]
+        return idx[ix], sqrt(d2[ix]), dxyz[ix, :]
+
+    def within_shape(self, shape, isc=None):
+        """ Indices and coordinates of all atoms within a shape
+
+        Parameters
+        ----------
+        shape : Shape
+           the shape to search in, the candidates are found from the encompassing
+           sphere of the shape (`Shape.toSphere`)
+        isc : (3, ) array_like, optional
+           see `within_sphere`
+
+        Returns
+        -------
+        index : indices of atoms within the shape (ascending)
+        xyz : coordinates of the atoms in `index`
+        """
+        sphere = shape.toSphere()
+        idx, ia, off = self._candidates(_a.asarrayd(sphere.center).ravel(), sphere.radius, isc)
+        xyz = self._xyz[ia, :] + off
+        ix = shape.within_index(xyz)
+        return idx[ix], xyz[ix, :]
+
+    def pairs(self, R, atom=None):
+        """ All pairs of atoms within a distance `R` (one dual-tree traversal)
+
+        Parameters
+        ----------
+        R : float
+           maximum distance between the atoms
+        atom : array_like of int, optional
+           only search for neighbours of these atoms, defaults to all atoms
+
+        Returns
+        -------
+        row : index of the atom in `atom` (ascending)
+        col : supercell index of the neighbouring atom (ascending for each `row`)
+        dist : distance between the atoms
+        """
+        if R < 0.:
+            return _a.emptyi([0]), _a.emptyi([0]), _a.emptyd([0])
+        if atom is None:
+            xyz = self._xyz
+        else:
+            xyz = self._xyz[atom, :]
+        if len(xyz) == 0:
+            return _a.emptyi([0]), _a.emptyi([0]), _a.emptyd([0])
+
+        p = cKDTree(xyz).sparse_distance_matrix(self._tree, self._pad(R), output_type='ndarray')
+        row = p['i'].astype(np.int32)
+        col = p['j'].astype(np.int32)
+        del p
+
+        # Calculate distances in the same way as `within_sphere`
+        na = self.na
+        d2 = square(self._xyz[col % na, :] + (self._offset[col // na, :] - xyz[row, :])).sum(1)
+        ix = (d2 <= R * R).nonzero()[0]
+        row, col, d2 = row[ix], col[ix], d2[ix]
+        ix = np.lexsort((col, row))
+        return row[ix], col[ix], sqrt(d2[ix])
+
+    def connects_sc(self, isc, R):
+        """ Whether any atom in the supercell `isc` is within `R` of an atom in the unit-cell
+
+        The supercell index need not be one of the supercells in the geometry.
+        """
+        if R < 0.:
+            return False
+        if self._uc_tree is None:
+            self._uc_tree = cKDTree(self._xyz)
+        na = self.na
+        off = dot(isc, self._cell)
+        _, ia = self._uc_tree.query(self._xyz + off.reshape(1, 3), distance_upper_bound=self._pad(R))
+        ja = (ia < na).nonzero()[0]
+        d2 = square(self._xyz[ja, :] + (off.reshape(1, 3) - self._xyz[ia[ja], :])).sum(1)
+        return np.any(d2 <= R * R)
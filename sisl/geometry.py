@@ -27,7 +27,9 @@ from .quaternion import Quaternion
 from .supercell import SuperCell, SuperCellChild
 from .atom import Atom, Atoms
 from .shape import Shape, Sphere, Cube
+from .sparse import SparseCSR
 from .sparse_geometry import SparseAtom
+from ._neighbour import NeighbourIndex
 from ._namedindex import NamedIndex
 
 __all__ = ['Geometry', 'sgeom']
@@ -115,6 +117,7 @@ class Geometry(SuperCellChild):
 
         # Create the geometry coordinate
         # We need flatten to ensure a copy
+        # (this also creates the spatial index of the atoms on first use)
         self.xyz = _a.asarrayd(xyz).flatten().reshape(-1, 3)
 
         # Default value
@@ -983,6 +986,7 @@ class Geometry(SuperCellChild):
         # Since for 1 it is not sure that it is a connection or not, we limit the search by
         # removing it.
         nsc[axis] = np.where(nsc[axis] > 1, nsc[axis], 0)
+        nindex = self.__neighbour_index()
         for i in axis:
             # Initialize the isc for this direction
             # (note we do not take non-orthogonal directions
@@ -995,11 +999,8 @@ class Geometry(SuperCellChild):
             while prev_isc == isc[i]:
                 # Try next supercell connection
                 isc[i] += 1
-                for ia in self:
-                    idx = self.close_sc(ia, isc=isc, R=R)
-                    if len(idx) > 0:
-                        prev_isc = isc[i]
-                        break
+                if nindex.connects_sc(isc, R):
+                    prev_isc = isc[i]
 
             # Save the reached supercell connection
             nsc[i] = prev_isc * 2 + 1
@@ -1904,6 +1905,21 @@ class Geometry(SuperCellChild):
             g.xyz[atom, 1] *= -1
         return self.__class__(g.xyz, atom=g.atom, sc=self.sc.copy())
 
+    @property
+    def xyz(self):
+        """ Atomic coordinates
+
+        The spatial index used by `close` and `within` is discarded when the coordinates
+        are assigned (``geometry.xyz = xyz``) and re-created when they are changed in-place.
+        """
+        return self._xyz
+
+    @xyz.setter
+    def xyz(self, xyz):
+        """ Assign the atomic coordinates """
+        self._xyz = xyz
+        self._nindex = None
+
     @property
     def fxyz(self):
         """ Returns geometry coordinates in fractional coordinates """
@@ -1973,6 +1989,14 @@ class Geometry(SuperCellChild):
         sc = self.sc.scale(scale)
         return self.__class__(xyz, atom=atom, sc=sc)
 
+    def __neighbour_index(self):
+        """ Spatial index of all supercell atoms, (re-)created if the geometry has changed since the last call """
+        nindex = getattr(self, '_nindex', None)
+        if nindex is None or not nindex.is_valid(self):
+            nindex = NeighbourIndex(self)
+            self._nindex = nindex
+        return nindex
+
     def within_sc(self, shapes, isc=None,
                   idx=None, idx_xyz=None,
                   ret_xyz=False, ret_rij=False):
@@ -2019,17 +2043,21 @@ class Geometry(SuperCellChild):
             shapes = [shapes]
         nshapes = len(shapes)
 
-        # Convert to actual array
-        if idx is not None:
-            if not isndarray(idx):
-                idx = _a.asarrayi(idx).ravel()
-        else:
-            # If idx is None, then idx_xyz cannot be used!
-            # So we force it to None
-            idx_xyz = None
-
         # Get shape centers
         off = shapes[-1].center[:]
+
+        if idx is None:
+            # Use the spatial index for searching all atoms
+            # If idx is None, then idx_xyz cannot be used!
+            if isc is None:
+                isc = _a.zerosi(3)
+            idx, xa = self.__neighbour_index().within_shape(shapes[-1], isc)
+            return self.__within_shapes(shapes, off, idx, xa, ret_xyz, ret_rij)
+
+        # Convert to actual array
+        if not isndarray(idx):
+            idx = _a.asarrayi(idx).ravel()
+
         # Get the supercell offset
         soff = self.sc.offset(isc)[:]
 
@@ -2050,12 +2078,13 @@ class Geometry(SuperCellChild):
         ix = shapes[-1].within_index(xa)
         # Reduce search space
         xa = xa[ix, :]
+        idx = idx[ix]
 
-        if idx is None:
-            # This is because of the pre-check of the distance checks
-            idx = ix
-        else:
-            idx = idx[ix]
+        return self.__within_shapes(shapes, off, idx, xa, ret_xyz, ret_rij)
+
+    def __within_shapes(self, shapes, off, idx, xa, ret_xyz, ret_rij):
+        """ Split atoms in the largest shape into the individual `shapes` and create the return values for `within_sc` """
+        nshapes = len(shapes)
 
         if len(xa) == 0:
             # Quick return if there are no entries...
@@ -2184,14 +2213,6 @@ class Geometry(SuperCellChild):
         # Maximum distance queried
         max_R = R[-1]
 
-        # Convert to actual array
-        if idx is not None:
-            if not isndarray(idx):
-                idx = _a.asarrayi(idx).ravel()
-        else:
-            # If idx is None, then idx_xyz cannot be used!
-            idx_xyz = None
-
         if isinstance(xyz_ia, Integral):
             off = self.xyz[xyz_ia, :]
         elif not isndarray(xyz_ia):
@@ -2199,6 +2220,16 @@ class Geometry(SuperCellChild):
         else:
             off = xyz_ia
 
+        if idx is None:
+            # Use the spatial index for searching all atoms
+            # If idx is None, then idx_xyz cannot be used!
+            idx, d, dxa = self.__neighbour_index().within_sphere(off, max_R, isc)
+            return self.__close_shells(off, R, idx, d, dxa, ret_xyz, ret_rij)
+
+        # Convert to actual array
+        if not isndarray(idx):
+            idx = _a.asarrayi(idx).ravel()
+
         # Calculate the complete offset
         foff = self.sc.offset(isc)[:] - off[:]
 
@@ -2218,15 +2249,15 @@ class Geometry(SuperCellChild):
         # systems.
         # For smaller ones this will actually be a slower
         # method..
-        if idx is None:
-            idx, d = indices_in_sphere_with_dist(dxa, max_R)
-            dxa = dxa[idx, :].reshape(-1, 3)
-        else:
-            ix, d = indices_in_sphere_with_dist(dxa, max_R)
-            idx = idx[ix]
-            dxa = dxa[ix, :].reshape(-1, 3)
-            del ix
+        ix, d = indices_in_sphere_with_dist(dxa, max_R)
+        idx = idx[ix]
+        dxa = dxa[ix, :].reshape(-1, 3)
+        del ix
+
+        return self.__close_shells(off, R, idx, d, dxa, ret_xyz, ret_rij)
 
+    def __close_shells(self, off, R, idx, d, dxa, ret_xyz, ret_rij):
+        """ Split atoms within ``R[-1]`` into the individual shells and create the return values for `close_sc` """
         if len(idx) == 0:
             # Create default return
             ret = [[_a.emptyi([0])] * len(R)]
@@ -2447,6 +2478,7 @@ class Geometry(SuperCellChild):
 
             # Update the coordinate
             self.xyz[ia, :] = c + bv / d * rad
+            self._nindex = None
 
         else:
             raise NotImplementedError(
@@ -2490,6 +2522,11 @@ class Geometry(SuperCellChild):
             shapes = [shapes]
         nshapes = len(shapes)
 
+        if idx is None:
+            # Use the spatial index for searching all supercell atoms at once
+            idx, xa = self.__neighbour_index().within_shape(shapes[-1])
+            return self.__within_shapes(shapes, shapes[-1].center[:], idx, xa, ret_xyz, ret_rij)
+
         # Get global calls
         # Is faster for many loops
         concat = np.concatenate
@@ -2602,6 +2639,11 @@ class Geometry(SuperCellChild):
         elif not isndarray(xyz_ia):
             xyz_ia = _a.asarrayd(xyz_ia)
 
+        if idx is None:
+            # Use the spatial index for searching all supercell atoms at once
+            idx, d, dxa = self.__neighbour_index().within_sphere(xyz_ia, R[-1])
+            return self.__close_shells(xyz_ia, R, idx, d, dxa, ret_xyz, ret_rij)
+
         # Get global calls
         # Is faster for many loops
         concat = np.concatenate
@@ -2661,6 +2703,68 @@ class Geometry(SuperCellChild):
 
         return ret[0]
 
+    def neighbours(self, R=None, atom=None):
+        """ Neighbour list of atoms in compressed sparse row (CSR) format
+
+        All atoms (in the supercell) within the shells of radius `R` of each atom
+        are found in a single pass through the spatial index of the geometry.
+        This is equivalent to calling `close` for each atom, albeit much faster.
+
+        Parameters
+        ----------
+        R : float or array_like, optional
+           the radii of the shells, defaults to ``self.maxR()``.
+           If `R` is an array the shells are
+           ``( x <= R[0] , R[0] < x <= R[1], R[1] < x <= R[2] )``,
+           i.e. `R` must be ascending.
+        atom : int or array_like, optional
+           only find the neighbours of these atoms, defaults to all atoms
+
+        Examples
+        --------
+        >>> geom = Geometry([[0, 0, 0], [1, 0, 0]], Atom(1, R=1.), sc=SuperCell(2., nsc=[3, 1, 1]))
+        >>> ptr, col, dist, shell = geom.neighbours(R=[0.1, 1.])
+        >>> ptr
+        array([0, 3, 6], dtype=int32)
+        >>> col
+        array([0, 1, 3, 0, 1, 4], dtype=int32)
+        >>> shell
+        array([0, 1, 1, 1, 0, 1], dtype=int32)
+
+        Returns
+        -------
+        ptr : numpy.ndarray
+           row pointer (``len(atom) + 1``), the neighbours of ``atom[i]`` are ``col[ptr[i]:ptr[i+1]]``
+        col : numpy.ndarray
+           supercell atomic indices of the neighbours (ascending for each atom)
+        dist : numpy.ndarray
+           distance between the atom and the neighbour
+        shell : numpy.ndarray
+           the index of the shell in `R` the neighbour belongs to
+
+        See Also
+        --------
+        close : neighbours of a single atom/coordinate
+        """
+        if R is None:
+            R = self.maxR()
+        R = _a.asarrayd(R).ravel()
+        if len(R) > 1 and not is_ascending(R):
+            raise ValueError(self.__class__.__name__ + '.neighbours proximity checks for several '
+                             'quantities at a time requires ascending R values.')
+        if atom is None:
+            n = self.na
+        else:
+            atom = _a.asarrayi(atom).ravel()
+            n = len(atom)
+
+        row, col, dist = self.__neighbour_index().pairs(R[-1], atom)
+        ptr = _a.emptyi([n + 1])
+        ptr[0] = 0
+        _a.cumsumi(np.bincount(row, minlength=n), out=ptr[1:])
+        shell = np.searchsorted(R, dist).astype(np.int32, copy=False)
+        return ptr, col, dist, shell
+
     def a2o(self, ia, all=False):
         """
         Returns an orbital index of the first orbital of said atom.
@@ -2901,10 +3005,9 @@ class Geometry(SuperCellChild):
         dtype : numpy.dtype, numpy.float64
            the data-type of the sparse matrix
         na_iR : int, 1000
-           number of atoms within the sphere for speeding
-           up the `iter_block` loop.
+           not used (kept for backwards compatibility)
         method : str, optional
-           see `iter_block` for details
+           not used (kept for backwards compatibility)
 
         Returns
         -------
@@ -2913,28 +3016,29 @@ class Geometry(SuperCellChild):
 
         See Also
         --------
-        iter_block : the method for looping the atoms
+        neighbours : the neighbour list used to create the sparse matrix
         distance : create a list of distances
         """
-        rij = SparseAtom(self, nnzpr=20, dtype=dtype)
-
-        # Get R
-        R = (0.1, self.maxR())
-        iR = self.iR(na_iR)
+        rij = SparseAtom(self, nnzpr=1, dtype=dtype)
 
-        # Do the loop
-        for ias, idxs in self.iter_block(iR=iR, method=method):
+        # Get all neighbours in one go
+        ptr, col, dist, shell = self.neighbours(R=(0.1, self.maxR()))
 
-            # Get all the indexed atoms...
-            # This speeds up the searching for
-            # coordinates...
-            idxs_xyz = self[idxs, :]
+        # Only retain the outer shell and prepend the diagonal element
+        idx = (shell == 1).nonzero()[0]
+        ncol = np.bincount(np.repeat(_a.arangei(self.na), np.diff(ptr))[idx], minlength=self.na) + 1
+        nptr = _a.emptyi([self.na + 1])
+        nptr[0] = 0
+        _a.cumsumi(ncol, out=nptr[1:])
+        ncol = _a.zerosi(nptr[-1])
+        D = np.zeros(nptr[-1], dtype=dtype)
+        off = np.ones(nptr[-1], dtype=np.bool_)
+        off[nptr[:-1]] = False
+        ncol[nptr[:-1]] = _a.arangei(self.na)
+        ncol[off] = col[idx]
+        D[off] = dist[idx]
 
-            # Loop the atoms inside
-            for ia in ias:
-                idx, r = self.close(ia, R=R, idx=idxs, idx_xyz=idxs_xyz, ret_rij=True)
-                rij[ia, ia] = 0.
-                rij[ia, idx[1]] = r[1]
+        rij._csr = SparseCSR((D, ncol, nptr), shape=(self.na, self.na_s))
 
         return rij
 
@@ -3051,13 +3155,8 @@ class Geometry(SuperCellChild):
         # First create the initial lists of shell atoms
         # The inner shell will never be used, because it should correspond
         # to the atom it-self.
-        shells = [[] for i in range(len(dR) - 1)]
-
-        for a in atom:
-            _, r = self.close(a, R=dR, ret_rij=True)
-
-            for i, rlist in enumerate(r[1:]):
-                shells[i].extend(rlist)
+        _, _, dist, shell = self.neighbours(R=dR, atom=atom)
+        shells = [dist[shell == i] for i in range(1, len(dR))]
 
         # Now parse all of the shells with the correct routine
         # First we grap the routine:
@@ -3276,7 +3375,7 @@ class Geometry(SuperCellChild):
         class MoveOrigin(argparse.Action):
 
             def __call__(self, parser, ns, no_value, option_string=None):
-                ns._geometry.xyz[:, :] -= np.amin(ns._geometry.xyz, axis=0)[None, :]
+                ns._geometry.xyz = ns._geometry.xyz - np.amin(ns._geometry.xyz, axis=0)[None, :]
         p.add_argument(*opts('--origin', '-O'), action=MoveOrigin, nargs=0,
                    help='Move all atoms such that one atom will be at the origin.')
 
@@ -3301,7 +3400,7 @@ class Geometry(SuperCellChild):
                     # Change all coordinates using the reciprocal cell and move to unit-cell (% 1.)
                     fxyz = g.fxyz % 1.
                     fxyz -= np.amin(fxyz, axis=0)
-                    ns._geometry.xyz[:, :] = dot(fxyz, g.cell)
+                    ns._geometry.xyz = dot(fxyz, g.cell)
         p.add_argument(*opts('--unit-cell', '-uc'), choices=['translate', 'tr', 't', 'mod'],
                        action=MoveUnitCell,
                        help='Moves the coordinates into the unit-cell by translation or the mod-operator')
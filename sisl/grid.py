@@ -305,7 +305,7 @@ class Grid(SuperCellChild):
             geom = self.geometry.copy()
             fxyz = geom.fxyz.copy()
             geom.set_supercell(grid.sc)
-            geom.xyz[:, :] = np.dot(fxyz, grid.sc.cell)
+            geom.xyz = np.dot(fxyz, grid.sc.cell)
             grid.set_geometry(geom)
 
         return grid
@@ -1,6 +1,11 @@
 from __future__ import print_function, division
 
-__all__ = ['starts_with_list']
+import re
+import numpy as np
+
+from sisl.messages import SislError
+
+__all__ = ['starts_with_list', 'read_values', 'write_values']
 
 
 def starts_with_list(l, comments):
@@ -8,3 +13,217 @@ def starts_with_list(l, comments):
         if l.startswith(comment):
             return True
     return False
+
+
+def _count_values(block):
+    """ Number of white-space separated words in each line of `block` """
+    if not isinstance(block, bytes):
+        block = block.encode('ascii', 'replace')
+    b = np.frombuffer(block, np.uint8)
+    sep = b <= 32
+    start = ~sep
+    start[1:] &= sep[:-1]
+    # first character of each line
+    line = np.flatnonzero(b[:-1] == 10) + 1
+    return np.add.reduceat(start, np.concatenate(([0], line)), dtype=np.intp)
+
+
+def read_values(fh, n, dtype=np.float64, out=None, lines=2 ** 16):
+    """ Read `n` white-space separated numbers from the file handle `fh` into a (flat) array
+
+    The numbers are converted in C (`numpy.fromstring`) for blocks of lines, i.e. no
+    intermediate Python objects are created for the individual numbers.
+    The file handle is left at the line after the last number (the data may be followed by any text).
+
+    Parameters
+    ----------
+    fh : file
+       file handle positioned at the first line of numbers (text or binary mode, e.g. from `gzip.open`)
+    n : int
+       number of values to read
+    dtype : numpy.dtype, optional
+       data-type of the returned values, the numbers are directly converted to this data-type
+    out : numpy.ndarray, optional
+       1D array of length `n` where the values are stored, may be a (strided) view
+    lines : int, optional
+       maximum number of lines converted in one block
+
+    Returns
+    -------
+    numpy.ndarray : the values (`out` if passed)
+    """
+    if out is None:
+        out = np.empty(n, dtype=dtype)
+    dtype = out.dtype
+    try:
+        # Blocks of lines are only read if we can go back in the file
+        fh.tell()
+        block_lines = lines
+    except (AttributeError, IOError, OSError):
+        block_lines = 1
+    i = 0
+    # Largest number of values per line, a block of lines which can at most contain the
+    # remaining values is read. If a line in the block contains more values than nline,
+    # the block may include lines after the data and it is re-read with the updated nline.
+    nline = 0
+    while i < n:
+        m = min((n - i) // max(nline, 1), block_lines)
+        if nline == 0 or m <= 1:
+            block = fh.readline()
+            if len(block) == 0:
+                break
+            v = np.fromstring(block, dtype=dtype, sep=' ')
+            nline = max(nline, len(v))
+        else:
+            pos = fh.tell()
+            block = [fh.readline() for _ in range(m)]
+            block = block[0][:0].join(block)
+            count = _count_values(block)
+            if count.sum() > n - i:
+                fh.seek(pos)
+                nline = max(nline + 1, count.max())
+                continue
+            nline = max(nline, count.max())
+            v = np.fromstring(block, dtype=dtype, sep=' ')
+        if i + len(v) > n:
+            raise SislError('read_values found more values than requested, the lines '
+                            'after the data may not contain numbers.')
+        out[i:i+len(v)] = v
+        i += len(v)
+    if i != n:
+        raise SislError('read_values found {} values, expected {}.'.format(i, n))
+    return out
+
+
+# Formats which are formatted by numpy, [width].<precision>e
+_FMT_E = re.compile(r'^(\d*)\.(\d+)e$')
+# Powers of 10 (indexed by the exponent)
+_POW10 = 10. ** np.arange(-300, 301)
+_POW10 = np.concatenate((_POW10[300:], _POW10[:300]))
+# Characters of all 3 digit numbers (padded to 4 bytes for fast indexing)
+_DIGITS = np.frombuffer(''.join(['{:03d} '.format(i) for i in range(1000)]).encode('ascii'), np.uint32)
+
+
+def _digits(i):
+    """ Characters of the 3 digit numbers `i` """
+    return _DIGITS[i].view(np.uint8).reshape(-1, 4)[:, :3]
+
+
+def _format_e(x, width, p, ncol):
+    """ Format `x` as ``'{:<width>.<p>e}'`` in lines of `ncol` values using numpy, None if not possible
+
+    The digits are calculated from the decimal exponent and the scaled (and rounded) mantissa.
+    Non-finite values and extreme exponents are not handled.
+    """
+    n = len(x)
+    a = np.abs(x)
+    nz = a > 0
+    with np.errstate(all='ignore'):
+        e = np.floor(np.log10(np.where(nz, a, 1.))).astype(np.int64)
+    if not np.all(np.isfinite(x)) or np.any(np.abs(e) > 290):
+        return None
+    m = a / _POW10[e - p]
+    # Correct the exponent for rounding errors in log10 and the rounding of the mantissa
+    for fix, de in [(np.rint(m) >= 10 ** (p + 1), 1), (nz & (np.rint(m) < 10 ** p), -1)]:
+        e[fix] += de
+        m[fix] = a[fix] / _POW10[e[fix] - p]
+    # Mantissas close to a tie may be rounded differently than the exact decimal
+    # representation of the value, these are formatted by Python
+    tie = np.abs(m - np.floor(m) - 0.5) < m * 1e-14
+    m = np.rint(m)
+    for i in tie.nonzero()[0]:
+        mant, exp = '{:.{}e}'.format(a[i], p).split('e')
+        m[i] = int(mant.replace('.', ''))
+        e[i] = int(exp)
+    ae = np.abs(e)
+
+    # Columns: padding, sign, digit, '.', p digits, 'e', exponent sign, 3 exponent digits, separator
+    length = p + 6
+    pad = max(width - length, 0)
+    W = pad + p + 9
+    out = np.empty([n, W], np.uint8)
+    out[:, :pad] = ord(' ')
+    out[:, pad] = ord('-')
+    # Digits of the mantissa in groups of 3 (the mantissa is an exact integer)
+    ng = p // 3 + 1
+    digits = np.empty([n, 3 * ng], np.uint8)
+    for g in range(ng - 1, -1, -1):
+        q = np.floor(m * 1e-3)
+        digits[:, 3*g:3*g+3] = _digits((m - q * 1000).astype(np.intp))
+        m = q
+    digits = digits[:, 3*ng-p-1:]
+    out[:, pad+1] = digits[:, 0]
+    out[:, pad+2] = ord('.')
+    out[:, pad+3:pad+p+3] = digits[:, 1:]
+    out[:, pad+p+3] = ord('e')
+    out[:, pad+p+4] = np.where(e < 0, ord('-'), ord('+'))
+    out[:, pad+p+5:pad+p+8] = _digits(ae)
+    out[:, -1] = ord(' ')
+    out[ncol-1::ncol, -1] = ord('\n')
+    out[-1, -1] = ord('\n')
+
+    # Remove the unused characters (sign, 3rd exponent digit and padding)
+    neg = np.signbit(x)
+    e3 = ae >= 100
+    npad = np.maximum(width - length - neg - e3, 0)
+    col = np.ones(W, np.bool_)
+    col[:pad] = np.arange(pad) >= pad - npad[0]
+    col[pad] = neg[0]
+    col[pad+p+5] = e3[0]
+    if np.all(neg == neg[0]) and np.all(e3 == e3[0]) and np.all(npad == npad[0]):
+        # all numbers have the same length
+        return out[:, col].tobytes().decode('ascii')
+    keep = np.ones([n, W], np.bool_)
+    keep[:, :pad] = np.arange(pad).reshape(1, -1) >= pad - npad.reshape(-1, 1)
+    keep[:, pad] = neg
+    keep[:, pad+p+5] = e3
+    return out[keep].tobytes().decode('ascii')
+
+
+def _format_values(x, fmt, ncol):
+    """ Format `x` with `fmt` in lines of `ncol` values """
+    fe = _FMT_E.match(fmt)
+    if fe and 0 < int(fe.group(2)) <= 10:
+        width = fe.group(1)
+        out = _format_e(x, int(width) if width else 0, int(fe.group(2)), ncol)
+        if out is not None:
+            return out
+    fmt1 = '{:' + fmt + '}'
+    line = ' '.join([fmt1] * ncol) + '\n'
+    n = len(x) // ncol
+    out = (line * n).format(*x[:n * ncol].tolist())
+    if n * ncol < len(x):
+        out += ' '.join([fmt1] * (len(x) - n * ncol)).format(*x[n * ncol:].tolist()) + '\n'
+    return out
+
+
+def write_values(fh, values, fmt='.5e', ncol=6, chunk=2 ** 16):
+    """ Write values in lines of `ncol` values
+
+    The values are formatted in chunks, and written immediately, so the memory
+    usage is bounded by the size of the chunks.
+    Formats of the form ``[width].<precision>e`` are formatted by numpy (vectorized), other formats use `str.format`.
+
+    Parameters
+    ----------
+    fh : file
+       file handle (in text mode) to write to
+    values : iterable of numpy.ndarray
+       the values, e.g. slabs of a grid, the lines continue across the arrays
+    fmt : str, optional
+       format of each value
+    ncol : int, optional
+       number of values per line
+    chunk : int, optional
+       maximum number of values formatted at once
+    """
+    chunk = max(chunk // ncol, 1) * ncol
+    rest = np.empty([0])
+    for v in values:
+        v = np.concatenate((rest, np.asarray(v, np.float64).ravel()))
+        n = len(v) - len(v) % ncol
+        for i in range(0, n, chunk):
+            fh.write(_format_values(v[i:min(i + chunk, n)], fmt, ncol))
+        rest = v[n:]
+    if len(rest) > 0:
+        fh.write(_format_values(rest, fmt, ncol))
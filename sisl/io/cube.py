@@ -8,6 +8,7 @@ from sisl.io.sile import *
 # Import the geometry object
 from sisl import Geometry, Atom, SuperCell, Grid, SislError
 from sisl.unit import unit_convert
+from ._help import read_values, write_values
 
 __all__ = ['cubeSile']
 
@@ -115,7 +116,7 @@ class cubeSile(Sile):
            write only imaginary part of the grid, default to only writing the
            real part.
         buffersize : int, optional
-           size of the buffer while writing the data, (6144)
+           number of values formatted at a time while writing the data, (65536)
         """
         # Check that we can write to the file
         sile_raise_write(self)
@@ -125,32 +126,19 @@ class cubeSile(Sile):
         else:
             self.write_geometry(grid.geometry, size=grid.shape, *args, **kwargs)
 
-        buffersize = kwargs.get('buffersize', min(6144, grid.grid.size))
-        buffersize += buffersize % 6 # ensure multiple of 6
+        buffersize = kwargs.get('buffersize', 2 ** 16)
 
         # A CUBE file contains grid-points aligned like this:
         # for x
         #   for y
         #     for z
         #       write...
-        _fmt1 = '{:' + fmt + '} '
-        _fmt6 = (_fmt1 * 6)[:-1] + '\n'
-        __fmt = _fmt6 * (buffersize // 6)
-
+        # the values are formatted (and written) one x-slab at a time
         if imag:
-            for z in np.nditer(np.asarray(grid.grid.imag, order='C').reshape(-1), flags=['external_loop', 'buffered'],
-                               op_flags=[['readonly']], order='C', buffersize=buffersize):
-                if z.shape[0] != buffersize:
-                    s = z.shape[0]
-                    __fmt = _fmt6 * (s // 6) + _fmt1 * (s % 6) + '\n'
-                self._write(__fmt.format(*z.tolist()))
+            slabs = (g.imag.ravel() for g in grid.grid)
         else:
-            for z in np.nditer(np.asarray(grid.grid.real, order='C').reshape(-1), flags=['external_loop', 'buffered'],
-                               op_flags=[['readonly']], order='C', buffersize=buffersize):
-                if z.shape[0] != buffersize:
-                    s = z.shape[0]
-                    __fmt = _fmt6 * (s // 6) + _fmt1 * (s % 6) + '\n'
-                self._write(__fmt.format(*z.tolist()))
+            slabs = (g.real.ravel() for g in grid.grid)
+        write_values(self.fh, slabs, fmt, 6, chunk=buffersize)
 
         # Add a finishing line to ensure empty ending
         self._write('\n')
@@ -206,7 +194,7 @@ class cubeSile(Sile):
         return Geometry(xyz, atom, sc=sc)
 
     @sile_fh_open()
-    def read_grid(self, imag=None):
+    def read_grid(self, imag=None, dtype=np.float64):
         """ Returns `Grid` object from the CUBE file
 
         Parameters
@@ -214,6 +202,8 @@ class cubeSile(Sile):
         imag : str or Sile or Grid
             the imaginary part of the grid. If the geometries does not match
             an error will be raised.
+        dtype : numpy.dtype, optional
+            data-type of the (real) grid values, the values are directly converted to this data-type
         """
         if not imag is None:
             if not isinstance(imag, Grid):
@@ -243,17 +233,12 @@ class cubeSile(Sile):
             self.readline()
 
         if geom is None:
-            grid = Grid(ngrid, dtype=np.float64, sc=sc)
+            grid = Grid(ngrid, dtype=dtype, sc=sc)
         else:
-            grid = Grid(ngrid, dtype=np.float64, geometry=geom)
-        grid.grid.shape = (-1,)
-
-        # TODO check performance of this
-        # We are currently doing this to enable reading
-        #  1-column data and 6-column data.
-        lines = [item for sublist in self.fh.readlines() for item in sublist.split()]
-        grid.grid[:] = np.array(lines).astype(grid.dtype)
-        grid.grid.shape = ngrid
+            grid = Grid(ngrid, dtype=dtype, geometry=geom)
+
+        # The values are stored in C-order with any number of values per line
+        read_values(self.fh, grid.grid.size, out=grid.grid.reshape(-1))
 
         if imag is None:
             return grid
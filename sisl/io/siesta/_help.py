@@ -10,6 +10,8 @@ except Exception as e:
 
 __all__ = ['_csr_from_siesta', '_csr_from_sc_off']
 __all__ += ['_csr_to_siesta', '_csr_to_sc_off']
+__all__ += ['_FortranRecords', '_chunks']
+__all__ += ['_geom_sub', '_csr_sub_columns']
 
 
 def _csr_from_siesta(geom, csr):
@@ -55,3 +57,174 @@ def _csr_from(col_from, csr):
     # local csr matrix ordering
     col_to = _a.arangei(csr.shape[1])
     csr.translate_columns(col_from, col_to)
+
+
+def _chunks(n, chunk=2 ** 22):
+    """ Slices of at most `chunk` elements covering ``range(n)``, used to limit the size of temporary arrays """
+    for i in range(0, n, chunk):
+        yield slice(i, min(i + chunk, n))
+
+
+class _FortranRecords(object):
+    """ Sequential access to the records of a Fortran unformatted (sequential) file through a memory map
+
+    Records are copied straight from the memory map into the destination arrays, i.e. no
+    intermediate arrays are allocated for the data.
+    Only the default record markers (4 byte integers before and after each record) are supported.
+
+    Parameters
+    ----------
+    filename : str
+       the file to read
+    """
+
+    def __init__(self, filename):
+        self._file = filename
+        self._mm = np.memmap(filename, dtype=np.uint8, mode='r')
+        self._pos = 0
+
+    def _error(self):
+        raise SislError('{} is not a Fortran sequential unformatted file with 4 byte record markers, '
+                        'or the file is corrupt'.format(self._file))
+
+    def _marker(self, pos):
+        if pos + 4 > len(self._mm):
+            self._error()
+        return int(np.ndarray((), np.int32, self._mm, pos))
+
+    def _next(self):
+        """ Offset and size (in bytes) of the next record, and step past it """
+        pos = self._pos
+        n = self._marker(pos)
+        if n < 0 or self._marker(pos + 4 + n) != n:
+            self._error()
+        self._pos = pos + 8 + n
+        return pos + 4, n
+
+    def skip(self, n=1):
+        """ Skip `n` records """
+        for _ in range(n):
+            self._next()
+
+    def size(self):
+        """ Size (in bytes) of the next record """
+        return self._marker(self._pos)
+
+    def read(self, dtype):
+        """ Read the next record as a 1D array of `dtype` """
+        pos, n = self._next()
+        dtype = np.dtype(dtype)
+        return np.ndarray((n // dtype.itemsize,), dtype, self._mm, pos).copy()
+
+    def read_rows(self, ncol, dtype, out=None, rows=None):
+        """ Read ``len(ncol)`` consecutive records with ``ncol[i]`` elements of `dtype` into `out`
+
+        This is the layout of sparse matrices in Siesta files where each row is a record.
+
+        Parameters
+        ----------
+        ncol : numpy.ndarray
+           number of elements in each record
+        dtype : numpy.dtype
+           data-type of the elements in the file, the size must be 4 or 8 bytes
+        out : numpy.ndarray, optional
+           1D array (may be strided) of length ``ncol[rows].sum()`` where the elements are stored.
+           If not passed, the records are skipped.
+        rows : array_like of int, optional
+           only copy these records (in this order), defaults to all records
+        """
+        dtype = np.dtype(dtype)
+        isize = dtype.itemsize
+        ncol = np.asarray(ncol, dtype=np.int64)
+        size = ncol * isize
+        # offset of the records (at their leading marker)
+        pos = self._pos + np.insert(np.cumsum(size + 8), 0, 0)
+        if pos[-1] > len(self._mm):
+            self._error()
+        if rows is None:
+            rows = np.arange(len(ncol))
+        else:
+            rows = np.asarray(rows, dtype=np.int64).ravel()
+
+        # Check the record markers of the read records
+        idx = np.concatenate((pos[rows], pos[rows] + 4 + size[rows]))
+        marker = self._mm[idx.reshape(-1, 1) + np.arange(4)]
+        if not np.all(marker.copy().view(np.int32).ravel() == np.tile(size[rows], 2)):
+            self._error()
+
+        if out is not None and len(rows) > 0:
+            # The trailing and leading markers between two records occupy 8 // isize elements
+            # so a contiguous range of records may be viewed as an array of `dtype`
+            gap = 8 // isize
+            nptr = np.insert(np.cumsum(ncol[rows]), 0, 0)
+            # Limit the size of the mask
+            step = max(1, 2 ** 22 // max(1, ncol[rows].max()))
+            # Split into runs of consecutive records
+            run = np.insert(np.diff(rows) != 1, 0, True).nonzero()[0]
+            for i0, i1 in zip(run, np.append(run[1:], len(rows))):
+                for sl in _chunks(i1 - i0, step):
+                    r0, r1 = i0 + sl.start, i0 + sl.stop
+                    p0, p1 = rows[r0], rows[r1-1] + 1
+                    n = (pos[p1] - pos[p0] - 8) // isize
+                    data = np.ndarray((n,), dtype, self._mm, int(pos[p0] + 4))
+                    keep = np.ones(n, dtype=np.bool_)
+                    end = nptr[r0+1:r1] - nptr[r0] + gap * _a.arangei(r1 - r0 - 1)
+                    for i in range(gap):
+                        keep[end + i] = False
+                    np.compress(keep, data, out=out[nptr[r0]:nptr[r1]])
+
+        self._pos = int(pos[-1])
+
+
+def _geom_sub(geom, atoms=None, orbitals=None):
+    """ Geometry of a subset of `atoms` or `orbitals` of `geom` and the retained (unit-cell) orbitals
+
+    Atoms with a subset of their orbitals are replaced by the reduced atoms (see `Atom.sub`).
+    The orbitals are sorted, the atoms are retained in the passed order (as in `Geometry.sub`).
+    """
+    if atoms is not None and orbitals is not None:
+        raise ValueError('Only one of atoms or orbitals may be specified for reading a subset.')
+    if orbitals is None:
+        atoms = geom.sc2uc(atoms)
+        return geom.sub(atoms), geom.a2o(atoms, all=True)
+    orbitals = np.unique(geom.osc2uc(orbitals))
+    oa = geom.o2a(orbitals)
+    atoms = np.unique(oa)
+    atom = []
+    for ia in atoms:
+        a = geom.atoms[ia]
+        o = orbitals[oa == ia] - geom.firsto[ia]
+        if len(o) != a.no:
+            a = a.sub(o)
+            a.tag += 'sub'
+        atom.append(a)
+    return geom.__class__(geom.xyz[atoms, :], atom=atom, sc=geom.sc.copy()), orbitals
+
+
+def _csr_sub_columns(no, orbitals, ncol, col):
+    """ Remove and renumber the columns of the rows of a subset of `orbitals` (in the siesta supercell format)
+
+    Parameters
+    ----------
+    no : int
+       number of orbitals in the full unit-cell
+    orbitals : numpy.ndarray
+       the retained orbitals, i.e. the rows
+    ncol, col : numpy.ndarray
+       sparse pattern of the retained rows with columns in the full (supercell) orbital range
+
+    Returns
+    -------
+    ncol, col : the sparse pattern with columns in the range of the retained orbitals
+    keep : whether the elements are retained (elements with columns of removed orbitals are dropped)
+    """
+    pivot = _a.fulli(no, -1)
+    pivot[orbitals] = _a.arangei(len(orbitals))
+    isc, io = np.divmod(col, no)
+    col = pivot[io]
+    keep = col >= 0
+    col = (isc[keep] * len(orbitals) + col[keep]).astype(np.int32)
+    nkeep = np.insert(np.cumsum(keep), 0, 0)
+    ptr = np.insert(np.cumsum(ncol), 0, 0)
+    ncol = (nkeep[ptr[1:]] - nkeep[ptr[:-1]]).astype(np.int32)
+    return ncol, col, keep
@@ -32,6 +32,79 @@ __all__ += ['gridSileSiesta']
 __all__ += ['tsgfSileSiesta']
 
 
+def _spin_index(spin, nspin):
+    """ List of the spin components to read, `spin` may be ``None`` (all), an integer or a list of integers """
+    if spin is None:
+        return list(range(nspin))
+    if isinstance(spin, Integral):
+        spin = [spin]
+    spin = list(spin)
+    if nspin > 2 and spin != list(range(nspin)):
+        raise ValueError('Only collinear spin components can be read individually.')
+    if len(spin) == 0 or min(spin) < 0 or max(spin) >= nspin:
+        raise ValueError('Requested spin components {} are not in the file (nspin={}).'.format(spin, nspin))
+    return spin
+
+
+def _read_rows_spin(f, ncol, dtype, nspin, spin, D, rows=None):
+    """ Read `nspin` sparse matrix components (the rows are records) into the columns of `D` for the components in `spin` """
+    for s in range(nspin):
+        if s in spin:
+            f.read_rows(ncol, dtype, D[:, spin.index(s)], rows)
+        else:
+            f.read_rows(ncol, dtype)
+
+
+def _csr_set(csr, no, orbitals, ncol, col, D):
+    """ Store the sparse pattern and data in `csr`, for a subset of `orbitals` the columns are reduced to the subset """
+    if orbitals is not None:
+        ncol, col, keep = _csr_sub_columns(no, orbitals, ncol, col)
+        D = np.compress(keep, D, axis=0)
+    csr.ncol = ncol
+    csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
+    csr.col = col
+    csr._nnz = len(col)
+    csr._D = D
+
+
+def _read_dm(f, spin, edm=False):
+    """ Read the sparse pattern and the (energy) density matrix from a siesta.DM/TSDE file
+
+    The records are read directly into the final array which has an additional (zero)
+    column for the overlap matrix.
+
+    Returns
+    -------
+    nsc, ncol, col : number of supercells and the sparse pattern (0-based columns)
+    D : (nnz, len(spin) + 1)
+    spin : the read spin components
+    """
+    header = f.read(np.int32)
+    no, nspin = header[:2]
+    nsc = np.zeros(3, np.int32)
+    if len(header) == 5:
+        nsc[:] = header[2:]
+    ncol = f.read(np.int32)
+    nnz = ncol.sum()
+    spin = _spin_index(spin, nspin)
+
+    col = np.empty(nnz, np.int32)
+    f.read_rows(ncol, np.int32, col)
+    col -= 1
+
+    D = np.empty([nnz, len(spin) + 1], np.float64)
+    if edm:
+        # skip the density matrix
+        _read_rows_spin(f, ncol, np.float64, nspin, [], None)
+    _read_rows_spin(f, ncol, np.float64, nspin, spin, D)
+    if edm:
+        for i in range(len(spin)):
+            for sl in _chunks(nnz):
+                D[sl, i] *= Ry2eV
+    D[:, -1] = 0.
+    return nsc, ncol, col, D, spin
+
+
 class onlysSileSiesta(SileBinSiesta):
     """ Geometry and overlap matrix """
 
@@ -83,12 +156,12 @@ class onlysSileSiesta(SileBinSiesta):
 
         return geom
 
-    def read_overlap(self, **kwargs):
-        """ Returns the overlap matrix from the siesta.TSHS file """
+    def _read_geometry_sub(self, method, kwargs):
+        """ The geometry for reading a sparse matrix and the orbitals of the requested subset (or None) """
         tshs_g = self.read_geometry()
         geom = kwargs.get('geometry', tshs_g)
         if geom.na != tshs_g.na or geom.no != tshs_g.no:
-            raise SileError(self.__class__.__name__ + '.read_overlap could not use the '
+            raise SileError(self.__class__.__name__ + '.' + method + ' could not use the '
                             'passed geometry as the number of atoms or orbitals is '
                             'inconsistent with TSHS file.')
 
@@ -96,88 +169,149 @@ class onlysSileSiesta(SileBinSiesta):
         if np.any(geom.nsc != tshs_g.nsc):
             geom.set_nsc(tshs_g.nsc)
 
-        # read the sizes used...
-        sizes = _siesta.read_tshs_sizes(self.file)
-        isc = _siesta.read_tshs_cell(self.file, sizes[3])[2].T
-        no = sizes[2]
-        nnz = sizes[4]
-        ncol, col, dS = _siesta.read_tshs_s(self.file, no, nnz)
+        atoms = kwargs.get('atoms', None)
+        orbitals = kwargs.get('orbitals', None)
+        if atoms is None and orbitals is None:
+            return geom, geom, None
+        sub, orbitals = _geom_sub(geom, atoms, orbitals)
+        return geom, sub, orbitals
 
-        # Create the Hamiltonian container
-        S = SparseOrbitalBZ(geom, nnzpr=1)
+    def read_overlap(self, **kwargs):
+        """ Returns the overlap matrix from the siesta.TSHS file
 
-        # Create the new sparse matrix
-        S._csr.ncol = ncol.astype(np.int32, copy=False)
-        S._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        S._csr.col = col.astype(np.int32, copy=False) - 1
-        S._csr._nnz = len(col)
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the overlap matrix
+        atoms : array_like of int, optional
+           only read the rows (and columns) of these atoms, equivalent to ``S.sub(atoms)``
+        orbitals : array_like of int, optional
+           only read the rows (and columns) of these orbitals
+        """
+        geom, sub, orbitals = self._read_geometry_sub('read_overlap', kwargs)
+        ncol, col, D, _, isc, _ = self._read_csr([], True, orbitals)
 
-        S._csr._D = np.empty([nnz, 1], np.float64)
-        S._csr._D[:, 0] = dS[:]
+        # Create the Hamiltonian container
+        S = SparseOrbitalBZ(sub, nnzpr=1)
+        _csr_set(S._csr, geom.no, orbitals, ncol, col, D)
 
         # Convert to sisl supercell
         _csr_from_sc_off(S.geometry, isc, S._csr)
 
         return S
 
+    def _read_csr(self, spin, overlap=None, orbitals=None):
+        """ Read the sparse pattern, Hamiltonian and overlap matrix from the TSHS file
+
+        The records are read directly from the file into the final array, i.e. without
+        intermediate copies of the matrices.
+
+        Parameters
+        ----------
+        spin : list of int
+           the Hamiltonian components to read (they are shifted to the Fermi level and in eV)
+        overlap : bool, optional
+           whether the overlap matrix is stored in the last column of `D`, default to
+           only store it if it is not the identity matrix
+        orbitals : numpy.ndarray, optional
+           only read these rows (in this order), defaults to all rows
+
+        Returns
+        -------
+        ncol, col : the sparse pattern (0-based columns of the full matrix)
+        D : (nnz, len(spin) [+ 1]) the Hamiltonian components and the overlap matrix
+        S : the overlap matrix elements
+        isc : supercell indices of the siesta supercells
+        overlap : whether the overlap matrix is stored in `D`
+        """
+        f = _FortranRecords(self.file)
+        version = f.read(np.int32)
+        if len(version) != 1 or version[0] != 1:
+            raise SileError(str(self) + ' is not a TSHS file with version 1.')
+        na_u, no_u, no_s, nspin, nnz = f.read(np.int32)
+        f.skip(2) # nsc, cell and xa
+        Gamma, TSGamma, onlyS = f.read(np.int32) != 0
+        f.skip() # kscell and kdispl
+        Ef = f.read(np.float64)[0]
+        f.skip(2) # istep, ia1 and lasto
+
+        ncol_all = f.read(np.int32)
+        if orbitals is None:
+            ncol = ncol_all
+        else:
+            ncol = ncol_all[orbitals]
+            nnz = ncol.sum()
+        col = np.empty(nnz, np.int32)
+        f.read_rows(ncol_all, np.int32, col, orbitals)
+        col -= 1
+
+        # Read the overlap matrix to figure out if it is needed
+        S = np.empty(nnz, np.float64)
+        f.read_rows(ncol_all, np.float64, S, orbitals)
+        if overlap is None:
+            overlap = sum(np.abs(S[sl]).sum() for sl in _chunks(nnz)) != len(ncol)
+        D = np.empty([nnz, len(spin) + overlap], np.float64)
+        if overlap:
+            D[:, -1] = S
+            S = D[:, -1]
+
+        if onlyS:
+            D[:, :len(spin)] = 0.
+        else:
+            _read_rows_spin(f, ncol_all, np.float64, nspin, spin, D, orbitals)
+            for i, s in enumerate(spin):
+                for sl in _chunks(nnz):
+                    if s < 2:
+                        # Move to Ef = 0
+                        D[sl, i] -= Ef * S[sl]
+                    D[sl, i] *= Ry2eV
+        if Gamma:
+            isc = np.zeros([1, 3], np.int32)
+        else:
+            isc = f.read(np.int32).reshape(-1, 3)
+        return ncol, col, D, S, isc, overlap
+
 
 class tshsSileSiesta(onlysSileSiesta):
     """ Geometry, Hamiltonian and overlap matrix file """
 
     def read_hamiltonian(self, **kwargs):
-        """ Returns the electronic structure from the siesta.TSHS file """
-        tshs_g = self.read_geometry()
-        geom = kwargs.get('geometry', tshs_g)
-        if geom.na != tshs_g.na or geom.no != tshs_g.no:
-            raise SileError(self.__class__.__name__ + '.read_hamiltonian could not use the '
-                            'passed geometry as the number of atoms or orbitals is inconsistent '
-                            'with TSHS file.')
+        """ Returns the electronic structure from the siesta.TSHS file
 
-        # Ensure that the number of supercells is correct
-        if np.any(geom.nsc != tshs_g.nsc):
-            geom.set_nsc(tshs_g.nsc)
+        Only the requested subset of the matrix is read from the file, i.e. the memory
+        usage is proportional to the size of the subset.
 
-        # read the sizes used...
-        sizes = _siesta.read_tshs_sizes(self.file)
-        isc = _siesta.read_tshs_cell(self.file, sizes[3])[2].T
-        spin = sizes[0]
-        no = sizes[2]
-        nnz = sizes[4]
-        ncol, col, dH, dS = _siesta.read_tshs_hs(self.file, spin, no, nnz)
-
-        # Check whether it is an orthogonal basis set
-        orthogonal = np.abs(dS).sum() == geom.no
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the Hamiltonian
+        spin : int or list of int, optional
+           only read these spin components (only for unpolarized and polarized files)
+        atoms : array_like of int, optional
+           only read the rows (and columns) of these atoms, equivalent to ``H.sub(atoms)``
+        orbitals : array_like of int, optional
+           only read the rows (and columns) of these orbitals, atoms with a subset of their
+           orbitals are replaced by the reduced atoms (see `Atom.sub`)
+        """
+        geom, sub, orbitals = self._read_geometry_sub('read_hamiltonian', kwargs)
 
-        # Create the Hamiltonian container
-        H = Hamiltonian(geom, spin, nnzpr=1, orthogonal=orthogonal)
+        spin = _spin_index(kwargs.get('spin', None), _siesta.read_tshs_sizes(self.file)[0])
+        ncol, col, D, S, isc, overlap = self._read_csr(spin, orbitals=orbitals)
 
-        # Create the new sparse matrix
-        H._csr.ncol = ncol.astype(np.int32, copy=False)
-        H._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        H._csr.col = col.astype(np.int32, copy=False) - 1
-        H._csr._nnz = len(col)
+        # Find all indices where dS == 1 (before the columns are converted)
+        no = geom.no
+        for sl in _chunks(len(col)):
+            if np.any(col[sl][np.isclose(S[sl], 1.)] >= no):
+                raise SileError(self.__class__.__name__ + '.read_hamiltonian could not assert '
+                                'the supercell connections in the primary unit-cell.')
 
-        if orthogonal:
-            H._csr._D = np.empty([nnz, spin], np.float64)
-            H._csr._D[:, :] = dH[:, :]
-        else:
-            H._csr._D = np.empty([nnz, spin+1], np.float64)
-            H._csr._D[:, :spin] = dH[:, :]
-            H._csr._D[:, spin] = dS[:]
+        # Create the Hamiltonian container
+        H = Hamiltonian(sub, len(spin), nnzpr=1, orthogonal=not overlap)
+        _csr_set(H._csr, no, orbitals, ncol, col, D)
 
         # Convert to sisl supercell
         _csr_from_sc_off(H.geometry, isc, H._csr)
 
-        # Find all indices where dS == 1 (remember col is in fortran indices)
-        idx = col[np.isclose(dS, 1.).nonzero()[0]]
-        if np.any(idx > no):
-            print('Number of orbitals: {}'.format(no))
-            print(idx)
-            raise SileError(self.__class__.__name__ + '.read_hamiltonian could not assert '
-                            'the supercell connections in the primary unit-cell.')
-
         return H
 
     def write_hamiltonian(self, H, **kwargs):
@@ -232,9 +366,8 @@ class dmSileSiesta(SileBinSiesta):
     def read_density_matrix(self, **kwargs):
         """ Returns the density matrix from the siesta.DM file """
 
-        # Now read the sizes used...
-        spin, no, nsc, nnz = _siesta.read_dm_sizes(self.file)
-        ncol, col, dDM = _siesta.read_dm(self.file, spin, no, nsc, nnz)
+        nsc, ncol, col, D, spin = _read_dm(_FortranRecords(self.file), kwargs.get('spin', None))
+        no = len(ncol)
 
         # Try and immediately attach a geometry
         geom = kwargs.get('geometry', kwargs.get('geom', None))
@@ -255,22 +388,18 @@ class dmSileSiesta(SileBinSiesta):
                             'inconsistent with DM file.')
 
         # Create the density matrix container
-        DM = DensityMatrix(geom, spin, nnzpr=1, dtype=np.float64, orthogonal=False)
+        DM = DensityMatrix(geom, len(spin), nnzpr=1, dtype=np.float64, orthogonal=False)
 
         # Create the new sparse matrix
-        DM._csr.ncol = ncol.astype(np.int32, copy=False)
+        DM._csr.ncol = ncol
         DM._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        DM._csr.col = col.astype(np.int32, copy=False) - 1
+        DM._csr.col = col
         DM._csr._nnz = len(col)
-
-        DM._csr._D = np.empty([nnz, spin+1], np.float64)
-        DM._csr._D[:, :spin] = dDM[:, :]
         # DM file does not contain overlap matrix... so neglect it for now.
-        DM._csr._D[:, spin] = 0.
+        DM._csr._D = D
 
         # Convert the supercells to sisl supercells
-        if nsc[0] != 0 or geom.no_s >= col.max():
+        if nsc[0] != 0 or geom.no_s > col.max():
             _csr_from_siesta(geom, DM._csr)
         else:
             warn(str(self) + '.read_density_matrix may result in a wrong sparse pattern!')
@@ -308,9 +437,8 @@ class tsdeSileSiesta(dmSileSiesta):
     def read_energy_density_matrix(self, **kwargs):
         """ Returns the energy density matrix from the siesta.DM file """
 
-        # Now read the sizes used...
-        spin, no, nsc, nnz = _siesta.read_tsde_sizes(self.file)
-        ncol, col, dEDM = _siesta.read_tsde_edm(self.file, spin, no, nsc, nnz)
+        nsc, ncol, col, D, spin = _read_dm(_FortranRecords(self.file), kwargs.get('spin', None), True)
+        no = len(ncol)
 
         # Try and immediately attach a geometry
         geom = kwargs.get('geometry', kwargs.get('geom', None))
@@ -331,22 +459,18 @@ class tsdeSileSiesta(dmSileSiesta):
                             'is inconsistent with DM file.')
 
         # Create the energy density matrix container
-        EDM = EnergyDensityMatrix(geom, spin, nnzpr=1, dtype=np.float64, orthogonal=False)
+        EDM = EnergyDensityMatrix(geom, len(spin), nnzpr=1, dtype=np.float64, orthogonal=False)
 
         # Create the new sparse matrix
-        EDM._csr.ncol = ncol.astype(np.int32, copy=False)
+        EDM._csr.ncol = ncol
         EDM._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        EDM._csr.col = col.astype(np.int32, copy=False) - 1
+        EDM._csr.col = col
         EDM._csr._nnz = len(col)
-
-        EDM._csr._D = np.empty([nnz, spin+1], np.float64)
-        EDM._csr._D[:, :spin] = dEDM[:, :]
         # EDM file does not contain overlap matrix... so neglect it for now.
-        EDM._csr._D[:, spin] = 0.
+        EDM._csr._D = D
 
         # Convert the supercells to sisl supercells
-        if nsc[0] != 0 or geom.no_s >= col.max():
+        if nsc[0] != 0 or geom.no_s > col.max():
             _csr_from_siesta(geom, EDM._csr)
         else:
             warn(str(self) + '.read_energy_density_matrix may '
@@ -358,18 +482,38 @@ class tsdeSileSiesta(dmSileSiesta):
 class hsxSileSiesta(SileBinSiesta):
     """ Hamiltonian and overlap matrix file """
 
+    @staticmethod
+    def _read_pattern(f):
+        """ Read the sizes and the sparse pattern (0-based columns) from the HSX records """
+        no, no_s, nspin, nnz = f.read(np.int32)
+        Gamma = f.read(np.int32)[0] != 0
+        if not Gamma:
+            f.skip() # indxuo
+        ncol = f.read(np.int32)
+        col = np.empty(nnz, np.int32)
+        f.read_rows(ncol, np.int32, col)
+        col -= 1
+        return no, no_s, nspin, Gamma, ncol, col
+
     def read_hamiltonian(self, **kwargs):
         """ Returns the electronic structure from the siesta.TSHS file """
 
-        # Now read the sizes used...
-        Gamma, spin, no, no_s, nnz = _siesta.read_hsx_sizes(self.file)
-        ncol, col, dH, dS, dxij = _siesta.read_hsx_hsx(self.file, Gamma, spin, no, no_s, nnz)
+        f = _FortranRecords(self.file)
+        no, no_s, nspin, Gamma, ncol, col = self._read_pattern(f)
+        spin = _spin_index(kwargs.get('spin', None), nspin)
+
+        D = np.empty([len(col), len(spin) + 1], np.float32)
+        _read_rows_spin(f, ncol, np.float32, nspin, spin, D)
+        for i in range(len(spin)):
+            for sl in _chunks(len(col)):
+                D[sl, i] *= Ry2eV
+        f.read_rows(ncol, np.float32, D[:, -1])
 
         # Try and immediately attach a geometry
         geom = kwargs.get('geometry', kwargs.get('geom', None))
         if geom is None:
             # We have *no* clue about the
-            if np.allclose(dxij, 0.):
+            if Gamma:
                 # We truly, have no clue,
                 # Just generate a boxed system
                 xyz = [[x, 0, 0] for x in range(no)]
@@ -384,18 +528,14 @@ class hsxSileSiesta(SileBinSiesta):
                             'inconsistent with HSX file.')
 
         # Create the Hamiltonian container
-        H = Hamiltonian(geom, spin, nnzpr=1, dtype=np.float32, orthogonal=False)
+        H = Hamiltonian(geom, len(spin), nnzpr=1, dtype=np.float32, orthogonal=False)
 
         # Create the new sparse matrix
-        H._csr.ncol = ncol.astype(np.int32, copy=False)
+        H._csr.ncol = ncol
         H._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        H._csr.col = col.astype(np.int32, copy=False) - 1
+        H._csr.col = col
         H._csr._nnz = len(col)
-
-        H._csr._D = np.empty([nnz, spin+1], np.float32)
-        H._csr._D[:, :spin] = dH[:, :]
-        H._csr._D[:, spin] = dS[:]
+        H._csr._D = D
 
         # Convert the supercells to sisl supercells
         if no_s // no == np.product(geom.nsc):
@@ -405,9 +545,11 @@ class hsxSileSiesta(SileBinSiesta):
 
     def read_overlap(self, **kwargs):
         """ Returns the overlap matrix from the siesta.HSX file """
-        # Now read the sizes used...
-        Gamma, spin, no, no_s, nnz = _siesta.read_hsx_sizes(self.file)
-        ncol, col, dS = _siesta.read_hsx_s(self.file, Gamma, spin, no, no_s, nnz)
+        f = _FortranRecords(self.file)
+        no, no_s, nspin, Gamma, ncol, col = self._read_pattern(f)
+        f.skip(nspin * no)
+        D = np.empty([len(col), 1], np.float32)
+        f.read_rows(ncol, np.float32, D[:, 0])
 
         geom = kwargs.get('geometry', kwargs.get('geom', None))
         if geom is None:
@@ -421,14 +563,11 @@ class hsxSileSiesta(SileBinSiesta):
         S = SparseOrbitalBZ(geom, nnzpr=1)
 
         # Create the new sparse matrix
-        S._csr.ncol = ncol.astype(np.int32, copy=False)
+        S._csr.ncol = ncol
         S._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        S._csr.col = col.astype(np.int32, copy=False) - 1
+        S._csr.col = col
         S._csr._nnz = len(col)
-
-        S._csr._D = np.empty([nnz, 1], np.float32)
-        S._csr._D[:, 0] = dS[:]
+        S._csr._D = D
 
         # Convert the supercells to sisl supercells
         if no_s // no == np.product(geom.nsc):
@@ -2,6 +2,8 @@ from __future__ import print_function, division
 
 import warnings
 from datetime import datetime
+from os import stat
+from os.path import isfile, join, abspath
 import numpy as np
 
 from sisl import constant
@@ -42,6 +44,136 @@ _LOGICAL = _LOGICAL_FALSE + _LOGICAL_TRUE
 
 Bohr2Ang = unit_convert('Bohr', 'Ang')
 
+# Parsed fdf files and piped block files, the entries are
+#   key -> (files, stamp, content)
+# where stamp is the modification time and size of all files the content depends on
+_FDF_CACHE = {}
+
+
+def _stamp(files):
+    """ Modification time and size of `files` (`None` for non-existing files) """
+    stamp = []
+    for f in files:
+        try:
+            st = stat(f)
+            stamp.append((st.st_mtime, st.st_size))
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+
+def _cached(key, parse):
+    """ Return the cached content for `key`, `parse` is only called if any of the files have changed
+
+    Parameters
+    ----------
+    key : tuple
+       key of the content in the cache
+    parse : callable
+       returns a tuple of the content and the list of files the content is read from
+    """
+    if key in _FDF_CACHE:
+        files, stamp, content = _FDF_CACHE[key]
+        if _stamp(files) == stamp:
+            return content
+    content, files = parse()
+    _FDF_CACHE[key] = (files, _stamp(files), content)
+    return content
+
+
+def _tolabel(label):
+    """ fdf labels are case-insensitive and ignore ``_``, ``-`` and ``.`` """
+    return label.lower().replace('_', '').replace('-', '').replace('.', '')
+
+
+def _read_block_file(filename, comment):
+    """ Lines of a file piped into a block, removing any empty and/or comment lines """
+    with open(filename, 'r') as fh:
+        lines = [l.strip() for l in fh]
+    return [l for l in lines if len(l) > 0 and not starts_with_list(l, comment)], [filename]
+
+
+def _fdf_index(filename, directory, comment):
+    """ Tokenize the fdf file `filename` and all its included files in a single pass
+
+    Included and piped files are relative to `directory`.
+
+    Returns
+    -------
+    (index, includes) : the index maps the (reduced) labels to a list of all occurences ``(kind, value, file)``
+       in the order they are read and `includes` is the list of included (and piped) files
+    files : list of all read files
+    """
+    index = {}
+    includes = []
+    files = [filename]
+
+    def add(label, kind, value, f):
+        index.setdefault(label, []).append((kind, value, f))
+
+    def include(f):
+        f = join(directory, f)
+        if f not in includes:
+            includes.append(f)
+        return f
+
+    def scan(filename):
+        with open(filename, 'r') as fh:
+            lines = fh.readlines()
+
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            i += 1
+            if starts_with_list(line, comment):
+                continue
+            ls = line.split('#')[0].split()
+            if len(ls) == 0:
+                continue
+            lsl = list(map(_tolabel, ls))
+
+            if '<' in lsl:
+                idx = lsl.index('<')
+                f = include(ls[idx+1])
+                if lsl[0] == '%block':
+                    # %block Label < file
+                    add(lsl[1], 'pipe-block', f, filename)
+                else:
+                    # Label1 Label2 < other.fdf
+                    for label in lsl[:idx]:
+                        add(label, 'pipe', f, filename)
+
+            elif lsl[0] == '%block':
+                block = []
+                while i < len(lines):
+                    l = lines[i]
+                    i += 1
+                    if starts_with_list(l, comment):
+                        continue
+                    l = l.strip()
+                    if _tolabel(l).startswith('%endblock'):
+                        break
+                    if len(l) > 0:
+                        block.append(l)
+                add(lsl[1] if len(lsl) > 1 else '', 'block', block, filename)
+
+            elif lsl[0] == '%include':
+                f = include(ls[1])
+                if f in files:
+                    # already read, circular includes
+                    continue
+                if isfile(f):
+                    files.append(f)
+                    scan(f)
+                else:
+                    warn('fdfSileSiesta is trying to include file: {} but the file seems not to exist? Will disregard file!'.format(f))
+
+            else:
+                add(lsl[0], 'value', ' '.join(ls[1:]).strip(), filename)
+
+    scan(filename)
+    return (index, includes), files
+
 
 class fdfSileSiesta(SileSiesta):
     """ FDF-input file
@@ -49,6 +181,9 @@ class fdfSileSiesta(SileSiesta):
     By supplying base you can reference files in other directories.
     By default the ``base`` is the directory given in the file name.
 
+    All labels in the fdf file (and included files) are indexed in a single pass, the index is
+    re-used for all look-ups until one of the files are modified.
+
     Parameters
     ----------
     filename: str
@@ -72,70 +207,46 @@ class fdfSileSiesta(SileSiesta):
         """ Return the current file name (without the directory prefix) """
         return self._file
 
-    def _setup(self, *args, **kwargs):
-        """ Setup the `fdfSileSiesta` after initialization """
+    def _index(self):
+        """ Label index and included files of the fdf file, see `_fdf_index` """
+        return _cached(('fdf', abspath(self._file), abspath(self._directory)),
+                       lambda: _fdf_index(self._file, self._directory, self._comment))
 
-        # List of parent file-handles used while reading
-        # This is because fdf enables inclusion of other files
-        self._parent_fh = []
+    def includes(self):
+        """ Return a list of all files that are *included* or otherwise necessary for reading the fdf file """
+        return list(self._index()[1])
 
-    def _pushfile(self, f):
-        if isfile(self.dir_file(f)):
-            self._parent_fh.append(self.fh)
-            self.fh = open(self.dir_file(f), self._mode)
-        else:
-            warn(str(self) + ' is trying to include file: {} but the file seems not to exist? Will disregard file!'.format(f))
+    def _label(self, label):
+        """ Find the first occurence of a label, and the file it is defined in
 
-    def _popfile(self):
-        if len(self._parent_fh) > 0:
-            self.fh.close()
-            self.fh = self._parent_fh.pop()
-            return True
-        return False
-
-    def _seek(self):
-        """ Closes all files, and starts over from beginning """
-        try:
-            while self._popfile():
-                pass
-            self.fh.seek(0)
-        except:
-            pass
+        This will take care of blocks, labels and piped in labels
 
-    @sile_fh_open()
-    def includes(self):
-        """ Return a list of all files that are *included* or otherwise necessary for reading the fdf file """
-        self._seek()
-        # In FDF files, %include marks files that progress
-        # down in a tree structure
-        def add(f):
-            f = self.dir_file(f)
-            if f not in includes:
-                includes.append(f)
-        # List of includes
-        includes = []
-
-        l = self.readline()
-        while l != '':
-            ls = l.split()
-            if '%include' == ls[0].lower():
-                add(ls[1])
-                self._pushfile(ls[1])
-            elif '<' in ls:
-                # TODO, in principle the < could contain
-                # include if this line is not a %block.
-                add(ls[ls.index('<')+1])
-            l = self.readline()
-            while l == '':
-                # last line of file
-                if self._popfile():
-                    l = self.readline()
-                else:
-                    break
+        Parameters
+        ----------
+        label : str
+           label to find in the fdf file
 
-        return includes
+        Returns
+        -------
+        value : str or list of str or None
+           the value of the label (`None` if the label is not found)
+        file : str or None
+           the file containing the label
+        """
+        for kind, value, f in self._index()[0].get(_tolabel(label), []):
+            if kind == 'value':
+                return value, f
+            elif kind == 'block':
+                return list(value), f
+            elif kind == 'pipe-block':
+                # %block Label < file
+                return list(_cached(('block', abspath(value)), lambda: _read_block_file(value, self._comment))), f
+            # Label1 Label2 < other.fdf, the label may not be present in other.fdf
+            piped = fdfSileSiesta(value, base=self._directory)._read_label(label)
+            if piped is not None:
+                return piped, f
+        return None, None
 
-    @sile_fh_open()
     def _read_label(self, label):
         """ Try and read the first occurence of a key
 
@@ -146,88 +257,7 @@ class fdfSileSiesta(SileSiesta):
         label : str
            label to find in the fdf file
         """
-        self._seek()
-        def tolabel(label):
-            return label.lower().replace('_', '').replace('-', '').replace('.', '')
-        labell = tolabel(label)
-
-        def valid_line(line):
-            ls = line.strip()
-            if len(ls) == 0:
-                return False
-            return not (ls[0] in self._comment)
-
-        def process_line(line):
-            # Split line by spaces
-            ls = line.split()
-            if len(ls) == 0:
-                return None
-
-            # Make a lower equivalent of ls
-            lsl = list(map(tolabel, ls))
-
-            # Check if there is a pipe in the line
-            if '<' in lsl:
-                idx = lsl.index('<')
-                # Now there are two cases
-
-                # 1. It is a block, in which case
-                #    the full block is piped into the label
-                #    %block Label < file
-                if lsl[0] == '%block' and lsl[1] == labell:
-                    # Correct line found
-                    # Read the file content, removing any empty and/or comment lines
-                    lines = open(self.dir_file(ls[3]), 'r').readlines()
-                    return [l.strip() for l in lines if valid_line(l)]
-
-                # 2. There are labels that should be read from a subsequent file
-                #    Label1 Label2 < other.fdf
-                if labell in lsl[:idx]:
-                    # Valid line, read key from other.fdf
-                    return fdfSileSiesta(self.dir_file(ls[idx+1]), base=self._directory)._read_label(label)
-
-                # It is not in this line, either key is
-                # on the RHS of <, or the key could be "block". Say.
-                return None
-
-            # The last case is if the label is the first word on the line
-            # In that case we have found what we are looking for
-            if lsl[0] == labell:
-                return (' '.join(ls[1:])).strip()
-
-            elif lsl[0] == '%block':
-                if lsl[1] == labell:
-                    # Read in the block content
-                    lines = []
-
-                    # Now read lines
-                    l = self.readline().strip()
-                    while not tolabel(l).startswith('%endblock'):
-                        if len(l) > 0:
-                            lines.append(l)
-                        l = self.readline().strip()
-                    return lines
-
-            elif lsl[0] == '%include':
-
-                # We have to open a new file
-                self._pushfile(ls[1])
-
-            return None
-
-        # Perform actual reading of line
-        l = self.readline().split('#')[0]
-        if len(l) == 0:
-            return None
-        l = process_line(l)
-        while l is None:
-            l = self.readline().split('#')[0]
-            if len(l) == 0:
-                if not self._popfile():
-                    return None
-            l = process_line(l)
-
-        return l
+        return self._label(label)[0]
 
     @classmethod
     def _type(cls, value):
@@ -277,7 +307,6 @@ class fdfSileSiesta(SileSiesta):
 
         return 'n'
 
-    @sile_fh_open()
     def type(self, label):
         """ Return the type of the fdf-keyword
 
@@ -286,10 +315,8 @@ class fdfSileSiesta(SileSiesta):
         label : str
             the label to look-up
         """
-        self._seek()
         return self._type(self._read_label(label))
 
-    @sile_fh_open()
     def get(self, label, default=None, unit=None, with_unit=False):
         """ Retrieve fdf-keyword from the file
 
@@ -395,16 +422,12 @@ class fdfSileSiesta(SileSiesta):
         top_file = self.file
 
         # 1. find the old value, and thus the file in which it is found
-        with self:
-            try:
-                self.get(key)
-                # Get the file of the containing data
-                top_file = self.fh.name
-            except:
-                pass
-
-        # Ensure that all files are closed
-        self._seek()
+        try:
+            f = self._label(key)[1]
+            if f is not None:
+                top_file = f
+        except:
+            pass
 
         # Now we should re-read and edit the file
         lines = open(top_file, 'r').readlines()
@@ -434,6 +457,9 @@ class fdfSileSiesta(SileSiesta):
                 else:
                     fh.write(line)
 
+        # The file may be changed within the time resolution of the file system
+        _FDF_CACHE.clear()
+
     @staticmethod
     def print(key, value):
         """ Return a string which is pretty-printing the key+value """
@@ -147,6 +147,12 @@ class ncSileSiesta(SileCDFSiesta):
         return _a.arrayd(self._value('fa')) * Ry2eV / Bohr2Ang
 
     def _read_class_spin(self, cls, **kwargs):
+        """ Create the sparse matrix `cls` with the sparse pattern (and overlap) in the file
+
+        Returns the sparse matrix and a function which reads the elements of a variable
+        in the SPARSE group (with optional leading indices) for the retained elements.
+        Passing `atoms` or `orbitals` only reads these rows (and columns) from the file.
+        """
         # Get the default spin channel
         spin = len(self._dimension('spin'))
 
@@ -156,20 +162,47 @@ class ncSileSiesta(SileCDFSiesta):
         # Populate the things
         sp = self._crt_grp(self, 'SPARSE')
 
+        ncol = np.array(sp.variables['n_col'][:], np.int32)
+        ptr = np.insert(np.cumsum(ncol, dtype=np.int64), 0, 0)
+
+        atoms = kwargs.get('atoms', None)
+        orbitals = kwargs.get('orbitals', None)
+        if atoms is None and orbitals is None:
+            sub = geom
+            ranges = [slice(None)]
+        else:
+            sub, orbitals = _geom_sub(geom, atoms, orbitals)
+            ncol = ncol[orbitals]
+            # Element ranges of consecutive rows
+            run = np.insert(np.diff(orbitals) != 1, 0, True).nonzero()[0]
+            ranges = [slice(ptr[orbitals[i0]], ptr[orbitals[i1-1] + 1])
+                      for i0, i1 in zip(run, np.append(run[1:], len(orbitals)))]
+
+        def read(name, *index):
+            var = sp.variables[name]
+            return np.concatenate([var[index + (r,)] for r in ranges])
+
+        col = read('list_col').astype(np.int32) - 1
+        if orbitals is not None:
+            ncol, col, keep = _csr_sub_columns(geom.no, orbitals, ncol, col)
+            _read = read
+            def read(name, *index):
+                return _read(name, *index)[keep]
+
         # Since we may read in an orthogonal basis (stored in a Siesta compliant file)
         # we can check whether it is orthogonal by checking the sum of the absolute S
         # I.e. whether only diagonal elements are present.
-        S = np.array(sp.variables['S'][:], np.float64)
-        orthogonal = np.abs(S).sum() == geom.no
+        S = np.array(read('S'), np.float64)
+        orthogonal = np.abs(S).sum() == sub.no
 
         # Now create the tight-binding stuff (we re-create the
         # array, hence just allocate the smallest amount possible)
-        C = cls(geom, spin, nnzpr=1, orthogonal=orthogonal)
+        C = cls(sub, spin, nnzpr=1, orthogonal=orthogonal)
 
-        C._csr.ncol = np.array(sp.variables['n_col'][:], np.int32)
+        C._csr.ncol = ncol
         # Update maximum number of connections (in case future stuff happens)
-        C._csr.ptr = np.insert(np.cumsum(C._csr.ncol, dtype=np.int32), 0, 0)
-        C._csr.col = np.array(sp.variables['list_col'][:], np.int32) - 1
+        C._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
+        C._csr.col = col
 
         # Copy information over
         C._csr._nnz = len(C._csr.col)
@@ -182,22 +215,31 @@ class ncSileSiesta(SileCDFSiesta):
         # Convert from isc to sisl isc
         _csr_from_sc_off(C.geometry, sp.variables['isc_off'][:, :], C._csr)
 
-        return C
+        return C, read
 
     def read_overlap(self, **kwargs):
         """ Returns a overlap matrix from the underlying NetCDF file """
         raise NotImplementedError('Currently not implemented')
 
     def read_hamiltonian(self, **kwargs):
-        """ Returns a Hamiltonian from the underlying NetCDF file """
-        H = self._read_class_spin(Hamiltonian, **kwargs)
+        """ Returns a Hamiltonian from the underlying NetCDF file
+
+        Parameters
+        ----------
+        atoms : array_like of int, optional
+           only read the rows (and columns) of these atoms, equivalent to ``H.sub(atoms)``
+        orbitals : array_like of int, optional
+           only read the rows (and columns) of these orbitals, atoms with a subset of their
+           orbitals are replaced by the reduced atoms (see `Atom.sub`)
+        """
+        H, read = self._read_class_spin(Hamiltonian, **kwargs)
 
         sp = self._crt_grp(self, 'SPARSE')
         if sp.variables['H'].unit != 'Ry':
             raise SileError(self.__class__.__name__ + '.read_hamiltonian requires the stored matrix to be in Ry!')
 
         for i in range(len(H.spin)):
-            H._csr._D[:, i] = sp.variables['H'][i, :] * Ry2eV
+            H._csr._D[:, i] = read('H', i) * Ry2eV
 
         # Shift to the Fermi-level
         Ef = - self._value('Ef')[:] * Ry2eV
@@ -211,29 +253,28 @@ class ncSileSiesta(SileCDFSiesta):
         This assumes that the dynamical matrix is stored in the field "H" as would the
         Hamiltonian. This is counter-intuitive but is required when using PHtrans.
         """
-        D = self._read_class_spin(DynamicalMatrix, **kwargs)
+        D, read = self._read_class_spin(DynamicalMatrix, **kwargs)
 
         sp = self._crt_grp(self, 'SPARSE')
         if sp.variables['H'].unit != 'Ry**2':
             raise SileError(self.__class__.__name__ + '.read_dynamical_matrix requires the stored matrix to be in Ry**2!')
-        D._csr._D[:, 0] = sp.variables['H'][0, :] * Ry2eV ** 2
+        D._csr._D[:, 0] = read('H', 0) * Ry2eV ** 2
 
         return D
 
     def read_density_matrix(self, **kwargs):
         """ Returns a density matrix from the underlying NetCDF file """
         # This also adds the spin matrix
-        DM = self._read_class_spin(DensityMatrix, **kwargs)
+        DM, read = self._read_class_spin(DensityMatrix, **kwargs)
 
-        sp = self._crt_grp(self, 'SPARSE')
         for i in range(len(DM.spin)):
-            DM._csr._D[:, i] = sp.variables['DM'][i, :]
+            DM._csr._D[:, i] = read('DM', i)
 
         return DM
 
     def read_energy_density_matrix(self, **kwargs):
         """ Returns energy density matrix from the underlying NetCDF file """
-        EDM = self._read_class_spin(EnergyDensityMatrix, **kwargs)
+        EDM, read = self._read_class_spin(EnergyDensityMatrix, **kwargs)
 
         # Shift to the Fermi-level
         Ef = self._value('Ef')[:] * Ry2eV
@@ -242,9 +283,9 @@ class ncSileSiesta(SileCDFSiesta):
 
         sp = self._crt_grp(self, 'SPARSE')
         for i in range(len(EDM.spin)):
-            EDM._csr._D[:, i] = sp.variables['EDM'][i, :] * Ry2eV
+            EDM._csr._D[:, i] = read('EDM', i) * Ry2eV
             if i < 2 and 'DM' in sp.variables:
-                EDM._csr._D[:, i] -= sp.variables['DM'][i, :] * Ef[i]
+                EDM._csr._D[:, i] -= read('DM', i) * Ef[i]
 
         return EDM
 
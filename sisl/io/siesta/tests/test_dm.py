@@ -21,3 +21,32 @@ def test_si_pdos_kgrid_dm(sisl_files):
 
     assert DM1._csr.spsame(DM2._csr)
     assert np.allclose(DM1._csr._D, DM2._csr._D)
+
+
+def test_dm_spin_subset(sisl_tmp):
+    g = sisl.geom.graphene()
+    DM = sisl.DensityMatrix(g, spin=sisl.Spin('P'))
+    DM.construct([(0.1, 1.44), ([1., 0.5], [0.2, 0.1])])
+    f = sisl_tmp('tmp.DM', _dir)
+    DM.write(f)
+    DM1 = sisl.get_sile(f).read_density_matrix(geometry=g)
+    DM2 = sisl.get_sile(f).read_density_matrix(geometry=g, spin=1)
+    assert DM1._csr.spsame(DM2._csr)
+    assert len(DM2.spin) == 1
+    DM1.finalize()
+    DM2.finalize()
+    assert np.allclose(DM1._csr._D[:, 1], DM2._csr._D[:, 0])
+
+
+@pytest.mark.xfail(raises=sisl.SislError)
+def test_dm_truncated(sisl_tmp):
+    g = sisl.geom.graphene()
+    DM = sisl.DensityMatrix(g)
+    DM.construct([(0.1, 1.44), (1., 0.2)])
+    f = sisl_tmp('tmp.DM', _dir)
+    DM.write(f)
+    with open(f, 'rb') as fh:
+        data = fh.read()
+    with open(f, 'wb') as fh:
+        fh.write(data[:-20])
+    sisl.get_sile(f).read_density_matrix(geometry=g)
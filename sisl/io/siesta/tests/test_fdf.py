@@ -267,6 +267,35 @@ def test_include(sisl_tmp):
     assert fdf.get('Hello') == [l.replace('\n', '').strip() for l in ll]
 
 
+def test_include_changed(sisl_tmp):
+    f = sisl_tmp('file.fdf', _dir)
+    with open(f, 'w') as fh:
+        fh.write('Flag1 date\n')
+        fh.write('\n')
+        fh.write('%block Block\n')
+        fh.write(' Flag2 block\n')
+        fh.write('%endblock Block\n')
+        fh.write('%include file2.fdf\n')
+
+    file2 = sisl_tmp('file2.fdf', _dir)
+    with open(file2, 'w') as fh:
+        fh.write('Flag2 date2\n')
+
+    fdf = fdfSileSiesta(f, base=sisl_tmp.getbase())
+    assert fdf.includes() == [file2]
+    assert fdf.get('Block') == ['Flag2 block']
+    assert fdf.get('Flag2') == 'date2'
+    assert fdf.type('Flag2') == 'n'
+
+    # Changes to any included file are picked up
+    with open(file2, 'w') as fh:
+        fh.write('Flag2 1.\n')
+        fh.write('Flag3 2 eV\n')
+    assert fdf.get('Flag2') == 1.
+    assert fdf.get('Flag3') == 2.
+    assert fdfSileSiesta(f, base=sisl_tmp.getbase()).get('Flag3', unit='Ry') == pytest.approx(unit_convert('eV', 'Ry') * 2)
+
+
 def test_xv_preference(sisl_tmp):
     g = geom.graphene()
     g.write(sisl_tmp('file.fdf', _dir))
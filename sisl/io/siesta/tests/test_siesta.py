@@ -45,6 +45,21 @@ def test_nc2(sisl_tmp, sisl_system):
     assert sisl_system.g.atom.equal(ntb.atom, R=False)
 
 
+def test_nc_sub(sisl_tmp, sisl_system):
+    f = sisl_tmp('grS.nc', _dir)
+    tb = Hamiltonian(sisl_system.gtb.tile(2, 0), orthogonal=False)
+    tb.construct([sisl_system.R, sisl_system.tS])
+    tb.write(ncSileSiesta(f, 'w'))
+
+    for atoms in [[1, 2], [3, 0]]:
+        sub = tb.sub(atoms)
+        ntb = ncSileSiesta(f).read_hamiltonian(atoms=atoms)
+        assert np.allclose(sub.xyz, ntb.xyz)
+        k = [0.1, 0.2, 0]
+        assert np.allclose(sub.Hk(k).toarray(), ntb.Hk(k).toarray())
+        assert np.allclose(sub.Sk(k).toarray(), ntb.Sk(k).toarray())
+
+
 def test_nc_dynamical_matrix(sisl_tmp, sisl_system):
     f = sisl_tmp('grS.nc', _dir)
     dm = DynamicalMatrix(sisl_system.gtb)
@@ -31,3 +31,75 @@ def test_si_pdos_kgrid_tshs_overlap(sisl_files, sisl_tmp):
     HS.finalize()
     S.finalize()
     assert np.allclose(HS._csr._D[:, HS.S_idx], S._csr._D[:, 0])
+
+
+@pytest.mark.parametrize("orthogonal", [True, False])
+def test_tshs_spin_subset(sisl_tmp, orthogonal):
+    g = sisl.geom.graphene()
+    H = sisl.Hamiltonian(g, spin=sisl.Spin('P'), orthogonal=orthogonal)
+    if orthogonal:
+        H.construct([(0.1, 1.44), ([0.1, -0.1], [-2.7, -2.6])])
+    else:
+        H.construct([(0.1, 1.44), ([0.1, -0.1, 1.], [-2.7, -2.6, 0.1])])
+    f = sisl_tmp('tmp.TSHS', _dir)
+    H.write(f)
+    HS = sisl.get_sile(f).read_hamiltonian()
+    assert len(HS.spin) == 2
+    assert HS.orthogonal == orthogonal
+    assert H.spsame(HS)
+    for s in range(2):
+        Hs = sisl.get_sile(f).read_hamiltonian(spin=s)
+        assert len(Hs.spin) == 1
+        assert Hs.orthogonal == orthogonal
+        assert np.allclose(Hs.Hk([0.1, 0.2, 0]).toarray(), HS.Hk([0.1, 0.2, 0], spin=s).toarray())
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_tshs_spin_subset_fail(sisl_tmp):
+    H = sisl.Hamiltonian(sisl.geom.graphene())
+    H.construct([(0.1, 1.44), (0., -2.7)])
+    f = sisl_tmp('tmp.TSHS', _dir)
+    H.write(f)
+    sisl.get_sile(f).read_hamiltonian(spin=1)
+
+
+@pytest.mark.parametrize("orthogonal", [True, False])
+def test_tshs_sub(sisl_tmp, orthogonal):
+    g = sisl.geom.graphene(atom=sisl.Atom(6, R=[1.44, 1.44])).tile(3, 0).tile(2, 1)
+    H = sisl.Hamiltonian(g, orthogonal=orthogonal)
+    for ia in g:
+        for ja in g.close(ia, R=1.5):
+            for io in g.a2o(ia, True):
+                for jo in g.a2o(ja, True):
+                    H[io, jo] = io + 0.1 * jo
+                    if not orthogonal:
+                        H.S[io, jo] = 1. if io == jo else 0.01 * (io + jo)
+    f = sisl_tmp('tmp.TSHS', _dir)
+    H.write(f)
+
+    k = [0.1, 0.2, 0]
+    for atoms in [[1, 3, 4], [5, 0, 2]]:
+        sub = H.sub(atoms)
+        Hs = sisl.get_sile(f).read_hamiltonian(geometry=g, atoms=atoms)
+        assert sub.geometry == Hs.geometry
+        assert Hs.orthogonal == orthogonal
+        assert np.allclose(sub.Hk(k).toarray(), Hs.Hk(k).toarray())
+        assert np.allclose(sub.Sk(k).toarray(), Hs.Sk(k).toarray())
+
+    orbitals = [0, 3, 4, 7, 11]
+    Hs = sisl.get_sile(f).read_hamiltonian(geometry=g, orbitals=orbitals)
+    assert Hs.no == len(orbitals)
+    assert Hs.na == 5
+    idx = np.ix_(orbitals, orbitals)
+    assert np.allclose(H.Hk(k, gauge='r').toarray()[idx], Hs.Hk(k, gauge='r').toarray())
+    S = sisl.get_sile(f).read_overlap(geometry=g, orbitals=orbitals)
+    assert np.allclose(H.Sk(k, gauge='r').toarray()[idx], S.Pk(k, gauge='r').toarray())
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_tshs_sub_fail(sisl_tmp):
+    H = sisl.Hamiltonian(sisl.geom.graphene())
+    H.construct([(0.1, 1.44), (0., -2.7)])
+    f = sisl_tmp('tmp.TSHS', _dir)
+    H.write(f)
+    sisl.get_sile(f).read_hamiltonian(atoms=[0], orbitals=[0])
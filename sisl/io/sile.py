@@ -6,6 +6,7 @@ import gzip
 
 import numpy as np
 
+from sisl._help import is_python3
 from sisl.messages import SislWarning, SislInfo
 from sisl.utils.misc import str_spec
 from ._help import *
@@ -514,7 +515,11 @@ class Sile(BaseSile):
 
     def _open(self):
         if self.file.endswith('gz'):
-            self.fh = gzip.open(self.file)
+            if is_python3:
+                # open in text mode, also for writing
+                self.fh = gzip.open(self.file, self._mode.replace('b', '') + 't')
+            else:
+                self.fh = gzip.open(self.file, self._mode)
         else:
             self.fh = open(self.file, self._mode)
         self._line = 0
@@ -98,3 +98,37 @@ def test_imaginary_fail_geometry(sisl_tmp):
     grid2 = Grid(0.3, dtype=np.complex128)
     grid2.write(fi, imag=True)
     grid.read(fr, imag=fi)
+
+
+def test_dtype(sisl_tmp):
+    f = sisl_tmp('GRID.cube', _dir)
+    grid = Grid(0.2, sc=2.0)
+    grid.grid = np.random.rand(*grid.shape)
+    grid.write(f)
+    read = cubeSile(f).read_grid(dtype=np.float32)
+    assert read.grid.dtype == np.float32
+    assert np.allclose(grid.grid, read.grid, atol=1e-5)
+
+
+def test_gzip(sisl_tmp):
+    f = sisl_tmp('GRID.cube.gz', _dir)
+    grid = Grid(0.2, sc=2.0)
+    grid.grid = np.random.rand(*grid.shape) - 0.5
+    grid.write(f, buffersize=100)
+    read = grid.read(f)
+    assert np.allclose(grid.grid, read.grid, atol=1e-5)
+
+
+@pytest.mark.parametrize("fmt", ['.5e', '15.10e', '.2f'])
+def test_write_fmt(sisl_tmp, fmt):
+    f = sisl_tmp('GRID.cube', _dir)
+    grid = Grid([3, 4, 5], sc=2.0)
+    grid.grid = (np.random.rand(*grid.shape) - 0.5) * 10. ** np.random.randint(-120, 120, grid.shape)
+    grid.grid[0, 0, :2] = [0., 9.999995]
+    grid.write(f, fmt=fmt, buffersize=7)
+    with open(f) as fh:
+        data = fh.readlines()[-11:]
+    _fmt = '{:' + fmt + '}'
+    v = grid.grid.ravel().tolist()
+    lines = [' '.join(_fmt.format(x) for x in v[i:i+6]) + '\n' for i in range(0, len(v), 6)] + ['\n']
+    assert data == lines
@@ -0,0 +1,47 @@
+from __future__ import print_function, division
+
+import pytest
+
+import io
+import numpy as np
+
+from sisl import SislError
+from sisl.io._help import read_values
+
+pytestmark = [pytest.mark.io, pytest.mark.help]
+
+
+def _lines(values, ncol):
+    return ''.join(' '.join('{:.5e}'.format(v) for v in values[i:i+ncol]) + '\n'
+                   for i in range(0, len(values), ncol))
+
+
+@pytest.mark.parametrize("lines", [2, 2 ** 16])
+def test_read_values(lines):
+    values = np.random.rand(100)
+    fh = io.StringIO(_lines(values, 6) + 'END 1 2 3\n')
+    assert np.allclose(read_values(fh, 100, lines=lines), values)
+    assert fh.readline() == 'END 1 2 3\n'
+
+
+@pytest.mark.parametrize("end", ['END_DATAGRID_3D\n', '  10 10 10\n', ''])
+@pytest.mark.parametrize("lines", [2, 2 ** 16])
+def test_read_values_short_first_line(end, lines):
+    # the first line has fewer values than the following lines
+    values = np.random.rand(61)
+    fh = io.StringIO(_lines(values[:1], 1) + _lines(values[1:], 6) + end)
+    assert np.allclose(read_values(fh, 61, lines=lines), values)
+    assert fh.readline() == end
+
+
+def test_read_values_binary():
+    values = np.random.rand(61)
+    fh = io.BytesIO((_lines(values[:4], 2) + _lines(values[4:], 8) + '  10 10 10\n').encode())
+    assert np.allclose(read_values(fh, 61, dtype=np.float32), values)
+    assert fh.readline() == b'  10 10 10\n'
+
+
+@pytest.mark.xfail(raises=SislError)
+def test_read_values_fail():
+    fh = io.StringIO(_lines(np.random.rand(10), 6))
+    read_values(fh, 11)
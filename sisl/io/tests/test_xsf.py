@@ -44,3 +44,43 @@ def test_imaginary(sisl_tmp):
     grid.grid = np.random.rand(*grid.shape) + 1j*np.random.rand(*grid.shape)
     grid.write(f)
     assert not grid.geometry is None
+
+
+def test_read_grid(sisl_tmp):
+    f = sisl_tmp('GRID.xsf', _dir)
+    geom = Geometry(np.random.rand(10, 3), np.random.randint(1, 70, 10), sc=[10, 10, 10, 45, 60, 90])
+    grid = Grid(0.5, geometry=geom)
+    grid.grid = np.random.rand(*grid.shape)
+    grid.write(f, fmt='.12e')
+    read = grid.read(f)
+    assert read.shape == grid.shape
+    assert np.allclose(grid.grid, read.grid)
+    assert grid.geometry == read.geometry
+
+    read = xsfSile(f).read_grid(dtype=np.float32)
+    assert read.grid.dtype == np.float32
+    assert np.allclose(grid.grid, read.grid, atol=1e-6)
+
+
+def test_read_grid_multiple(sisl_tmp):
+    f = sisl_tmp('GRID.xsf', _dir)
+    g1 = Grid(0.5, sc=2., dtype=np.complex128)
+    g1.grid = np.random.rand(*g1.shape) + 1j*np.random.rand(*g1.shape)
+    g2 = Grid(0.4, sc=2.)
+    g2.grid = np.random.rand(*g2.shape)
+    xsfSile(f, 'w').write_grid(g1, g2, fmt='.12e')
+    read = xsfSile(f).read_grid()
+    assert read.geometry is None
+    assert np.allclose(g1.grid, read.grid)
+    assert np.allclose(g1.cell, read.cell)
+    read = xsfSile(f).read_grid(1)
+    assert np.allclose(g2.grid, read.grid)
+
+
+def test_gzip(sisl_tmp):
+    f = sisl_tmp('GRID.xsf.gz', _dir)
+    grid = Grid(0.5, sc=2., dtype=np.complex128)
+    grid.grid = np.random.rand(*grid.shape) + 1j*np.random.rand(*grid.shape)
+    xsfSile(f, 'w').write_grid(grid, buffersize=100)
+    read = xsfSile(f).read_grid()
+    assert np.allclose(grid.grid, read.grid, atol=1e-5)
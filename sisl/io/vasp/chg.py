@@ -7,6 +7,7 @@ from ..sile import *
 from .car import carSileVASP
 
 from sisl import Grid
+from .._help import read_values
 
 __all__ = ['chgSileVASP']
 
@@ -29,7 +30,7 @@ class chgSileVASP(carSileVASP):
            TOTAL, x, y, z charge density with the Cartesian directions equal to the charge
            magnetization.
         dtype : numpy.dtype, optional
-           grid stored dtype
+           grid stored dtype, the values are directly converted to this data-type
 
         Returns
         -------
@@ -41,17 +42,22 @@ class chgSileVASP(carSileVASP):
         # Now we are past the cell and geometry
         # We can now read the size of CHGCAR
         self.readline()
-        nx, ny, nz = list(map(int, self.readline().split()))
+        dims = self.readline().split()
+        nx, ny, nz = map(int, dims)
         n = nx * ny * nz
 
-        i = 0
-        vals = []
-        while i < n * (index + 1):
-            dat = [float(l) for l in self.readline().split()]
-            vals.append(dat)
-            i += len(dat)
-        vals = np.swapaxes(np.array(vals).reshape(nz, ny, nx), 0, 2)
-        vals = vals[index * n:(index + 1) * n] / V
+        # The values are stored with x running fastest
+        vals = np.empty([nx, ny, nz], dtype, order='F')
+        for i in range(index + 1):
+            if i > 0:
+                # Skip everything until the next grid (e.g. augmentation charges)
+                line = self.readline()
+                while line.split() != dims:
+                    if len(line) == 0:
+                        raise SileError(str(self) + '.read_grid could not find grid index {}.'.format(index))
+                    line = self.readline()
+            read_values(self.fh, n, out=vals.reshape(-1, order='F'))
+        vals /= V
 
         # Create the grid with data
         # Since we populate the grid data afterwards there
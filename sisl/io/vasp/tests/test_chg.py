@@ -26,3 +26,32 @@ def test_graphene_chgcar(sisl_files):
 
     assert grid.grid.sum() * grid.dvolume == pytest.approx(8)
     assert geom == grid.geometry
+
+
+def test_chgcar_index(sisl_tmp):
+    import sisl
+    from sisl.io.vasp.car import carSileVASP
+    f = sisl_tmp('CHGCAR', _dir)
+    geom = sisl.geom.graphene()
+    carSileVASP(f, 'w').write_geometry(geom)
+
+    shape = (4, 5, 6)
+    up, down = np.random.rand(*shape), np.random.rand(*shape)
+
+    def write(fh, rho):
+        fh.write('\n {} {} {}\n'.format(*shape))
+        rho = rho.ravel(order='F')
+        for i in range(0, rho.size, 5):
+            fh.write(' '.join('{:.11E}'.format(x) for x in rho[i:i+5]) + '\n')
+
+    with open(f, 'a') as fh:
+        write(fh, up)
+        fh.write('augmentation occupancies   1  3\n 0.1 0.2 0.3\n')
+        write(fh, down)
+
+    V = geom.sc.volume
+    grid = chgSileVASP(f).read_grid()
+    assert np.allclose(grid.grid * V, up)
+    grid = chgSileVASP(f).read_grid(1, dtype=np.float32)
+    assert grid.grid.dtype == np.float32
+    assert np.allclose(grid.grid * V, down)
@@ -7,8 +7,9 @@ import numpy as np
 from .sile import *
 
 # Import the geometry object
-from sisl import Geometry, Atom, SuperCell
+from sisl import Geometry, Atom, SuperCell, Grid
 from sisl.utils import str_spec
+from ._help import read_values, write_values
 
 
 __all__ = ['xsfSile', 'axsfSile']
@@ -109,11 +110,11 @@ class xsfSile(Sile):
             self._write('PRIMCOORD\n')
         else:
             self._write('PRIMCOORD {}\n'.format(self._md_index))
-        self._write('{} {}\n'.format(len(geometry), 1))
-
         valid_Z = (geometry.atoms.Z > 0).nonzero()[0]
         geometry = geometry.sub(valid_Z)
 
+        self._write('{} {}\n'.format(len(geometry), 1))
+
         if has_data:
             fmt_str = '{{0:3d}}  {{1:{0}}}  {{2:{0}}}  {{3:{0}}}   {{4:{0}}}  {{5:{0}}}  {{6:{0}}}\n'.format(fmt)
             for ia in geometry:
@@ -168,6 +169,12 @@ class xsfSile(Sile):
                     atom.append(int(line[0]))
                     xyz.append([float(x) for x in line[1:]])
 
+        if len(xyz) == 0:
+            # only a grid is stored
+            if data:
+                return None, None
+            return None
+
         xyz = np.array(xyz, np.float64)
         if data:
             dat = None
@@ -208,7 +215,7 @@ class xsfSile(Sile):
         fmt : str, optional
             floating point format for data (.5e)
         buffersize : int, optional
-            size of the buffer while writing the data, (6144)
+            number of values formatted at a time while writing the data, (65536)
         """
         sile_raise_write(self)
 
@@ -218,7 +225,7 @@ class xsfSile(Sile):
         self.write_geometry(geom)
 
         # Buffer size for writing
-        buffersize = kwargs.get('buffersize', min(6144, args[0].grid.size))
+        buffersize = kwargs.get('buffersize', 2 ** 16)
 
         # Format for precision
         fmt = kwargs.get('fmt', '.5e')
@@ -252,10 +259,9 @@ class xsfSile(Sile):
             #   for y
             #     for x
             #       write...
-            _fmt = '{:' + fmt + '}\n'
-            for x in np.nditer(np.asarray(grid.grid.real.T, order='C').reshape(-1), flags=['external_loop', 'buffered'],
-                               op_flags=[['readonly']], order='C', buffersize=buffersize):
-                self._write((_fmt * x.shape[0]).format(*x.tolist()))
+            # the values are formatted (and written) one z-slab at a time
+            slabs = (grid.grid[:, :, z].real.T.ravel() for z in range(grid.shape[2]))
+            write_values(self.fh, slabs, fmt, 1, chunk=buffersize)
 
             self._write(' END_DATAGRID_3D\n')
 
@@ -264,14 +270,67 @@ class xsfSile(Sile):
                 continue
             self._write(' BEGIN_DATAGRID_3D_imag_{}\n'.format(name))
             write_cell(grid)
-            for x in np.nditer(np.asarray(grid.grid.imag.T, order='C').reshape(-1), flags=['external_loop', 'buffered'],
-                               op_flags=[['readonly']], order='C', buffersize=buffersize):
-                self._write((_fmt * x.shape[0]).format(*x.tolist()))
+            slabs = (grid.grid[:, :, z].imag.T.ravel() for z in range(grid.shape[2]))
+            write_values(self.fh, slabs, fmt, 1, chunk=buffersize)
 
             self._write(' END_DATAGRID_3D\n')
 
         self._write('END_BLOCK_DATAGRID_3D\n')
 
+    def _read_datagrid(self, dtype):
+        """ Read the shape, origo, cell and values of a data-grid (after its BEGIN_DATAGRID_3D line) """
+        shape = [int(x) for x in self.readline().split()]
+        origo = np.array([float(x) for x in self.readline().split()], np.float64)
+        cell = np.empty([3, 3], np.float64)
+        for i in [0, 1, 2]:
+            cell[i, :] = [float(x) for x in self.readline().split()]
+        # The values are stored with x running fastest
+        data = np.empty(shape, dtype, order='F')
+        read_values(self.fh, data.size, out=data.reshape(-1, order='F'))
+        return origo, cell, data
+
+    @sile_fh_open()
+    def read_grid(self, index=0, dtype=np.float64):
+        """ Reads a data-grid from the XSF file
+
+        Complex grids (stored as ``real_`` and ``imag_`` data-grids, see `write_grid`) are
+        combined into a single grid.
+
+        Parameters
+        ----------
+        index : int, optional
+           the index of the data-grid in the file (complex grids count as a single grid)
+        dtype : numpy.dtype, optional
+           data-type of the (real) grid values, the values are directly converted to this data-type
+
+        Returns
+        -------
+        Grid : the data-grid with the associated geometry (if any)
+        """
+        geom = self.read_geometry()
+        self.fh.seek(0)
+
+        i = -1
+        while i < index:
+            found, line = self.step_to('BEGIN_DATAGRID_3D', reread=False)
+            if not found:
+                raise SileError(str(self) + '.read_grid could not find grid index {}.'.format(index))
+            # imaginary parts belongs to the previous grid
+            if not line.split()[0].startswith('BEGIN_DATAGRID_3D_imag_'):
+                i += 1
+
+        origo, cell, data = self._read_datagrid(dtype)
+        if line.split()[0].startswith('BEGIN_DATAGRID_3D_real_'):
+            self.step_to('BEGIN_DATAGRID_3D_imag_', reread=False)
+            data = data + 1j * self._read_datagrid(dtype)[2]
+
+        if geom is None:
+            grid = Grid([1, 1, 1], dtype=data.dtype, sc=SuperCell(cell, origo=origo))
+        else:
+            grid = Grid([1, 1, 1], dtype=data.dtype, geometry=geom)
+        grid.grid = data
+        return grid
+
     def ArgumentParser(self, p=None, *args, **kwargs):
         """ Returns the arguments that is available for this Sile """
         newkw = Geometry._ArgumentParser_args_single()
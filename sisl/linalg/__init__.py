@@ -22,11 +22,15 @@ like `numpy` and `scipy`.
    solve
    eig
    eigh
+   eigh_batch
    svd
    eigs
    eigsh
+   eigsh_window
 
 """
 from .base import *
+from .batch import *
+from .sparse import *
 
 __all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,181 @@
+from __future__ import print_function, division
+
+import numpy as np
+from scipy.linalg.lapack import get_lapack_funcs, _compute_lwork
+from scipy.linalg.misc import LinAlgError
+
+from sisl._help import _range as range
+
+
+__all__ = ['eigh_batch']
+
+
+# Names of the workspace arguments in the order returned by the LAPACK *_lwork routines
+# for (real, complex) matrices
+_LWORK_NAMES = {'evd': (('lwork', 'liwork'), ('lwork', 'liwork', 'lrwork')),
+                'evr': (('lwork', 'liwork'), ('lwork', 'lrwork', 'liwork')),
+                'evx': (('lwork',), ()),
+                'gvd': ((), ()),
+                'gvx': (('lwork',), ('lwork',))}
+
+# Cached LAPACK routines and workspace queries
+_LAPACK = {}
+_LWORK = {}
+
+
+def _lapack(driver, dtype, n, compute_v, lower):
+    """ LAPACK routine and workspace arguments of `driver` for matrices of size `n`, the queries are cached """
+    dtype = np.dtype(dtype)
+    complex = dtype.kind == 'c'
+    name = ('he' if complex else 'sy') + driver
+    key = (name, dtype.char)
+    if key not in _LAPACK:
+        a = np.empty([1, 1], dtype=dtype)
+        func = get_lapack_funcs(name, (a,))
+        try:
+            func_lwork = get_lapack_funcs(name + '_lwork', (a,))
+        except ValueError:
+            func_lwork = None
+        _LAPACK[key] = func, func_lwork
+    func, func_lwork = _LAPACK[key]
+
+    key = (name, dtype.char, n, compute_v, lower)
+    if key not in _LWORK:
+        names = _LWORK_NAMES[driver][complex]
+        if func_lwork is None or len(names) == 0:
+            lwork = {}
+        else:
+            if driver == 'evd':
+                lw = _compute_lwork(func_lwork, n, compute_v=compute_v, lower=lower)
+            elif driver == 'gvx':
+                lw = _compute_lwork(func_lwork, n, uplo='L' if lower else 'U')
+            else:
+                lw = _compute_lwork(func_lwork, n, lower=lower)
+            if len(names) == 1:
+                lw = (lw,)
+            lwork = dict(zip(names, lw))
+        _LWORK[key] = lwork
+    return func, _LWORK[key]
+
+
+def eigh_batch(a, b=None, eigvals_only=False, driver=None, subset_by_index=None, subset_by_value=None,
+               lower=True, overwrite_a=False, overwrite_b=False):
+    r""" Solve the (generalized) Hermitian eigenvalue problem of a single matrix or a stack of matrices
+
+    The LAPACK routine and its workspace query are only looked up once per driver, matrix size and
+    data-type, also across calls. Hence diagonalizing many matrices of the same size (e.g. :math:`\mathbf H(\mathbf k)`
+    for a set of k-points) has no setup overhead.
+
+    Parameters
+    ----------
+    a : (N, N) or (nb, N, N) array_like
+       Hermitian matrix, or a stack of Hermitian matrices
+    b : (N, N) or (nb, N, N) array_like, optional
+       Hermitian positive definite matrix for the generalized eigenvalue problem (e.g. the overlap matrix),
+       a single matrix may be used for a stack of `a` matrices.
+    eigvals_only : bool, optional
+       only calculate the eigenvalues
+    driver : {'evd', 'evr', 'evx'}
+       the LAPACK driver, divide and conquer (``evd``, default), multiple relatively robust
+       representations (``evr``, default for subsets) or the expert driver (``evx``). For generalized problems
+       ``evd`` uses ``gvd`` and the subset drivers use ``gvx``.
+    subset_by_index : (2,) of int, optional
+       only calculate the eigenvalues with indices ``subset_by_index[0]`` to (and including) ``subset_by_index[1]``
+    subset_by_value : (2,) of float, optional
+       only calculate the eigenvalues in the half-open interval ``(subset_by_value[0], subset_by_value[1]]``,
+       in this case lists are returned since the number of eigenvalues may differ between the matrices
+    lower : bool, optional
+       whether the lower or upper triangular part of the matrices are used
+    overwrite_a, overwrite_b : bool, optional
+       whether the input matrices may be overwritten
+
+    Returns
+    -------
+    w : (M,) or (nb, M) numpy.ndarray
+       the eigenvalues (ascending)
+    v : (N, M) or (nb, N, M) numpy.ndarray
+       the eigenvectors, ``v[..., :, i]``, only if `eigvals_only` is false
+    """
+    a = np.asarray(a)
+    single = a.ndim == 2
+    if single:
+        a = a.reshape((1,) + a.shape)
+    nb, n = a.shape[:2]
+    generalized = b is not None
+    if generalized:
+        b = np.asarray(b)
+        if b.ndim == 2:
+            b = b.reshape((1,) + b.shape)
+            overwrite_b = False
+    dtype = np.result_type(a.dtype, b.dtype if generalized else a.dtype, np.float32)
+
+    if subset_by_index is not None and subset_by_value is not None:
+        raise ValueError("eigh_batch: either subset_by_index or subset_by_value may be specified")
+    subset = subset_by_index is not None or subset_by_value is not None
+    if driver is None:
+        driver = 'evr' if subset else 'evd'
+    if driver not in ('evd', 'evr', 'evx'):
+        raise ValueError("eigh_batch: unknown driver '{}', must be one of [evd, evr, evx]".format(driver))
+    if subset and driver == 'evd':
+        raise ValueError("eigh_batch: the 'evd' driver does not calculate subsets, use 'evr' or 'evx'")
+    if generalized:
+        driver = 'gvd' if driver == 'evd' else 'gvx'
+    elif driver == 'evx' and np.dtype(dtype).kind == 'c':
+        # The heevx wrappers in some scipy versions are broken, the MRRR driver returns the same subsets
+        driver = 'evr'
+
+    compute_v = 0 if eigvals_only else 1
+    func, lwork = _lapack(driver, dtype, n, compute_v, lower)
+
+    # Arguments for the subset drivers
+    args = {}
+    if driver != 'evd' and driver != 'gvd':
+        args['abstol'] = 0.
+        if subset_by_index is not None:
+            args.update(range='I', il=subset_by_index[0] + 1, iu=subset_by_index[1] + 1)
+        elif subset_by_value is not None:
+            args.update(range='V', vl=subset_by_value[0], vu=subset_by_value[1])
+        else:
+            args['range'] = 'A'
+    if generalized:
+        args.update(itype=1, jobz='N' if eigvals_only else 'V', uplo='L' if lower else 'U')
+    else:
+        args.update(compute_v=compute_v, lower=1 if lower else 0)
+    args.update(lwork)
+
+    W = []
+    V = []
+    for i in range(nb):
+        # LAPACK works in-place on Fortran ordered arrays
+        ai = np.array(a[i], dtype=dtype, order='F', copy=not overwrite_a)
+        if generalized:
+            bi = np.array(b[i if len(b) > 1 else 0], dtype=dtype, order='F', copy=not overwrite_b)
+            out = func(ai, bi, overwrite_a=1, overwrite_b=1, **args)
+        else:
+            out = func(ai, overwrite_a=1, **args)
+        info = out[-1]
+        if info != 0:
+            if info < 0:
+                raise ValueError("eigh_batch: illegal value in argument {} of internal {}".format(-info, driver))
+            raise LinAlgError("eigh_batch: the {} driver did not converge (info={})".format(driver, info))
+
+        if driver in ('evd', 'gvd'):
+            w, v = out[:2]
+        else:
+            w, v, m = out[:3]
+            w, v = w[:m], v[:, :m]
+        W.append(w)
+        V.append(v)
+
+    if subset_by_value is None:
+        W = np.stack(W)
+        V = np.stack(V) if not eigvals_only else None
+        if single:
+            W = W[0]
+            V = V[0] if not eigvals_only else None
+    elif single:
+        W, V = W[0], V[0]
+
+    if eigvals_only:
+        return W
+    return W, V
@@ -0,0 +1,111 @@
+from __future__ import print_function, division
+
+import numpy as np
+from numpy import dot, conjugate
+import scipy.sparse as ssp
+import scipy.sparse.linalg as ssl
+
+from sisl._help import _imap
+from .base import eigh
+
+
+__all__ = ['eigsh_window']
+
+
+def eigsh_window(A, emin, emax, M=None, nslice=1, n=10, tol=0, pool=None, return_eigenvectors=True):
+    r""" All eigenpairs of the sparse Hermitian matrix `A` with eigenvalues in the window ``[emin, emax]``
+
+    The window is split into `nslice` slices, each slice uses the shift-invert mode of
+    `eigsh` around its center. The LU factorization of :math:`\mathbf A - \sigma\mathbf M`
+    is calculated once per slice and re-used when the number of requested eigenvalues in the slice
+    is increased (the slice is converged when an eigenvalue outside of the slice is found).
+    Factorizations are not shared between slices since each slice has its own shift.
+    If the center of a slice is an eigenvalue (e.g. a degeneracy point) the shift is moved
+    slightly off the center.
+    The eigenvectors of each slice are orthonormalized by a Rayleigh-Ritz projection.
+
+    Parameters
+    ----------
+    A : scipy.sparse.spmatrix
+       Hermitian matrix
+    emin, emax : float
+       the eigenvalue window
+    M : scipy.sparse.spmatrix, optional
+       Hermitian positive definite matrix for the generalized eigenvalue problem (e.g. the overlap matrix)
+    nslice : int, optional
+       number of slices of the window
+    n : int, optional
+       initial number of eigenvalues requested per slice, doubled until the slice is converged
+    tol : float, optional
+       relative accuracy of the eigenvalues, see `scipy.sparse.linalg.eigsh`
+    pool : int or object, optional
+       the slices are calculated on this number of threads (or using the ``imap`` method of this object)
+    return_eigenvectors : bool, optional
+       whether the eigenvectors are also returned
+
+    Returns
+    -------
+    w : numpy.ndarray
+       the eigenvalues in the window (ascending)
+    v : numpy.ndarray
+       the eigenvectors as columns ``v[:, i]``, only if `return_eigenvectors` is true
+    """
+    A = ssp.csc_matrix(A)
+    N = A.shape[0]
+    if M is None:
+        I = ssp.identity(N, dtype=A.dtype, format='csc')
+    else:
+        M = ssp.csc_matrix(M)
+        I = M
+    dtype = np.result_type(A.dtype, I.dtype, np.float64)
+    edges = np.linspace(emin, emax, nslice + 1)
+
+    def _factorize(lo, hi):
+        """ Shift and LU factorization of the slice, the shift is moved off the center if it is an eigenvalue """
+        sigma = (lo + hi) / 2
+        dsigma = 1e-3 * (hi - lo)
+        if dsigma == 0.:
+            dsigma = 1e-6
+        for shift in (0., 1., -1., 2.5, -2.5):
+            try:
+                return sigma + shift * dsigma, ssl.splu(A - (sigma + shift * dsigma) * I)
+            except RuntimeError:
+                # exactly singular factor
+                pass
+        raise ValueError('eigsh_window: could not find a non-singular shift in the slice [{}, {}]'.format(lo, hi))
+
+    def _slice(i):
+        lo, hi = edges[i], edges[i+1]
+        nev = n
+        lu = None
+        while nev < N - 1:
+            if lu is None:
+                sigma, lu = _factorize(lo, hi)
+                radius = max(hi - sigma, sigma - lo)
+                OPinv = ssl.LinearOperator((N, N), matvec=lu.solve, dtype=dtype)
+            e, v = ssl.eigsh(A, k=nev, M=M, sigma=sigma, OPinv=OPinv, tol=tol)
+            if np.abs(e - sigma).max() > radius:
+                # Rayleigh-Ritz projection, orthonormalizes (degenerate) eigenvectors
+                Mv = v if M is None else M.dot(v)
+                e, c = eigh(dot(conjugate(v.T), A.dot(v)), dot(conjugate(v.T), Mv))
+                v = dot(v, c)
+                break
+            nev *= 2
+        else:
+            # The slice contains (almost) all eigenvalues
+            if M is None:
+                e, v = eigh(A.toarray())
+            else:
+                e, v = eigh(A.toarray(), M.toarray())
+
+        if i == nslice - 1:
+            idx = np.logical_and(lo <= e, e <= hi).nonzero()[0]
+        else:
+            idx = np.logical_and(lo <= e, e < hi).nonzero()[0]
+        return e[idx], v[:, idx]
+
+    e, v = zip(*_imap(_slice, nslice, pool))
+    e = np.concatenate(e)
+    if return_eigenvectors:
+        return e, np.concatenate(v, axis=1)
+    return e
@@ -0,0 +1,78 @@
+from __future__ import print_function, division
+
+import pytest
+
+import numpy as np
+import scipy.linalg as sl
+from sisl.linalg import eigh_batch
+
+pytestmark = [pytest.mark.linalg, pytest.mark.eig]
+
+
+def hermitian(nb, n, dtype):
+    np.random.seed(1204982)
+    a = np.random.rand(nb, n, n)
+    if np.iscomplexobj(dtype(1)):
+        a = a + 1j * np.random.rand(nb, n, n)
+    return (a + np.conj(a.transpose(0, 2, 1))).astype(dtype)
+
+
+def overlap(n, dtype):
+    np.random.seed(1204983)
+    b = np.random.rand(n, n) * 0.1
+    return (np.dot(b, b.T) + np.identity(n)).astype(dtype)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.complex64, np.complex128])
+@pytest.mark.parametrize("driver", ['evd', 'evr', 'evx'])
+def test_eigh_batch(dtype, driver):
+    a = hermitian(3, 20, dtype)
+    atol = 1e-4 if dtype in [np.float32, np.complex64] else 1e-8
+    w, v = eigh_batch(a, driver=driver)
+    assert w.shape == (3, 20)
+    assert v.shape == (3, 20, 20)
+    for i in range(3):
+        assert np.allclose(w[i], sl.eigvalsh(a[i]), atol=atol)
+        assert np.allclose(a[i].dot(v[i]), v[i] * w[i], atol=atol * 10)
+    # input is not overwritten
+    assert np.allclose(a, hermitian(3, 20, dtype))
+    assert np.allclose(eigh_batch(a[0], driver=driver, eigvals_only=True), w[0])
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+@pytest.mark.parametrize("driver", ['evd', 'evr', 'evx'])
+def test_eigh_batch_generalized(dtype, driver):
+    a = hermitian(3, 20, dtype)
+    b = overlap(20, dtype)
+    w, v = eigh_batch(a, b, driver=driver)
+    for i in range(3):
+        assert np.allclose(w[i], sl.eigvalsh(a[i], b))
+        assert np.allclose(a[i].dot(v[i]), b.dot(v[i]) * w[i])
+    # a stack of overlap matrices
+    assert np.allclose(eigh_batch(a, np.stack([b] * 3), driver=driver, eigvals_only=True), w)
+
+
+@pytest.mark.parametrize("driver", ['evr', 'evx'])
+def test_eigh_batch_subset(driver):
+    a = hermitian(3, 20, np.complex128)
+    b = overlap(20, np.complex128)
+    w, v = eigh_batch(a, driver=driver, subset_by_index=(2, 5))
+    assert w.shape == (3, 4)
+    assert v.shape == (3, 20, 4)
+    assert np.allclose(w[1], sl.eigvalsh(a[1])[2:6])
+
+    w = eigh_batch(a, b, driver=driver, subset_by_value=(-1, 1), eigvals_only=True)
+    assert len(w) == 3
+    for i in range(3):
+        x = sl.eigvalsh(a[i], b)
+        assert np.allclose(w[i], x[np.logical_and(-1 < x, x <= 1)])
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_eigh_batch_fail_subset():
+    eigh_batch(hermitian(1, 5, np.float64), driver='evd', subset_by_index=(0, 1))
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_eigh_batch_fail_driver():
+    eigh_batch(hermitian(1, 5, np.float64), driver='ev')
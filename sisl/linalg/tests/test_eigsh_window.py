@@ -0,0 +1,61 @@
+from __future__ import print_function, division
+
+import pytest
+
+import numpy as np
+import scipy.sparse as ssp
+import scipy.linalg as sl
+from sisl.linalg import eigsh_window
+
+pytestmark = [pytest.mark.linalg, pytest.mark.eig]
+
+
+def hermitian(n, dtype):
+    np.random.seed(1204982)
+    a = ssp.random(n, n, density=0.05, dtype=np.float64)
+    if np.iscomplexobj(dtype(1)):
+        a = a + 1j * ssp.random(n, n, density=0.05)
+    a = a + a.getH() + ssp.diags(np.linspace(-2, 2, n))
+    return a.tocsr()
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+@pytest.mark.parametrize("nslice", [1, 3])
+def test_eigsh_window(dtype, nslice):
+    a = hermitian(200, dtype)
+    x = sl.eigvalsh(a.toarray())
+    x = x[np.logical_and(-0.5 <= x, x <= 0.5)]
+    # start with too few eigenvalues per slice
+    w, v = eigsh_window(a, -0.5, 0.5, nslice=nslice, n=2)
+    assert np.allclose(w, x)
+    assert np.allclose(a.dot(v), v * w)
+    assert np.allclose(np.dot(v.T.conj(), v), np.identity(len(w)))
+    assert np.allclose(eigsh_window(a, -0.5, 0.5, nslice=nslice, pool=2, return_eigenvectors=False), x)
+
+
+def test_eigsh_window_generalized():
+    a = hermitian(100, np.complex128)
+    m = ssp.identity(100) + hermitian(100, np.float64) * 0.01
+    x = sl.eigvalsh(a.toarray(), m.toarray())
+    x = x[np.logical_and(-1 <= x, x <= 0.)]
+    w, v = eigsh_window(a, -1, 0., M=m, nslice=2)
+    assert np.allclose(w, x)
+    assert np.allclose(a.dot(v), m.dot(v) * w)
+    assert np.allclose(np.dot(v.T.conj(), m.dot(v)), np.identity(len(w)))
+
+
+def test_eigsh_window_dense():
+    # very small matrices are diagonalized in full
+    a = hermitian(10, np.float64)
+    x = sl.eigvalsh(a.toarray())
+    assert np.allclose(eigsh_window(a, -10, 10, return_eigenvectors=False), x)
+
+
+def test_eigsh_window_singular_shift():
+    # the center of the window is an eigenvalue
+    a = ssp.diags(np.linspace(-2, 2, 201)).tocsr()
+    x = np.linspace(-2, 2, 201)
+    x = x[np.abs(x) <= 0.51]
+    w, v = eigsh_window(a, -0.51, 0.51, n=4)
+    assert np.allclose(w, x)
+    assert np.allclose(a.dot(v), v * w)
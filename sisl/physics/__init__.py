@@ -34,6 +34,16 @@ Spin configuration
    Spin - spin configuration
 
 
+Precision
+=========
+
+.. autosummary::
+   :toctree:
+
+   set_precision - single or double precision k-dependent matrices
+   get_precision
+
+
 Physical quantites
 ==================
 
@@ -49,6 +59,16 @@ Physical quantites
    RecursiveSI
 
 
+Block-tridiagonal Green functions (:mod:`~sisl.physics.btd`)
+============================================================
+
+.. autosummary::
+   :toctree:
+
+   btd_pivot
+   btd_partition
+   DeviceGreen
+
 
 Electrons (:mod:`~sisl.physics.electron`)
 =========================================
@@ -117,6 +137,7 @@ Distribution functions (:mod:`~sisl.physics.distribution`)
    sisl.physics.phonon
    sisl.physics.distribution
    sisl.physics.brillouinzone
+   sisl.physics.btd
 
 
 Low level objects
@@ -169,5 +190,6 @@ from .densitymatrix import *
 from .hamiltonian import *
 from .dynamicalmatrix import *
 from .self_energy import *
+from .btd import *
 
 __all__ = [s for s in dir() if not s.startswith('_')]
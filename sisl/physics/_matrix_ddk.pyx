@@ -15,7 +15,9 @@ __all__ = ['matrix_ddk']
 
 
 def matrix_ddk(gauge, M, const int idx, sc,
-               np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
+               np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format, out=None):
+    if out is not None and format != 'array':
+        raise ValueError("matrix_ddk: out argument is only allowed for format='array'")
     dtype = phase_dtype(k, dtype)
     # This is the double differentiated matrix with respect to k
     #  - i R (- i R) == - R ** 2
@@ -38,22 +40,26 @@ def matrix_ddk(gauge, M, const int idx, sc,
         del rij, phases
         p_opt = 1
 
-    return _matrix_ddk(M._csr, idx, Rd, Ro, dtype, format, p_opt)
+    return _matrix_ddk(M._csr, idx, Rd, Ro, dtype, format, p_opt, out)
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.initializedcheck(False)
-def _matrix_ddk(csr, const int idx, Rd, Ro, dtype, format, p_opt):
+def _matrix_ddk(csr, const int idx, Rd, Ro, dtype, format, p_opt, out=None):
 
     # Return list
     dd = [None, None, None, None, None, None]
+    if out is None:
+        out_d = out_o = None
+    else:
+        out_d, out_o = out[:3], out[3:]
 
     if dtype == np.complex128:
         
         if format == 'array':
-            dd[:3] = _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
-            dd[3:] = _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
+            dd[:3] = _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt, out_d)
+            dd[3:] = _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt, out_o)
         elif format == 'matrix' or format == 'dense':
             dd[:3] = _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
             dd[3:] = _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
@@ -77,8 +83,8 @@ def _matrix_ddk(csr, const int idx, Rd, Ro, dtype, format, p_opt):
 
     elif dtype == np.float64:
         if format == 'array':
-            dd[:3] = _phase3_array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
-            dd[3:] = _phase3_array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
+            dd[:3] = _phase3_array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt, out_d)
+            dd[3:] = _phase3_array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt, out_o)
         elif format == 'matrix' or format == 'dense':
             dd[:3] = _phase3_array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
             dd[3:] = _phase3_array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
@@ -100,8 +106,8 @@ def _matrix_ddk(csr, const int idx, Rd, Ro, dtype, format, p_opt):
 
     elif dtype == np.complex64:
         if format == 'array':
-            dd[:3] = _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
-            dd[3:] = _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
+            dd[:3] = _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt, out_d)
+            dd[3:] = _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt, out_o)
         elif format == 'matrix' or format == 'dense':
             dd[:3] = _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
             dd[3:] = _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
@@ -123,8 +129,8 @@ def _matrix_ddk(csr, const int idx, Rd, Ro, dtype, format, p_opt):
 
     elif dtype == np.float32:
         if format == 'array':
-            dd[:3] = _phase3_array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
-            dd[3:] = _phase3_array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
+            dd[:3] = _phase3_array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt, out_d)
+            dd[3:] = _phase3_array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt, out_o)
         elif format == 'matrix' or format == 'dense':
             dd[:3] = _phase3_array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx, Rd, p_opt)
             dd[3:] = _phase3_array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx, Ro, p_opt)
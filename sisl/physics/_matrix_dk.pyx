@@ -14,7 +14,9 @@ __all__ = ['matrix_dk']
 
 
 def matrix_dk(gauge, M, const int idx, sc,
-              np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
+              np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format, out=None):
+    if out is not None and format != 'array':
+        raise ValueError("matrix_dk: out argument is only allowed for format='array'")
     dtype = phase_dtype(k, dtype, True)
 
     # This is the differentiated matrix with respect to k
@@ -31,18 +33,18 @@ def matrix_dk(gauge, M, const int idx, sc,
         del rij
         p_opt = 0
 
-    return _matrix_dk(M._csr, idx, iRs, dtype, format, p_opt)
+    return _matrix_dk(M._csr, idx, iRs, dtype, format, p_opt, out)
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.initializedcheck(False)
-def _matrix_dk(csr, const int idx, iRs, dtype, format, p_opt):
+def _matrix_dk(csr, const int idx, iRs, dtype, format, p_opt, out=None):
 
     if dtype == np.complex128:
         
         if format == 'array':
-            return _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt)
+            return _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             d1, d2, d3 = _phase3_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt)
             return np.asmatrix(d1), np.asmatrix(d2), np.asmatrix(d3)
@@ -53,7 +55,7 @@ def _matrix_dk(csr, const int idx, iRs, dtype, format, p_opt):
     
     elif dtype == np.complex64:
         if format == 'array':
-            return _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt)
+            return _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             d1, d2, d3 = _phase3_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, iRs, p_opt)
             return np.asmatrix(d1), np.asmatrix(d2), np.asmatrix(d3)
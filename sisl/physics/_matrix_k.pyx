@@ -4,6 +4,7 @@ from libc.math cimport fabs
 
 import numpy as np
 cimport numpy as np
+from scipy.sparse import csr_matrix
 
 from ._phase import *
 from ._matrix_phase import *
@@ -15,7 +16,8 @@ __all__ = ['matrix_k', 'matrix_k_nc', 'matrix_k_so', 'matrix_k_nc_diag']
 
 
 def matrix_k(gauge, M, const int idx, sc,
-             np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
+             np.ndarray k, dtype, format, out=None):
+    _check_out(format, out)
     dtype = phase_dtype(k, dtype)
     if gauge == 'R':
         phases = phase_rsc(sc, k, dtype)
@@ -26,18 +28,78 @@ def matrix_k(gauge, M, const int idx, sc,
         phases = phase_rij(M.Rij()._csr._D, sc, k, dtype)
         p_opt = 0
 
-    return _matrix_k(M._csr, idx, phases, dtype, format, p_opt)
+    if k.ndim == 2:
+        return _matrix_k_nk(M._csr, idx, phases, dtype, format, p_opt, out)
+    return _matrix_k(M._csr, idx, phases, dtype, format, p_opt, out)
+
+
+def _check_out(format, out):
+    if out is not None and format != 'array':
+        raise ValueError("matrix_k: out argument is only allowed for format='array'")
+
+
+def _loop_k(func, k, format, out):
+    """ Call ``func(k, out)`` for all k-points, return a 3D array (``format='array'``) or a list """
+    if out is None:
+        Mk = [func(kk, None) for kk in k]
+        if format == 'array':
+            return np.stack(Mk)
+        return Mk
+    for ik in range(k.shape[0]):
+        func(k[ik], out[ik])
+    return out
+
+
+def _matrix_k_nk(csr, const int idx, phases, dtype, format, p_opt, out=None):
+    """ Matrices for all k-points, calculated in a single pass of the sparse pattern
+
+    For ``format='array'`` a 3D array of shape ``(nk, no, no)`` is returned, otherwise
+    a list of matrices which share the same sparsity pattern.
+    """
+    nk = phases.shape[0]
+
+    if dtype == np.complex128:
+        if format == 'array':
+            return _phase_array_nk_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt, out)
+        V_PTR, V_COL, V = _phase_csr_nk_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt)
+
+    elif dtype == np.complex64:
+        if format == 'array':
+            return _phase_array_nk_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt, out)
+        V_PTR, V_COL, V = _phase_csr_nk_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt)
+
+    elif dtype == np.float64 or dtype == np.float32:
+        # Only Gamma-points, all matrices are the same
+        if format == 'array':
+            if out is None:
+                M = _matrix_k(csr, idx, None, dtype, format, p_opt)
+                return np.repeat(M.reshape((1,) + M.shape), nk, axis=0)
+            out[:] = _matrix_k(csr, idx, None, dtype, format, p_opt, out[0])
+            return out
+        M = _matrix_k(csr, idx, None, dtype, 'csr', p_opt)
+        V_PTR, V_COL, V = M.indptr, M.indices, np.repeat(M.data.reshape(1, -1), nk, axis=0)
+
+    else:
+        raise ValueError('matrix_k: currently only supports dtype in [float32, float64, complex64, complex128].')
+
+    nr = V_PTR.shape[0] - 1
+    Mk = [csr_matrix((V[ik], V_COL, V_PTR), shape=(nr, nr)) for ik in range(nk)]
+    if format == 'matrix' or format == 'dense':
+        return [m.todense() for m in Mk]
+    elif format != 'csr':
+        return [m.asformat(format) for m in Mk]
+    return Mk
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.initializedcheck(False)
-def _matrix_k(csr, const int idx, phases, dtype, format, p_opt):
+def _matrix_k(csr, const int idx, phases, dtype, format, p_opt, out=None):
 
     if dtype == np.complex128:
         
         if format == 'array':
-            return _phase_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt)
+            return _phase_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_phase_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt))
         
@@ -46,21 +108,21 @@ def _matrix_k(csr, const int idx, phases, dtype, format, p_opt):
     
     elif dtype == np.float64:
         if format == 'array':
-            return _array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx)
+            return _array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_array_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx))
         return _csr_f64(csr.ptr, csr.ncol, csr.col, csr._D, idx).asformat(format)
 
     elif dtype == np.complex64:
         if format == 'array':
-            return _phase_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt)
+            return _phase_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_phase_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt))
         return _phase_csr_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt).asformat(format)
 
     elif dtype == np.float32:
         if format == 'array':
-            return _array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx)
+            return _array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_array_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx))
         return _csr_f32(csr.ptr, csr.ncol, csr.col, csr._D, idx).asformat(format)
@@ -68,8 +130,11 @@ def _matrix_k(csr, const int idx, phases, dtype, format, p_opt):
     raise ValueError('matrix_k: currently only supports dtype in [float32, float64, complex64, complex128].')
 
 def matrix_k_nc(gauge, M, sc,
-                np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
+                np.ndarray k, dtype, format, out=None):
+    _check_out(format, out)
     dtype = phase_dtype(k, dtype, True)
+    if k.ndim == 2:
+        return _loop_k(lambda kk, o: matrix_k_nc(gauge, M, sc, kk, dtype, format, o), k, format, out)
     if gauge == 'R':
         phases = phase_rsc(sc, k, dtype)
         p_opt = 1
@@ -77,13 +142,13 @@ def matrix_k_nc(gauge, M, sc,
         M.finalize()
         phases = phase_rij(M.Rij()._csr._D, sc, k, dtype)
         p_opt = 0
-    return _matrix_k_nc(M._csr, phases, dtype, format, p_opt)
+    return _matrix_k_nc(M._csr, phases, dtype, format, p_opt, out)
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.initializedcheck(False)
-def _matrix_k_nc(csr, phases, dtype, format, p_opt):
+def _matrix_k_nc(csr, phases, dtype, format, p_opt, out=None):
 
     if csr._D.shape[1] < 4:
         raise ValueError('matrix_k_nc requires input matrix to have 4 components')
@@ -91,7 +156,7 @@ def _matrix_k_nc(csr, phases, dtype, format, p_opt):
     if dtype == np.complex128:
         
         if format == 'array':
-            return _phase_nc_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt)
+            return _phase_nc_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_phase_nc_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt))
         
@@ -100,7 +165,7 @@ def _matrix_k_nc(csr, phases, dtype, format, p_opt):
     
     elif dtype == np.complex64:
         if format == 'array':
-            return _phase_nc_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt)
+            return _phase_nc_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_phase_nc_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt))
         return _phase_nc_csr_c64(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt).asformat(format)
@@ -109,8 +174,11 @@ def _matrix_k_nc(csr, phases, dtype, format, p_opt):
 
 
 def matrix_k_so(gauge, M, sc,
-                np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
+                np.ndarray k, dtype, format, out=None):
+    _check_out(format, out)
     dtype = phase_dtype(k, dtype, True)
+    if k.ndim == 2:
+        return _loop_k(lambda kk, o: matrix_k_so(gauge, M, sc, kk, dtype, format, o), k, format, out)
     if gauge == 'R':
         phases = phase_rsc(sc, k, dtype)
         p_opt = 1
@@ -118,13 +186,13 @@ def matrix_k_so(gauge, M, sc,
         M.finalize()
         phases = phase_rij(M.Rij()._csr._D, sc, k, dtype)
         p_opt = 0
-    return _matrix_k_so(M._csr, phases, dtype, format, p_opt)
+    return _matrix_k_so(M._csr, phases, dtype, format, p_opt, out)
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.initializedcheck(False)
-def _matrix_k_so(csr, phases, dtype, format, p_opt):
+def _matrix_k_so(csr, phases, dtype, format, p_opt, out=None):
 
     if csr._D.shape[1] < 8:
         raise ValueError('matrix_sc_so requires input matrix to have 8 components')
@@ -132,7 +200,7 @@ def _matrix_k_so(csr, phases, dtype, format, p_opt):
     if dtype == np.complex128:
         
         if format == 'array':
-            return _phase_so_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt)
+            return _phase_so_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_phase_so_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt))
         
@@ -141,7 +209,7 @@ def _matrix_k_so(csr, phases, dtype, format, p_opt):
     
     elif dtype == np.complex64:
         if format == 'array':
-            return _phase_so_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt)
+            return _phase_so_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_phase_so_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt))
         return _phase_so_csr_c64(csr.ptr, csr.ncol, csr.col, csr._D, phases, p_opt).asformat(format)
@@ -150,8 +218,11 @@ def _matrix_k_so(csr, phases, dtype, format, p_opt):
 
 
 def matrix_k_nc_diag(gauge, M, const int idx, sc,
-                     np.ndarray[np.float64_t, ndim=1, mode='c'] k, dtype, format):
+                     np.ndarray k, dtype, format, out=None):
+    _check_out(format, out)
     dtype = phase_dtype(k, dtype, True)
+    if k.ndim == 2:
+        return _loop_k(lambda kk, o: matrix_k_nc_diag(gauge, M, idx, sc, kk, dtype, format, o), k, format, out)
     if gauge == 'R':
         phases = phase_rsc(sc, k, dtype)
         p_opt = 1
@@ -159,18 +230,18 @@ def matrix_k_nc_diag(gauge, M, const int idx, sc,
         M.finalize()
         phases = phase_rij(M.Rij()._csr._D, sc, k, dtype)
         p_opt = 0
-    return _matrix_k_nc_diag(M._csr, idx, phases, dtype, format, p_opt)
+    return _matrix_k_nc_diag(M._csr, idx, phases, dtype, format, p_opt, out)
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.initializedcheck(False)
-def _matrix_k_nc_diag(csr, const int idx, phases, dtype, format, p_opt):
+def _matrix_k_nc_diag(csr, const int idx, phases, dtype, format, p_opt, out=None):
 
     if dtype == np.complex128:
         
         if format == 'array':
-            return _phase_nc_diag_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt)
+            return _phase_nc_diag_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_phase_nc_diag_array_c128(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt))
         
@@ -179,7 +250,7 @@ def _matrix_k_nc_diag(csr, const int idx, phases, dtype, format, p_opt):
     
     elif dtype == np.complex64:
         if format == 'array':
-            return _phase_nc_diag_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt)
+            return _phase_nc_diag_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt, out)
         elif format == 'matrix' or format == 'dense':
             return np.asmatrix(_phase_nc_diag_array_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt))
         return _phase_nc_diag_csr_c64(csr.ptr, csr.ncol, csr.col, csr._D, idx, phases, p_opt).asformat(format)
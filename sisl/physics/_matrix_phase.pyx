@@ -7,9 +7,11 @@ from scipy.sparse import csr_matrix
 
 from sisl._indices cimport _index_sorted
 from sisl._sparse import fold_csr_matrix
+from ._phase import _dense_out
 
 __all__ = ['_csr_f32', '_csr_f64', '_phase_csr_c64', '_phase_csr_c128',
-           '_array_f32', '_array_f64', '_phase_array_c64', '_phase_array_c128'] 
+           '_array_f32', '_array_f64', '_phase_array_c64', '_phase_array_c128',
+           '_phase_csr_nk_c64', '_phase_csr_nk_c128', '_phase_array_nk_c64', '_phase_array_nk_c128']
 
 # The fused data-types forces the data input to be of "correct" values.
 ctypedef fused numeric_real:
@@ -187,7 +189,7 @@ def _phase_csr_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
 def _array_f32(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
-               numeric_real[:, ::1] D, const int idx):
+               numeric_real[:, ::1] D, const int idx, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -195,7 +197,7 @@ def _array_f32(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef int[::1] col = COL
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.float32_t, ndim=2, mode='c'] V = np.zeros([nr, nr], dtype=np.float32)
+    cdef np.ndarray[np.float32_t, ndim=2, mode='c'] V = _dense_out(out, [nr, nr], np.float32)
     cdef float[:, ::1] v = V
     cdef int r, ind
 
@@ -213,7 +215,7 @@ def _array_f32(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
 def _array_f64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
-               numeric_real[:, ::1] D, const int idx):
+               numeric_real[:, ::1] D, const int idx, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -221,7 +223,7 @@ def _array_f64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef int[::1] col = COL
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.float64_t, ndim=2, mode='c'] V = np.zeros([nr, nr], dtype=np.float64)
+    cdef np.ndarray[np.float64_t, ndim=2, mode='c'] V = _dense_out(out, [nr, nr], np.float64)
     cdef double[:, ::1] v = V
     cdef int r, ind
 
@@ -240,7 +242,7 @@ def _phase_array_c64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                      np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                      np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
                      numeric_complex[:, ::1] D, const int idx,
-                     np.ndarray[np.complex64_t, ndim=1, mode='c'] PHASES, const int p_opt):
+                     np.ndarray[np.complex64_t, ndim=1, mode='c'] PHASES, const int p_opt, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -249,7 +251,7 @@ def _phase_array_c64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef float complex[::1] phases = PHASES
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] V = np.zeros([nr, nr], dtype=np.complex64)
+    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] V = _dense_out(out, [nr, nr], np.complex64)
     cdef float complex[:, ::1] v = V
     cdef int r, ind, c
 
@@ -276,7 +278,7 @@ def _phase_array_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                       np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                       np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
                       numeric_complex[:, ::1] D, const int idx,
-                      np.ndarray[np.complex128_t, ndim=1, mode='c'] PHASES, const int p_opt):
+                      np.ndarray[np.complex128_t, ndim=1, mode='c'] PHASES, const int p_opt, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -285,7 +287,7 @@ def _phase_array_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef double complex[::1] phases = PHASES
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] V = np.zeros([nr, nr], dtype=np.complex128)
+    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] V = _dense_out(out, [nr, nr], np.complex128)
     cdef double complex[:, ::1] v = V
     cdef int r, ind, c
 
@@ -303,4 +305,166 @@ def _phase_array_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
             
     return V
 
-    
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def _phase_csr_nk_c64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+                      np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+                      np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+                      numeric_complex[:, ::1] D, const int idx,
+                      np.ndarray[np.complex64_t, ndim=2, mode='c'] PHASES, const int p_opt):
+    """ Folded sparse data for several k-points, the returned data has shape ``(nk, nnz)`` """
+
+    # Convert to memory views
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] col = COL
+    cdef float complex[:, ::1] phases = PHASES
+
+    # Now create the folded sparse elements (shared by all k-points)
+    V_PTR, V_NCOL, V_COL = fold_csr_matrix(PTR, NCOL, COL)
+    cdef int[::1] v_ptr = V_PTR
+    cdef int[::1] v_ncol = V_NCOL
+    cdef int[::1] v_col = V_COL
+
+    cdef int nr = v_ncol.shape[0]
+    cdef int nk = phases.shape[0]
+    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] V = np.zeros([nk, v_col.shape[0]], dtype=np.complex64)
+    cdef float complex[:, ::1] v = V
+    cdef int r, ind, c, s_idx, p, ik
+
+    with nogil:
+        for r in range(nr):
+            for ind in range(ptr[r], ptr[r] + ncol[r]):
+                c = col[ind] % nr
+                s_idx = v_ptr[r] + _index_sorted(v_col[v_ptr[r]:v_ptr[r] + v_ncol[r]], c)
+                if p_opt == 0:
+                    p = ind
+                else:
+                    p = col[ind] / nr
+                for ik in range(nk):
+                    v[ik, s_idx] = v[ik, s_idx] + <float complex> (phases[ik, p] * D[ind, idx])
+
+    return V_PTR, V_COL, V
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def _phase_csr_nk_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+                       np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+                       np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+                       numeric_complex[:, ::1] D, const int idx,
+                       np.ndarray[np.complex128_t, ndim=2, mode='c'] PHASES, const int p_opt):
+    """ Folded sparse data for several k-points, the returned data has shape ``(nk, nnz)`` """
+
+    # Convert to memory views
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] col = COL
+    cdef double complex[:, ::1] phases = PHASES
+
+    # Now create the folded sparse elements (shared by all k-points)
+    V_PTR, V_NCOL, V_COL = fold_csr_matrix(PTR, NCOL, COL)
+    cdef int[::1] v_ptr = V_PTR
+    cdef int[::1] v_ncol = V_NCOL
+    cdef int[::1] v_col = V_COL
+
+    cdef int nr = v_ncol.shape[0]
+    cdef int nk = phases.shape[0]
+    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] V = np.zeros([nk, v_col.shape[0]], dtype=np.complex128)
+    cdef double complex[:, ::1] v = V
+    cdef int r, ind, c, s_idx, p, ik
+
+    with nogil:
+        for r in range(nr):
+            for ind in range(ptr[r], ptr[r] + ncol[r]):
+                c = col[ind] % nr
+                s_idx = v_ptr[r] + _index_sorted(v_col[v_ptr[r]:v_ptr[r] + v_ncol[r]], c)
+                if p_opt == 0:
+                    p = ind
+                else:
+                    p = col[ind] / nr
+                for ik in range(nk):
+                    v[ik, s_idx] = v[ik, s_idx] + <double complex> (phases[ik, p] * D[ind, idx])
+
+    return V_PTR, V_COL, V
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def _phase_array_nk_c64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+                        np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+                        numeric_complex[:, ::1] D, const int idx,
+                        np.ndarray[np.complex64_t, ndim=2, mode='c'] PHASES, const int p_opt, out=None):
+    """ Dense matrices for several k-points, the returned array has shape ``(nk, no, no)`` """
+
+    # Convert to memory views
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] col = COL
+    cdef float complex[:, ::1] phases = PHASES
+
+    cdef int nr = ncol.shape[0]
+    cdef int nk = phases.shape[0]
+    cdef np.ndarray[np.complex64_t, ndim=3, mode='c'] V = _dense_out(out, [nk, nr, nr], np.complex64)
+    cdef float complex[:, :, ::1] v = V
+    cdef int r, ind, c, p, ik
+
+    # Loop k-points outermost to keep the dense matrix being filled in cache
+    with nogil:
+        for ik in range(nk):
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    c = col[ind] % nr
+                    if p_opt == 0:
+                        p = ind
+                    else:
+                        p = col[ind] / nr
+                    v[ik, r, c] = v[ik, r, c] + <float complex> (phases[ik, p] * D[ind, idx])
+
+    return V
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def _phase_array_nk_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+                         np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+                         np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+                         numeric_complex[:, ::1] D, const int idx,
+                         np.ndarray[np.complex128_t, ndim=2, mode='c'] PHASES, const int p_opt, out=None):
+    """ Dense matrices for several k-points, the returned array has shape ``(nk, no, no)`` """
+
+    # Convert to memory views
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] col = COL
+    cdef double complex[:, ::1] phases = PHASES
+
+    cdef int nr = ncol.shape[0]
+    cdef int nk = phases.shape[0]
+    cdef np.ndarray[np.complex128_t, ndim=3, mode='c'] V = _dense_out(out, [nk, nr, nr], np.complex128)
+    cdef double complex[:, :, ::1] v = V
+    cdef int r, ind, c, p, ik
+
+    # Loop k-points outermost to keep the dense matrix being filled in cache
+    with nogil:
+        for ik in range(nk):
+            for r in range(nr):
+                for ind in range(ptr[r], ptr[r] + ncol[r]):
+                    c = col[ind] % nr
+                    if p_opt == 0:
+                        p = ind
+                    else:
+                        p = col[ind] / nr
+                    v[ik, r, c] = v[ik, r, c] + <double complex> (phases[ik, p] * D[ind, idx])
+
+    return V
@@ -7,6 +7,7 @@ from scipy.sparse import csr_matrix
 
 from sisl._indices cimport _index_sorted
 from sisl._sparse import fold_csr_matrix
+from ._phase import _dense_out
 
 __all__ = ['_phase3_csr_f32', '_phase3_csr_f64',
            '_phase3_csr_c64', '_phase3_csr_c128',
@@ -261,7 +262,7 @@ def _phase3_array_f32(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                       np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                       np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
                       numeric_real[:, ::1] D, const int idx,
-                      np.ndarray[np.float32_t, ndim=2, mode='c'] PHASES, const int p_opt):
+                      np.ndarray[np.float32_t, ndim=2, mode='c'] PHASES, const int p_opt, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -270,9 +271,11 @@ def _phase3_array_f32(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef float[:, ::1] phases = PHASES
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.float32_t, ndim=2, mode='c'] Vx = np.zeros([nr, nr], dtype=np.float32)
-    cdef np.ndarray[np.float32_t, ndim=2, mode='c'] Vy = np.zeros([nr, nr], dtype=np.float32)
-    cdef np.ndarray[np.float32_t, ndim=2, mode='c'] Vz = np.zeros([nr, nr], dtype=np.float32)
+    if out is None:
+        out = [None, None, None]
+    cdef np.ndarray[np.float32_t, ndim=2, mode='c'] Vx = _dense_out(out[0], [nr, nr], np.float32)
+    cdef np.ndarray[np.float32_t, ndim=2, mode='c'] Vy = _dense_out(out[1], [nr, nr], np.float32)
+    cdef np.ndarray[np.float32_t, ndim=2, mode='c'] Vz = _dense_out(out[2], [nr, nr], np.float32)
     cdef float[:, ::1] vx = Vx
     cdef float[:, ::1] vy = Vy
     cdef float[:, ::1] vz = Vz
@@ -309,7 +312,7 @@ def _phase3_array_f64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                       np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                       np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
                       numeric_real[:, ::1] D, const int idx,
-                      np.ndarray[np.float64_t, ndim=2, mode='c'] PHASES, const int p_opt):
+                      np.ndarray[np.float64_t, ndim=2, mode='c'] PHASES, const int p_opt, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -318,9 +321,11 @@ def _phase3_array_f64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef double[:, ::1] phases = PHASES
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.float64_t, ndim=2, mode='c'] Vx = np.zeros([nr, nr], dtype=np.float64)
-    cdef np.ndarray[np.float64_t, ndim=2, mode='c'] Vy = np.zeros([nr, nr], dtype=np.float64)
-    cdef np.ndarray[np.float64_t, ndim=2, mode='c'] Vz = np.zeros([nr, nr], dtype=np.float64)
+    if out is None:
+        out = [None, None, None]
+    cdef np.ndarray[np.float64_t, ndim=2, mode='c'] Vx = _dense_out(out[0], [nr, nr], np.float64)
+    cdef np.ndarray[np.float64_t, ndim=2, mode='c'] Vy = _dense_out(out[1], [nr, nr], np.float64)
+    cdef np.ndarray[np.float64_t, ndim=2, mode='c'] Vz = _dense_out(out[2], [nr, nr], np.float64)
     cdef double[:, ::1] vx = Vx
     cdef double[:, ::1] vy = Vy
     cdef double[:, ::1] vz = Vz
@@ -357,7 +362,7 @@ def _phase3_array_c64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                       np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                       np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
                       numeric_complex[:, ::1] D, const int idx,
-                      np.ndarray[np.complex64_t, ndim=2, mode='c'] PHASES, const int p_opt):
+                      np.ndarray[np.complex64_t, ndim=2, mode='c'] PHASES, const int p_opt, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -366,9 +371,11 @@ def _phase3_array_c64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef float complex[:, ::1] phases = PHASES
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] Vx = np.zeros([nr, nr], dtype=np.complex64)
-    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] Vy = np.zeros([nr, nr], dtype=np.complex64)
-    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] Vz = np.zeros([nr, nr], dtype=np.complex64)
+    if out is None:
+        out = [None, None, None]
+    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] Vx = _dense_out(out[0], [nr, nr], np.complex64)
+    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] Vy = _dense_out(out[1], [nr, nr], np.complex64)
+    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] Vz = _dense_out(out[2], [nr, nr], np.complex64)
     cdef float complex[:, ::1] vx = Vx
     cdef float complex[:, ::1] vy = Vy
     cdef float complex[:, ::1] vz = Vz
@@ -406,7 +413,7 @@ def _phase3_array_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                        np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
                        numeric_complex[:, ::1] D, const int idx,
-                       np.ndarray[np.complex128_t, ndim=2, mode='c'] PHASES, const int p_opt):
+                       np.ndarray[np.complex128_t, ndim=2, mode='c'] PHASES, const int p_opt, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -415,9 +422,11 @@ def _phase3_array_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef double complex[:, ::1] phases = PHASES
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] Vx = np.zeros([nr, nr], dtype=np.complex128)
-    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] Vy = np.zeros([nr, nr], dtype=np.complex128)
-    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] Vz = np.zeros([nr, nr], dtype=np.complex128)
+    if out is None:
+        out = [None, None, None]
+    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] Vx = _dense_out(out[0], [nr, nr], np.complex128)
+    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] Vy = _dense_out(out[1], [nr, nr], np.complex128)
+    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] Vz = _dense_out(out[2], [nr, nr], np.complex128)
     cdef double complex[:, ::1] vx = Vx
     cdef double complex[:, ::1] vy = Vy
     cdef double complex[:, ::1] vz = Vz
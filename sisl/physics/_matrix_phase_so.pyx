@@ -7,6 +7,7 @@ from scipy.sparse import csr_matrix
 
 from sisl._indices cimport _index_sorted
 from sisl._sparse import fold_csr_matrix_nc
+from ._phase import _dense_out
 
 __all__ = ['_phase_so_csr_c64', '_phase_so_csr_c128',
            '_phase_so_array_c64', '_phase_so_array_c128'] 
@@ -159,7 +160,7 @@ def _phase_so_array_c64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                         np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                         np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
                         numeric_complex[:, ::1] D,
-                        np.ndarray[np.complex64_t, ndim=1, mode='c'] PHASES, const int p_opt):
+                        np.ndarray[np.complex64_t, ndim=1, mode='c'] PHASES, const int p_opt, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -168,7 +169,7 @@ def _phase_so_array_c64(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef float complex[::1] phases = PHASES
 
     cdef int nr = ncol.shape[0]
-    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] V = np.zeros([nr * 2, nr * 2], dtype=np.complex64)
+    cdef np.ndarray[np.complex64_t, ndim=2, mode='c'] V = _dense_out(out, [nr * 2, nr * 2], np.complex64)
     cdef float complex[:, ::1] v = V
     cdef float complex ph, vv
     cdef int r, rr, ind, c
@@ -214,7 +215,7 @@ def _phase_so_array_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
                          np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
                          np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
                          numeric_complex[:, ::1] D,
-                         np.ndarray[np.complex128_t, ndim=1, mode='c'] PHASES, const int p_opt):
+                         np.ndarray[np.complex128_t, ndim=1, mode='c'] PHASES, const int p_opt, out=None):
 
     # Convert to memory views
     cdef int[::1] ptr = PTR
@@ -223,7 +224,7 @@ def _phase_so_array_c128(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
     cdef double complex[::1] phases = PHASES
     cdef int nr = ncol.shape[0]
 
-    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] V = np.zeros([nr * 2, nr * 2], dtype=np.complex128)
+    cdef np.ndarray[np.complex128_t, ndim=2, mode='c'] V = _dense_out(out, [nr * 2, nr * 2], np.complex128)
     cdef double complex[:, ::1] v = V
     cdef double complex ph, vv
     cdef int r, rr, ind, c
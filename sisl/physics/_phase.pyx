@@ -11,7 +11,7 @@ from numpy cimport float32_t, float64_t, complex64_t, complex128_t
 from numpy cimport ndarray
 
 
-__all__ = ['phase_dtype', 'phase_rsc', 'phase_rij']
+__all__ = ['phase_dtype', 'phase_rsc', 'phase_rij', '_dense_out']
 
 
 @cython.boundscheck(False)
@@ -27,8 +27,19 @@ cdef inline int is_gamma(const double[::1] k) nogil:
     return 1
 
 
-def phase_dtype(ndarray[float64_t, ndim=1, mode='c'] k, dtype, force_complex=False):
-    if is_gamma(k):
+cdef int is_gamma_nk(ndarray k):
+    """ Whether `k` is the Gamma-point, or for several k-points, whether all of them are """
+    cdef int ik
+    if k.ndim == 1:
+        return is_gamma(k)
+    for ik in range(k.shape[0]):
+        if not is_gamma(k[ik]):
+            return 0
+    return 1
+
+
+def phase_dtype(ndarray k, dtype, force_complex=False):
+    if is_gamma_nk(k):
         if dtype is None:
             dtype = float64
         if force_complex:
@@ -47,12 +58,21 @@ def phase_dtype(ndarray[float64_t, ndim=1, mode='c'] k, dtype, force_complex=Fal
     return dtype
     
 
-def phase_rsc(sc, ndarray[float64_t, ndim=1, mode='c'] k, dtype):
-    """ Calculate the phases for the supercell interactions using k """
+def phase_rsc(sc, ndarray k, dtype):
+    """ Calculate the phases for the supercell interactions using k
+
+    For several k-points, `k` with shape ``(nk, 3)``, the phases are returned
+    with shape ``(nk, sc.n_s)``.
+    """
 
     # Figure out if this is a Gamma point or not
-    if is_gamma(k):
-        phases = ones(sc.sc_off.shape[0], dtype=dtype)
+    if is_gamma_nk(k):
+        if k.ndim == 2:
+            phases = ones([k.shape[0], sc.sc_off.shape[0]], dtype=dtype)
+        else:
+            phases = ones(sc.sc_off.shape[0], dtype=dtype)
+    elif k.ndim == 2:
+        phases = exp(-1j * dot(k * 2 * pi, sc.sc_off.T)).astype(dtype, copy=False)
     else:
         # This is equivalent to (k.rcell).(sc_off.cell)^T
         # since rcell.cell^T == I * 2 * pi
@@ -61,13 +81,33 @@ def phase_rsc(sc, ndarray[float64_t, ndim=1, mode='c'] k, dtype):
     return phases
 
 
-def phase_rij(rij, sc, ndarray[float64_t, ndim=1, mode='c'] k, dtype):
-    """ Calculate the phases for the distance matrix using k """
+def phase_rij(rij, sc, ndarray k, dtype):
+    """ Calculate the phases for the distance matrix using k
+
+    For several k-points, `k` with shape ``(nk, 3)``, the phases are returned
+    with shape ``(nk, rij.shape[0])``.
+    """
 
     # Figure out if this is a Gamma point or not
-    if is_gamma(k):
-        phases = ones(rij.shape[0], dtype=dtype)
+    if is_gamma_nk(k):
+        if k.ndim == 2:
+            phases = ones([k.shape[0], rij.shape[0]], dtype=dtype)
+        else:
+            phases = ones(rij.shape[0], dtype=dtype)
+    elif k.ndim == 2:
+        phases = exp(-1j * dot(dot(k, sc.rcell), rij.T)).astype(dtype, copy=False)
     else:
         phases = exp(-1j * dot(rij, dot(k, sc.rcell))).astype(dtype, copy=False)
 
     return phases
+
+
+def _dense_out(out, shape, dtype):
+    """ Zeroed dense output array, `out` is reused if passed, otherwise a new array is created """
+    if out is None:
+        return np.zeros(shape, dtype=dtype)
+    if out.shape != tuple(shape) or out.dtype != dtype:
+        raise ValueError('out argument has wrong shape or data-type, '
+                         'expected {} with data-type {}'.format(tuple(shape), np.dtype(dtype).name))
+    out.fill(0)
+    return out
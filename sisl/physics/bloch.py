@@ -16,13 +16,11 @@ the periodicity of a given direction to describe the complete system.
 """
 from __future__ import print_function, division
 
-from itertools import product
 import numpy as np
-from numpy import zeros, empty
-from numpy import add, multiply
+from numpy import empty, multiply, dot
 from numpy import pi, exp
 
-from sisl._help import dtype_real_to_complex
+from sisl._help import dtype_real_to_complex, _imap
 import sisl._array as _a
 from sisl._array import aranged
 
@@ -37,12 +35,17 @@ class Bloch(object):
     ----------
     bloch : (3,) int
        Bloch repetitions along each direction
+    pool : int or object, optional
+       the function evaluations in `Bloch.__call__` are distributed on this number of threads
+       (or the ``imap`` method of this object is used). Only beneficial when the function
+       releases the GIL (e.g. LAPACK routines).
     """
 
-    def __init__(self, bloch):
+    def __init__(self, bloch, pool=None):
         """ Create `Bloch` object """
         self._bloch = _a.arrayi(bloch)
         self._bloch = np.where(self._bloch < 1, 1, self._bloch)
+        self._pool = pool
 
     def __len__(self):
         """ Return unfolded size """
@@ -100,6 +103,9 @@ class Bloch(object):
         >>> M = [func(*args, k=k) for k in k_unfold]
         >>> bloch.unfold(M, k_unfold)
 
+        The function values are stored directly in a single stacked array, and are
+        evaluated in parallel if the `pool` argument was specified at creation.
+
         Notes
         -----
         The function passed *must* have a keyword argument ``k``.
@@ -120,14 +126,37 @@ class Bloch(object):
         M : unfolded Bloch matrix
         """
         K_unfold = self.unfold_points(k)
-        return self.unfold([func(*args, k=K, **kwargs) for K in K_unfold], K_unfold)
+
+        def _func(i):
+            return func(*args, k=K_unfold[i], **kwargs)
+
+        M = None
+        for i, m in enumerate(_imap(_func, len(K_unfold), self._pool)):
+            if M is None:
+                M = empty((len(K_unfold),) + m.shape, dtype=m.dtype)
+            M[i] = m
+        return self.unfold(M, K_unfold)
+
+    def _cells(self):
+        """ Integer offsets of the unfolded cells (first lattice vector runs fastest) """
+        B = self._bloch
+        R = _a.emptyi([B[2], B[1], B[0], 3])
+        R[:, :, :, 0] = _a.arangei(B[0]).reshape(1, 1, -1)
+        R[:, :, :, 1] = _a.arangei(B[1]).reshape(1, -1, 1)
+        R[:, :, :, 2] = _a.arangei(B[2]).reshape(-1, 1, 1)
+        return R.reshape(-1, 3)
 
     def unfold(self, M, k_unfold):
         r""" Unfold the matrix list of matrices `M` into a corresponding k-point (unfolding k-points are `k_unfold`)
 
+        The block between the unfolded cells :math:`\mathbf R_i` and :math:`\mathbf R_j` only
+        depends on :math:`\mathbf R_j - \mathbf R_i`. The distinct blocks (modulo the
+        Bloch repetitions) are calculated with a single matrix product over all matrices
+        and subsequently copied into the unfolded matrix.
+
         Parameters
         ----------
-        M : list of numpy arrays
+        M : list of numpy arrays or (*, M0, M1) numpy array
             matrices used for unfolding
         k_unfold : (*, 3) of float
             unfolding k-points as returned by `Bloch.unfold_points`
@@ -136,91 +165,34 @@ class Bloch(object):
         -------
         M_unfold : unfolded matrix of size ``M[0].shape * k_unfold.shape[0] ** 2``
         """
-        Bi, Bj, Bk = self.bloch
-        # Retrieve shapes
-        M0, M1 = M[0].shape
-        shape = (Bk, Bj, Bi, M0, Bk, Bj, Bi, M1)
-        Mshape = (M0, 1, 1, 1, M1)
-
-        # Allocate the unfolded matrix
-        Mu = zeros(shape, dtype=dtype_real_to_complex(M[0].dtype))
-
-        # Use B-casting rules (much simpler)
-
-        # Perform unfolding
         N = len(self)
-        w = 1 / N
-        if Bi == 1:
-            if Bj == 1:
-                K = aranged(Bk).reshape(1, Bk, 1, 1, 1)
-                for T in range(N):
-                    m = M[T].reshape(Mshape) * w
-                    kjpi = 2j * pi * k_unfold[T, 2]
-                    for k in range(Bk):
-                        add(Mu[k, 0, 0], m * exp(kjpi * (K - k)), out=Mu[k, 0, 0])
-
-            elif Bk == 1:
-                J = aranged(Bj).reshape(1, 1, Bj, 1, 1)
-                for T in range(N):
-                    m = M[T].reshape(Mshape) * w
-                    kjpi = 2j * pi * k_unfold[T, 1]
-                    for j in range(Bj):
-                        add(Mu[0, j, 0], m * exp(kjpi * (J - j)), out=Mu[0, j, 0])
-
-            else:
-                J = aranged(Bj).reshape(1, 1, Bj, 1, 1)
-                K = aranged(Bk).reshape(1, Bk, 1, 1, 1)
-                for T in range(N):
-                    m = M[T].reshape(Mshape) * w
-                    kpi = pi * k_unfold[T, :]
-                    for k in range(Bk):
-                        Kk = (K - k) * kpi[2]
-                        for j in range(Bj):
-                            add(Mu[k, j, 0], m * exp(2j * (Kk + kpi[1] * (J - j))), out=Mu[k, j, 0])
-        elif Bj == 1:
-            if Bk == 1:
-                I = aranged(Bi).reshape(1, 1, 1, Bi, 1)
-                for T in range(N):
-                    m = M[T].reshape(Mshape) * w
-                    kjpi = 2j * pi * k_unfold[T, 0]
-                    for i in range(Bi):
-                        add(Mu[0, 0, i], m * exp(kjpi * (I - i)), out=Mu[0, 0, i])
-
+        B = self._bloch
+        k_unfold = _a.asarrayd(k_unfold)
+        M = np.asarray(M)
+        M0, M1 = M.shape[1:]
+        dtype = dtype_real_to_complex(M.dtype)
+
+        # The distinct blocks (all offsets modulo B)
+        #   D[R] = 1 / N \sum_T exp(2\pi i k_T . R) M_T
+        R = self._cells()
+        D = dot((exp(2j * pi * dot(R, k_unfold.T)) / N).astype(dtype, copy=False),
+                M.reshape(N, -1)).reshape(N, M0, M1)
+        del M
+
+        # Offsets outside [0, B[ differ by a phase of the unfolded k-point
+        kB = k_unfold[0] * B
+
+        Mu = empty([N, M0, N, M1], dtype=dtype)
+        for i in range(N):
+            dR = R - R[i, :]
+            dRB = dR % B
+            idx = dRB[:, 0] + B[0] * (dRB[:, 1] + B[1] * dRB[:, 2])
+            # Row block i, all column blocks
+            mu = Mu[i].transpose(1, 0, 2)
+            phase = exp(2j * pi * dot((dR - dRB) // B, kB))
+            if np.allclose(phase, 1):
+                mu[...] = D[idx]
             else:
-                I = aranged(Bi).reshape(1, 1, 1, Bi, 1)
-                K = aranged(Bk).reshape(1, Bk, 1, 1, 1)
-                for T in range(N):
-                    m = M[T].reshape(Mshape) * w
-                    kpi = pi * k_unfold[T, :]
-                    for k in range(Bk):
-                        Kk = (K - k) * kpi[2]
-                        for i in range(Bi):
-                            add(Mu[k, 0, i], m * exp(2j * (Kk + kpi[0] * (I - i))), out=Mu[k, 0, i])
-
-        elif Bk == 1:
-            I = aranged(Bi).reshape(1, 1, 1, Bi, 1)
-            J = aranged(Bj).reshape(1, 1, Bj, 1, 1)
-            for T in range(N):
-                m = M[T].reshape(Mshape) * w
-                kpi = pi * k_unfold[T, :]
-                for j in range(Bj):
-                    Jj = (J - j) * kpi[1]
-                    for i in range(Bi):
-                        add(Mu[0, j, i], m * exp(2j * (Jj + kpi[0] * (I - i))), out=Mu[0, j, i])
-
-        else:
-            I = aranged(Bi).reshape(1, 1, 1, Bi, 1)
-            J = aranged(Bj).reshape(1, 1, Bj, 1, 1)
-            K = aranged(Bk).reshape(1, Bk, 1, 1, 1)
-            for T in range(N):
-                m = M[T].reshape(Mshape) * w
-                kpi = pi * k_unfold[T, :]
-                for k in range(Bk):
-                    Kk = (K - k) * kpi[2]
-                    for j in range(Bj):
-                        KkJj = Kk + (J - j) * kpi[1]
-                        for i in range(Bi):
-                            # Calculate phases and add for all expansions
-                            add(Mu[k, j, i], m * exp(2j * (KkJj + kpi[0] * (I - i))), out=Mu[k, j, i])
+                multiply(D[idx], phase.reshape(-1, 1, 1), out=mu)
 
         return Mu.reshape(N * M0, N * M1)
@@ -58,6 +58,11 @@ weight:
 ...    return eigenstate.DOS(E) * k[0] * weight
 >>> DOS = mp.assum().eigenstate(wrap=wrap_DOS, eta=True)
 
+The k-points may be calculated in parallel by setting a pool of workers (`BrillouinZone.set_pool`).
+The results are always returned, and reduced, in the order of the k-points:
+
+>>> DOS = mp.set_pool(4).asaverage().DOS(E)
+
 
 .. autosummary::
    :toctree:
@@ -71,6 +76,9 @@ from __future__ import print_function, division
 
 import types
 from numbers import Integral, Real
+from functools import partial
+from multiprocessing.pool import ThreadPool
+from itertools import product, permutations
 
 from numpy import pi
 import numpy as np
@@ -81,7 +89,8 @@ from sisl.quaternion import Quaternion
 from sisl.utils.mathematics import cart2spher, fnorm
 from sisl.utils.misc import allow_kwargs
 import sisl._array as _a
-from sisl.messages import info, SislError, tqdm_eta
+from sisl.messages import info, warn, SislError, tqdm_eta
+from sisl._help import _fork_context
 from sisl.supercell import SuperCell
 from sisl.grid import Grid
 
@@ -89,6 +98,85 @@ from sisl.grid import Grid
 __all__ = ['BrillouinZone', 'MonkhorstPack', 'BandStructure']
 
 
+def _bz_eval(state, i):
+    """ Evaluate the function of a `BrillouinZone` call at k-point `i` """
+    func, wrap, args, kwargs, parent, k, w = state
+    v = func(*args, k=k[i], **kwargs)
+    if wrap is None:
+        return v
+    return wrap(v, parent=parent, k=k[i], weight=w[i])
+
+
+# State of the processes in `BrillouinZone.set_pool`
+_bz_pool_state = {}
+
+
+def _bz_pool_init(state):
+    _bz_pool_state['state'] = state
+
+
+def _bz_pool_eval(i):
+    return _bz_eval(_bz_pool_state['state'], i)
+
+
+def _bz_eval_chunk(state, idx):
+    """ Evaluate the function of a `BrillouinZone` call at the k-points `idx` """
+    return [_bz_eval(state, i) for i in idx]
+
+
+def _point_group(parent, tol=1e-5):
+    """ Integer rotation matrices (in the lattice basis) which leave `parent` invariant
+
+    A rotation matrix ``M`` transforms fractional coordinates as ``fxyz @ M`` and
+    the lattice vectors as ``M @ cell``. Only matrices with elements in ``{-1, 0, 1}``
+    are considered which is sufficient for reduced cells.
+
+    Parameters
+    ----------
+    parent : object
+       if `parent` has a geometry (or is a `Geometry`) the atoms are required to be
+       mapped onto atoms of the same specie (allowing fractional translations),
+       otherwise only the symmetry of the lattice is considered.
+    tol : float, optional
+       tolerance (in Ang) for the lattice and atomic positions
+
+    Returns
+    -------
+    numpy.ndarray : rotation matrices with shape ``(nop, 3, 3)``, the first is the identity
+    """
+    cell = parent.cell
+    G = dot(cell, cell.T)
+    M = _a.arrayi(list(product([-1, 0, 1], repeat=9))).reshape(-1, 3, 3)
+    # Only retain matrices conserving the metric (lengths and angles of the lattice vectors)
+    MG = np.einsum('nij,jk,nlk->nil', M, G, M)
+    M = M[np.all(np.abs(MG - G).reshape(-1, 9) <= tol * np.abs(G).max(), axis=1), :, :]
+    M = M[np.abs(np.rint(np.linalg.det(M))) == 1, :, :]
+
+    geom = getattr(parent, 'geometry', parent if hasattr(parent, 'atoms') else None)
+    if geom is not None:
+        fxyz = geom.fxyz
+        specie = geom.atoms.specie
+        # Use the specie with the fewest atoms to search for translations
+        count = np.bincount(specie)
+        ref = (specie == np.argmin(np.where(count > 0, count, len(specie) + 1))).nonzero()[0]
+
+        def is_symmetric(m):
+            rfxyz = dot(fxyz, m)
+            for t in fxyz[ref, :] - rfxyz[ref[0], :]:
+                d = rfxyz.reshape(-1, 1, 3) + t - fxyz.reshape(1, -1, 3)
+                d = fnorm(dot(d - np.rint(d), cell)) <= tol
+                d &= specie.reshape(-1, 1) == specie.reshape(1, -1)
+                if d.any(1).all():
+                    return True
+            return False
+
+        M = M[[is_symmetric(m) for m in M], :, :]
+
+    # Ensure the identity is the first
+    idx = np.argsort([not np.all(m == np.identity(3)) for m in M], kind='mergesort')
+    return M[idx, :, :]
+
+
 class BrillouinZone(object):
     """ A class to construct Brillouin zone related quantities
 
@@ -369,6 +457,79 @@ class BrillouinZone(object):
         return k
 
     _bz_attr = None
+    _bz_pool = None
+
+    def set_pool(self, pool=None):
+        """ Calculate the k-points in parallel using a pool of workers
+
+        The values of all k-points are returned (and reduced, for `asaverage` and `assum`)
+        in the order of the k-points. Hence the results do not depend on the pool used.
+
+        Parameters
+        ----------
+        pool : int or object, optional
+           for an integer a `multiprocessing.Pool` with this number of (forked) processes
+           is created for each call, the state of the call is passed once to each process.
+           Otherwise an object with an ``imap`` method, e.g. a `multiprocessing.pool.ThreadPool`,
+           which is used for all calls. For a process pool the called function (and its parent) must
+           be picklable, the k-points are passed in chunks (one per 4 k-points per process) to limit the
+           communication. If ``None`` (or 1) the k-points are calculated serially.
+           Where processes cannot be forked (e.g. Windows) an integer `pool` calculates the k-points serially.
+
+        Examples
+        --------
+        >>> obj = BrillouinZone(Hamiltonian) # doctest: +SKIP
+        >>> obj.set_pool(4).asaverage().DOS(np.linspace(-2, 2, 100)) # doctest: +SKIP
+
+        Returns
+        -------
+        self : to allow chaining
+        """
+        if isinstance(pool, Integral) and pool <= 1:
+            pool = None
+        self._bz_pool = pool
+        return self
+
+    def _bz_iter(self, func, wrap, args, kwargs):
+        """ Iterator of `func` (post-processed by `wrap`, if not ``None``) for all k-points, in order """
+        state = (func, wrap, args, kwargs, self.parent, self.k, self.weight)
+        nk = len(self)
+        pool = self._bz_pool
+        if pool is None or nk == 1:
+            for i in range(nk):
+                yield _bz_eval(state, i)
+            return
+
+        if isinstance(pool, Integral):
+            context = _fork_context()
+            if context is None:
+                warn(self.__class__.__name__ + ' cannot fork processes on this platform, '
+                     'the k-points are calculated serially.')
+                for i in range(nk):
+                    yield _bz_eval(state, i)
+                return
+            chunk = max(1, nk // (pool * 4))
+            # The processes are forked (the state need not be picklable) and the state
+            # is passed on initialization to limit communication
+            workers = context.Pool(pool, initializer=_bz_pool_init, initargs=(state,))
+            try:
+                for v in workers.imap(_bz_pool_eval, range(nk), chunk):
+                    yield v
+            finally:
+                workers.terminate()
+                workers.join()
+        elif isinstance(pool, ThreadPool):
+            # Threads share the state
+            for v in pool.imap(partial(_bz_eval, state), range(nk)):
+                yield v
+        else:
+            # The state is pickled for each task, hence the k-points are passed in chunks
+            nproc = getattr(pool, '_processes', None) or 1
+            chunk = max(1, nk // (nproc * 4))
+            chunks = [range(i, min(i + chunk, nk)) for i in range(0, nk, chunk)]
+            for vs in pool.imap(partial(_bz_eval_chunk, state), chunks):
+                for v in vs:
+                    yield v
 
     def __getattr__(self, attr):
         try:
@@ -447,13 +608,8 @@ class BrillouinZone(object):
                 wrap = allow_kwargs('parent', 'k', 'weight')(kwargs.pop('wrap'))
             eta = tqdm_eta(len(self), self.__class__.__name__ + '.asarray',
                            'k', kwargs.pop('eta', False))
-            parent = self.parent
-            k = self.k
-            w = self.weight
-            if has_wrap:
-                v = wrap(func(*args, k=k[0], **kwargs), parent=parent, k=k[0], weight=w[0])
-            else:
-                v = func(*args, k=k[0], **kwargs)
+            it = self._bz_iter(func, wrap if has_wrap else None, args, kwargs)
+            v = next(it)
             if v.ndim == 0:
                 a = np.empty([len(self)], dtype=v.dtype)
             else:
@@ -461,14 +617,9 @@ class BrillouinZone(object):
             a[0] = v
             del v
             eta.update()
-            if has_wrap:
-                for i in range(1, len(k)):
-                    a[i] = wrap(func(*args, k=k[i], **kwargs), parent=parent, k=k[i], weight=w[i])
-                    eta.update()
-            else:
-                for i in range(1, len(k)):
-                    a[i] = func(*args, k=k[i], **kwargs)
-                    eta.update()
+            for i, v in enumerate(it, 1):
+                a[i] = v
+                eta.update()
             eta.close()
             return a
         # Set instance __bz_call
@@ -509,11 +660,7 @@ class BrillouinZone(object):
             wrap = allow_kwargs('parent', 'k', 'weight')(kwargs.pop('wrap', lambda x: x))
             eta = tqdm_eta(len(self), self.__class__.__name__ + '.asnone',
                            'k', kwargs.pop('eta', False))
-            parent = self.parent
-            k = self.k
-            w = self.weight
-            for i in range(len(k)):
-                wrap(func(*args, k=k[i], **kwargs), parent=parent, k=k[i], weight=w[i])
+            for _ in self._bz_iter(func, wrap, args, kwargs):
                 eta.update()
             eta.close()
         # Set instance __call__
@@ -558,17 +705,9 @@ class BrillouinZone(object):
             eta = tqdm_eta(len(self), self.__class__.__name__ + '.aslist',
                            'k', kwargs.pop('eta', False))
             a = [None] * len(self)
-            parent = self.parent
-            k = self.k
-            w = self.weight
-            if has_wrap:
-                for i in range(len(k)):
-                    a[i] = wrap(func(*args, k=k[i], **kwargs), parent=parent, k=k[i], weight=w[i])
-                    eta.update()
-            else:
-                for i in range(len(k)):
-                    a[i] = func(*args, k=k[i], **kwargs)
-                    eta.update()
+            for i, v in enumerate(self._bz_iter(func, wrap if has_wrap else None, args, kwargs)):
+                a[i] = v
+                eta.update()
             eta.close()
             return a
         # Set instance __call__
@@ -611,17 +750,9 @@ class BrillouinZone(object):
                 wrap = allow_kwargs('parent', 'k', 'weight')(kwargs.pop('wrap'))
             eta = tqdm_eta(len(self), self.__class__.__name__ + '.asyield',
                            'k', kwargs.pop('eta', False))
-            parent = self.parent
-            k = self.k
-            w = self.weight
-            if has_wrap:
-                for i in range(len(k)):
-                    yield wrap(func(*args, k=k[i], **kwargs), parent=parent, k=k[i], weight=w[i])
-                    eta.update()
-            else:
-                for i in range(len(k)):
-                    yield func(*args, k=k[i], **kwargs)
-                    eta.update()
+            for v in self._bz_iter(func, wrap if has_wrap else None, args, kwargs):
+                yield v
+                eta.update()
             eta.close()
         # Set instance __call__
         setattr(self, '_bz_call', types.MethodType(_call, self))
@@ -667,21 +798,14 @@ class BrillouinZone(object):
                 wrap = allow_kwargs('parent', 'k', 'weight')(kwargs.pop('wrap'))
             eta = tqdm_eta(len(self), self.__class__.__name__ + '.asaverage',
                            'k', kwargs.pop('eta', False))
-            parent = self.parent
-            k = self.k
             w = self.weight
-            if has_wrap:
-                v = wrap(func(*args, k=k[0], **kwargs), parent=parent, k=k[0], weight=w[0]) * w[0]
-                eta.update()
-                for i in range(1, len(k)):
-                    v += wrap(func(*args, k=k[i], **kwargs), parent=parent, k=k[i], weight=w[i]) * w[i]
-                    eta.update()
-            else:
-                v = func(*args, k=k[0], **kwargs) * w[0]
+            # Reduction is done in the order of the k-points
+            it = self._bz_iter(func, wrap if has_wrap else None, args, kwargs)
+            v = next(it) * w[0]
+            eta.update()
+            for i, vi in enumerate(it, 1):
+                v += vi * w[i]
                 eta.update()
-                for i in range(1, len(k)):
-                    v += func(*args, k=k[i], **kwargs) * w[i]
-                    eta.update()
             eta.close()
             return v
         # Set instance __call__
@@ -728,21 +852,13 @@ class BrillouinZone(object):
                 wrap = allow_kwargs('parent', 'k', 'weight')(kwargs.pop('wrap'))
             eta = tqdm_eta(len(self), self.__class__.__name__ + '.assum',
                            'k', kwargs.pop('eta', False))
-            parent = self.parent
-            k = self.k
-            w = self.weight
-            if has_wrap:
-                v = wrap(func(*args, k=k[0], **kwargs), parent=parent, k=k[0], weight=w[0])
-                eta.update()
-                for i in range(1, len(k)):
-                    v += wrap(func(*args, k=k[i], **kwargs), parent=parent, k=k[i], weight=w[i])
-                    eta.update()
-            else:
-                v = func(*args, k=k[0], **kwargs)
+            # Reduction is done in the order of the k-points
+            it = self._bz_iter(func, wrap if has_wrap else None, args, kwargs)
+            v = next(it)
+            eta.update()
+            for vi in it:
+                v += vi
                 eta.update()
-                for i in range(1, len(k)):
-                    v += func(*args, k=k[i], **kwargs)
-                    eta.update()
             eta.close()
             return v
         # Set instance __call__
@@ -834,6 +950,12 @@ class MonkhorstPack(BrillouinZone):
        whether the k-points are :math:`\Gamma`-centered (for zero displacement)
     trs : bool, optional
        whether time-reversal symmetry exists in the Brillouin zone.
+    symmetry : bool, optional
+       only retain the k-points in the irreducible wedge of the Brillouin zone.
+       The point group is determined from the lattice and the atoms in `parent`
+       (if it has a geometry). The weights are the sum of the weights of the equivalent
+       k-points, see `unfold` for the mapping to the full grid.
+       The spin configuration of the parent is not considered.
 
     Examples
     --------
@@ -841,9 +963,10 @@ class MonkhorstPack(BrillouinZone):
     >>> MonkhorstPack(sc, 10) # 10 x 10 x 10 (with TRS)
     >>> MonkhorstPack(sc, [10, 5, 5]) # 10 x 5 x 5 (with TRS)
     >>> MonkhorstPack(sc, [10, 5, 5], trs=False) # 10 x 5 x 5 (without TRS)
+    >>> MonkhorstPack(sc, 10, symmetry=True) # 10 x 10 x 10 (only the irreducible wedge)
     """
 
-    def __init__(self, parent, nkpt, displacement=None, size=None, centered=True, trs=True):
+    def __init__(self, parent, nkpt, displacement=None, size=None, centered=True, trs=True, symmetry=False):
         super(MonkhorstPack, self).__init__(parent)
 
         if isinstance(nkpt, Integral):
@@ -874,7 +997,7 @@ class MonkhorstPack(BrillouinZone):
                              'diagonal elements different from 0.')
 
         i_trs = -1
-        if trs:
+        if trs and not symmetry:
             # Figure out which direction to TRS
             nmax = 0
             for i in [0, 1, 2]:
@@ -913,9 +1036,145 @@ class MonkhorstPack(BrillouinZone):
         self._centered = centered
         self._trs = i_trs
 
+        # Full grid and the index of the irreducible k-point for each full k-point
+        self._unfold = None
+        if symmetry:
+            self._reduce_symmetry(trs)
+
+    def _k2key(self, k):
+        """ Unique integer key of k-points on the grid (half-steps for displaced grids) """
+        n2 = self._diag * 2
+        key = np.rint(k * n2).astype(np.int64) % n2
+        return (key[:, 0] * n2[1] + key[:, 1]) * n2[2] + key[:, 2]
+
+    def _k2index(self, k, ops):
+        """ Index of the k-points in `self` equivalent to `k` by the operations
+
+        Returns
+        -------
+        index : (nop, nk)
+           index of the k-point in `self` for each operation on `k`, -1 if not found
+        """
+        key = self._k2key(self._k)
+        isort = np.argsort(key)
+        skey = key[isort]
+        nk = len(skey)
+
+        index = _a.emptyi([len(ops), len(k)])
+        for i, op in enumerate(ops):
+            okey = self._k2key(dot(k, op))
+            idx = np.searchsorted(skey, okey).clip(max=nk - 1)
+            index[i, :] = np.where(skey[idx] == okey, isort[idx], -1)
+        return index
+
+    def _reduce_symmetry(self, trs):
+        """ Only retain k-points in the irreducible wedge of the Brillouin zone """
+        if not np.allclose(self._size, 1.):
+            raise SislError(self.__class__.__name__ + ' symmetry reduction requires the full Brillouin zone (size=1).')
+        k = self._k
+
+        # Operations on the k-points (in reduced coordinates)
+        ops = [m.T for m in _point_group(self.parent)]
+        if trs:
+            ops += [-op for op in ops]
+
+        # Only use operations that map the grid onto itself
+        index = self._k2index(k, ops)
+        index = index[(index >= 0).all(1), :]
+        # The irreducible k-point is the lowest index of the equivalent k-points
+        irr, unfold = np.unique(index.min(0), return_inverse=True)
+
+        self._unfold = (k, unfold.astype(np.int32))
+        self._w = np.bincount(unfold, weights=self._w)
+        self._k = k[irr, :]
+
+    def unfold(self):
+        """ Full Monkhorst-Pack grid and the index of the equivalent k-point in this object
+
+        For a symmetry (or time-reversal symmetry) reduced grid, ``self.k[index]`` are the
+        k-points equivalent to the k-points in the full grid. For a non-reduced grid the index is
+        simply ``arange(len(self))``.
+
+        Raises
+        ------
+        SislError : if the full grid cannot be mapped onto the k-points in this object (e.g. after `replace`)
+
+        Returns
+        -------
+        k : (nk, 3)
+           the k-points of the full grid
+        index : (nk, )
+           index of the k-point in this object for each of the full grid k-points
+        """
+        if self._unfold is not None:
+            return self._unfold[0], self._unfold[1]
+        elif self._trs < 0:
+            return self.k, _a.arangei(len(self))
+
+        k = self.__class__(self.parent, self._diag, self._displ, self._size, self._centered, False).k
+        index = self._k2index(k, [np.identity(3), -np.identity(3)])
+        # Prefer k, otherwise -k
+        index = np.where(index[0] >= 0, index[0], index[1])
+        if np.any(index < 0):
+            raise SislError(self.__class__.__name__ + '.unfold could not map the full grid onto the k-points.')
+        return k, index
+
+    def tetrahedra(self):
+        """ Tetrahedra spanned by the k-points of the full Monkhorst-Pack grid
+
+        Each grid cell is divided into 6 tetrahedra sharing the shortest main diagonal
+        of the cell, and the grid is periodic in all directions.
+        All tetrahedra have the same volume, ``1 / len(tetrahedra)`` of the Brillouin zone.
+
+        Raises
+        ------
+        SislError : if this object is not a full Brillouin zone grid (e.g. ``size < 1`` or after `replace`)
+
+        Returns
+        -------
+        numpy.ndarray
+           indices (into ``self.k``) of the corners of each tetrahedron, shape ``(6 * prod(self._diag), 4)``
+        """
+        diag = self._diag
+        k, idx = self.unfold()
+        if not np.allclose(self._size, 1.) or len(k) != np.prod(diag):
+            raise SislError(self.__class__.__name__ + '.tetrahedra requires k-points on the full Brillouin zone grid.')
+
+        # Grid index of all k-points (all k-points are separated by integer steps)
+        ik = np.rint((k - k[0, :]) * diag).astype(np.int32) % diag
+        grid = _a.emptyi(diag)
+        grid[ik[:, 0], ik[:, 1], ik[:, 2]] = idx
+
+        # Select the shortest main diagonal of the grid cells, the 4 main
+        # diagonals start at the corners with first index 0
+        start = _a.arrayi(list(product([0, 1], repeat=3)))[:4, :]
+        step = 1 - 2 * start
+        rcell = self.parent.rcell / diag.reshape(-1, 1)
+        i = np.argmin(fnorm(dot(step, rcell)))
+        start, step = start[i], step[i]
+
+        # The 6 tetrahedra following the paths along the permuted axes
+        tet = []
+        for perm in permutations(range(3)):
+            c = [start.copy()]
+            for i in perm:
+                c.append(c[-1].copy())
+                c[-1][i] += step[i]
+            tet.append(c)
+        tet = _a.arrayi(tet) # (6, 4, 3)
+
+        # Now create all tetrahedra
+        off = _a.arrayi(list(product(*[range(n) for n in diag]))).reshape(-1, 1, 1, 3)
+        tet = (off + tet.reshape(1, 6, 4, 3)) % diag
+        return grid[tet[..., 0], tet[..., 1], tet[..., 2]].reshape(-1, 4)
+
     def copy(self):
         """ Create a copy of this object """
-        bz = self.__class__(self.parent, self._diag, self._displ, self._size, self._centered, self._trs >= 0)
+        if self._unfold is None:
+            bz = self.__class__(self.parent, self._diag, self._displ, self._size, self._centered, self._trs >= 0)
+        else:
+            bz = self.__class__(self.parent, self._diag, self._displ, self._size, self._centered, False)
+            bz._unfold = (self._unfold[0].copy(), self._unfold[1].copy())
         bz._k = self._k.copy()
         bz._w = self._w.copy()
         return bz
@@ -968,7 +1227,6 @@ class MonkhorstPack(BrillouinZone):
                            'k', kwargs.pop('eta', False))
             parent = self.parent
             k = self.k
-            w = self.weight
 
             # Extract information from the MP grid, these values
             # define the Grid size, etc.
@@ -1011,7 +1269,8 @@ class MonkhorstPack(BrillouinZone):
             origo = -(cell * 0.5).sum(0)
 
             # Calculate first k-point (to get size and dtype)
-            v = wrap(func(*args, k=k[0], **kwargs), parent=parent, k=k[0], weight=w[0])
+            it = self._bz_iter(func, wrap, args, kwargs)
+            v = next(it)
 
             if data_axis is None:
                 if v.size != 1:
@@ -1049,31 +1308,34 @@ class MonkhorstPack(BrillouinZone):
             # Create the grid in the reciprocal cell
             sc = SuperCell(cell, origo=origo)
             grid = Grid(diag, sc=sc, dtype=v.dtype)
-            if data_axis is None:
-                grid[k2idx(k[0])] = v
-            else:
-                idx = k2idx(k[0]).tolist()
-                weight = weights[idx[data_axis]]
-                idx[data_axis] = slice(None)
-                grid[idx] = v * weight
 
+            # For symmetry reduced grids each k-point is equivalent to several
+            # k-points in the full grid
+            if self._unfold is None:
+                k_full, unfold = k, _a.arangei(len(k))
+            else:
+                k_full, unfold = self._unfold
+            unfold_idx = np.argsort(unfold, kind='mergesort')
+            unfold_ptr = np.insert(np.cumsum(np.bincount(unfold, minlength=len(k))), 0, 0)
+
+            def set_grid(i, v):
+                for ik in unfold_idx[unfold_ptr[i]:unfold_ptr[i+1]]:
+                    if data_axis is None:
+                        grid[k2idx(k_full[ik])] = v
+                    else:
+                        idx = k2idx(k_full[ik]).tolist()
+                        weight = weights[idx[data_axis]]
+                        idx[data_axis] = slice(None)
+                        grid[idx] = v * weight
+
+            set_grid(0, v)
             del v
 
             # Now perform calculation
             eta.update()
-            if data_axis is None:
-                for i in range(1, len(k)):
-                    grid[k2idx(k[i])] = wrap(func(*args, k=k[i], **kwargs),
-                                             parent=parent, k=k[i], weight=w[i])
-                    eta.update()
-            else:
-                for i in range(1, len(k)):
-                    idx = k2idx(k[i]).tolist()
-                    weight = weights[idx[data_axis]]
-                    idx[data_axis] = slice(None)
-                    grid[idx] = wrap(func(*args, k=k[i], **kwargs),
-                                     parent=parent, k=k[i], weight=w[i]) * weight
-                    eta.update()
+            for i, v in enumerate(it, 1):
+                set_grid(i, v)
+                eta.update()
             eta.close()
             return grid
 
@@ -1207,7 +1469,7 @@ class MonkhorstPack(BrillouinZone):
         Raises
         ------
         SislError : if the size of the replacement `MonkhorstPack` grid is not compatible with the
-                    k-point spacing in this object.
+                    k-point spacing in this object, or if this object is symmetry reduced.
         """
         # First we find all k-points within k +- mp.size
         # Those are the points we wish to remove.
@@ -1215,6 +1477,8 @@ class MonkhorstPack(BrillouinZone):
         # the Brillouin zone we wish to replace.
         if not isinstance(mp, MonkhorstPack):
             raise ValueError('Object `mp` is not a MonkhorstPack object')
+        if self._unfold is not None:
+            raise SislError(self.__class__.__name__ + '.replace cannot replace k-points in a symmetry reduced grid.')
 
         # We can easily figure out the BZ that each k-point is averaging
         k_vol = self._size / self._diag
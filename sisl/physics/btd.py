@@ -0,0 +1,495 @@
+r"""Block-tridiagonal Green functions
+==================================
+
+.. module:: sisl.physics.btd
+   :noindex:
+
+Device Green functions for transport calculations using the block-tridiagonal (BTD)
+structure of the device matrix.
+
+Orbitals are pivoted such that the inverse of :math:`E\mathbf S - \mathbf H - \sum_e\boldsymbol\Sigma_e`
+becomes block-tridiagonal with the self-energy of the first electrode in the first block and
+all other electrodes in the last block. The recursive Green function algorithm then only
+requires the blocks of the Green function needed for the requested quantity, i.e. the memory
+requirement is :math:`\mathcal O(N b)` with :math:`b` the typical block size, as opposed to
+:math:`\mathcal O(N^2)` for the full inverse.
+
+.. autosummary::
+   :toctree:
+
+   btd_pivot
+   btd_partition
+   DeviceGreen
+
+"""
+from __future__ import print_function, division
+
+import numpy as np
+from numpy import dot, conjugate, pi
+from numpy import complex128
+from scipy.sparse import csr_matrix, isspmatrix
+
+from sisl._help import _range as range
+from sisl.sparse_geometry import SparseOrbital
+from sisl.utils.ranges import array_arange
+import sisl._array as _a
+from sisl.linalg import inv
+
+
+__all__ = ['btd_pivot', 'btd_partition', 'DeviceGreen']
+
+
+def _pattern(M):
+    """ Symmetric sparsity pattern of `M` in the unit-cell (supercell connections are folded) """
+    if isinstance(M, SparseOrbital):
+        csr = M.tocsr(0)
+        no = csr.shape[0]
+        M = csr_matrix((np.ones(csr.nnz, dtype=np.int8), csr.indices % no, csr.indptr), shape=(no, no))
+    elif isspmatrix(M):
+        M = M.tocsr()
+        M = csr_matrix((np.ones(M.nnz, dtype=np.int8), M.indices, M.indptr), shape=M.shape)
+    else:
+        raise ValueError("BTD: requires a SparseOrbital or a scipy sparse matrix")
+    return (M + M.T).tocsr()
+
+
+def btd_pivot(M, first, last=None):
+    """ Pivoting table for a block-tridiagonal structure with `first` in the first block and `last` in the last block
+
+    The orbitals are sorted by their (connectivity) distance to the `first` orbitals, i.e.
+    a breadth-first search starting from `first`. The `last` orbitals are always placed at the end.
+
+    Parameters
+    ----------
+    M : SparseOrbital or scipy.sparse.spmatrix
+       the matrix defining the connectivity (supercell connections are folded into the unit-cell)
+    first : array_like of int
+       orbitals placed first in the pivoting table (e.g. the orbitals coupling to the first electrode)
+    last : array_like of int, optional
+       orbitals placed last in the pivoting table (e.g. the orbitals coupling to the other electrodes)
+
+    Returns
+    -------
+    pivot : numpy.ndarray
+       the orbitals in the BTD order, ``pivot[i]`` is the orbital placed at position ``i``
+
+    See Also
+    --------
+    btd_partition : the block sizes of the pivoted matrix
+    """
+    P = _pattern(M)
+    n = P.shape[0]
+    first = _a.asarrayi(first).ravel()
+    if last is None:
+        last = _a.arrayi([])
+    last = _a.asarrayi(last).ravel()
+
+    # Breadth-first levels starting from the first orbitals
+    level = _a.fulli(n, n)
+    level[first] = 0
+    front = np.unique(first)
+    l = 0
+    while len(front) > 0:
+        l += 1
+        front = np.unique(P.indices[array_arange(P.indptr[front], P.indptr[front + 1])])
+        front = front[level[front] == n]
+        level[front] = l
+
+    # The first orbitals retain their order, the last orbitals are moved to the end
+    level[first] = -1
+    level[last] = n + 1
+    pivot = np.lexsort((_a.arangei(n), level))
+    pivot = pivot[len(first):n - len(last)]
+    return np.concatenate((first, pivot, last)).astype(np.int32)
+
+
+def btd_partition(M, pivot, first=1, last=0, block=1):
+    """ Block sizes of the block-tridiagonal matrix ``M[pivot, :][:, pivot]``
+
+    Each block extends to the largest column coupled from the previous block, hence the
+    pivoted matrix is block-tridiagonal for any pivoting table (the block sizes depend on the
+    pivoting table, see `btd_pivot`).
+
+    Parameters
+    ----------
+    M : SparseOrbital or scipy.sparse.spmatrix
+       the matrix defining the connectivity (supercell connections are folded into the unit-cell)
+    pivot : array_like of int
+       pivoting table of the orbitals (may be a subset of the orbitals in `M`)
+    first : int, optional
+       number of orbitals (at the start of `pivot`) which must be in the first block
+    last : int, optional
+       number of orbitals (at the end of `pivot`) which must be in the last block
+    block : int, optional
+       minimum block size, adjacent blocks are merged until this size is reached. Very small
+       blocks are inefficient due to the per-block overhead.
+
+    Returns
+    -------
+    btd : numpy.ndarray
+       the size of each block, ``btd.sum() == len(pivot)``
+    """
+    pivot = _a.asarrayi(pivot).ravel()
+    P = _pattern(M)[pivot, :][:, pivot].tocsr()
+    n = len(pivot)
+
+    # Largest column coupled from any of the first rows
+    reach = _a.arangei(n)
+    np.maximum.at(reach, np.repeat(reach, np.diff(P.indptr)), P.indices)
+    reach = np.maximum.accumulate(reach)
+
+    btd = []
+    start, end = 0, min(max(first, block, 1), n)
+    while True:
+        if end > n - last:
+            # the last orbitals must all be in the last block
+            end = n
+        btd.append(end - start)
+        if end == n:
+            break
+        start, end = end, min(max(reach[end - 1] + 1, end + block), n)
+    return _a.arrayi(btd)
+
+
+class DeviceGreen(object):
+    r""" Green function quantities of a device using the block-tridiagonal structure
+
+    The device matrix is :math:`\mathbf A = (E + i\eta)\mathbf S - \mathbf H - \sum_e\boldsymbol\Sigma_e`,
+    the self-energy of the first electrode is placed in the first block and all other electrodes must
+    be placed in the last block.
+
+    All returned orbital quantities are ordered according to `orbitals` (the sorted device orbitals).
+
+    Parameters
+    ----------
+    spgeom : SparseOrbitalBZ
+       the device matrix (e.g. a `Hamiltonian`)
+    elecs : list of (SelfEnergy, array_like)
+       the electrodes and the device orbitals they couple to, ``self_energy(E, k)`` of the
+       electrode must return a matrix with the same size as the number of orbitals.
+    pivot : array_like of int, optional
+       the device orbitals in the BTD order, defaults to `btd_pivot` of all orbitals. The
+       device region may be a subset of the orbitals (e.g. from `tbtncSileTBtrans.pivot`).
+    btd : array_like of int, optional
+       the block sizes of the pivoted device, defaults to `btd_partition` (e.g. from `tbtncSileTBtrans.btd`)
+    eta : float, optional
+       imaginary part of real energies in the device region (the electrodes use their own)
+    block : int, optional
+       minimum block size used in `btd_partition`
+
+    Examples
+    --------
+    >>> left = RecursiveSI(H_elec, '-A')
+    >>> right = RecursiveSI(H_elec, '+A')
+    >>> G = DeviceGreen(H_dev, [(left, range(no_elec)), (right, range(H_dev.no - no_elec, H_dev.no))])
+    >>> G.transmission(0.1)
+    """
+
+    def __init__(self, spgeom, elecs, pivot=None, btd=None, eta=0., block=1):
+        self.spgeom = spgeom
+        self.eta = eta
+        self.elecs = [elec for elec, _ in elecs]
+        orbs = [_a.asarrayi(o).ravel() for _, o in elecs]
+
+        if pivot is None:
+            pivot = btd_pivot(spgeom, orbs[0], np.concatenate(orbs[1:]) if len(orbs) > 1 else None)
+        pivot = _a.asarrayi(pivot).ravel()
+        ipivot = _a.fulli(spgeom.no, -1)
+        ipivot[pivot] = _a.arangei(len(pivot))
+        ielec = [ipivot[o] for o in orbs]
+        for i in ielec:
+            if np.any(i < 0):
+                raise ValueError(self.__class__.__name__ + ": electrode orbitals must be part of the device (pivot)")
+
+        if btd is None:
+            first = ielec[0].max() + 1
+            last = 0
+            if len(ielec) > 1:
+                last = len(pivot) - np.concatenate(ielec[1:]).min()
+            btd = btd_partition(spgeom, pivot, first, last, block)
+        btd = _a.asarrayi(btd).ravel()
+        if btd.sum() != len(pivot):
+            raise ValueError(self.__class__.__name__ + ": the BTD blocks do not match the pivoting table")
+
+        self._pivot = pivot
+        self._btd = btd
+        self._cbtd = np.insert(np.cumsum(btd), 0, 0)
+
+        # Determine the block of each electrode and the indices in the block
+        nb = len(btd)
+        self._elec_block = []
+        self._elec_idx = []
+        for i, e in enumerate(ielec):
+            if np.all(e < btd[0]) and (i == 0 or nb == 1):
+                b = 0
+            elif np.all(e >= self._cbtd[-2]):
+                b = nb - 1
+            else:
+                raise ValueError(self.__class__.__name__ + ": the first electrode must be in the first block "
+                                 "and all other electrodes in the last block")
+            self._elec_block.append(b)
+            self._elec_idx.append(e - self._cbtd[b])
+
+        self._k = None
+
+    def __len__(self):
+        """ Number of device orbitals """
+        return len(self._pivot)
+
+    def __str__(self):
+        """ Representation of the device """
+        return self.__class__.__name__ + '{{no: {0}, blocks: {1}, max-block: {2}, electrodes: {3}}}'.format(
+            len(self), len(self._btd), self._btd.max(), len(self.elecs))
+
+    @property
+    def pivot(self):
+        """ Device orbitals in the BTD order """
+        return self._pivot
+
+    @property
+    def btd(self):
+        """ Block sizes """
+        return self._btd
+
+    @property
+    def orbitals(self):
+        """ Device orbitals (sorted), the order of all returned orbital quantities """
+        return np.sort(self._pivot)
+
+    def _unpivot(self, a):
+        """ Re-order the first dimension of `a` from the pivoted order to `orbitals` """
+        return a[np.argsort(self._pivot)]
+
+    def _blocks_k(self, k):
+        """ Dense blocks of the device matrices at `k` (re-used for consecutive calls with the same `k`) """
+        k = tuple(_a.asarrayd(k).ravel())
+        if self._k is not None and self._k[0] == k:
+            return self._k[1]
+
+        def blocks(M):
+            M = M[self._pivot, :][:, self._pivot].tocsr()
+            c = self._cbtd
+            d = [M[c[i]:c[i+1], c[i]:c[i+1]].toarray() for i in range(len(self._btd))]
+            u = [M[c[i]:c[i+1], c[i+1]:c[i+2]].toarray() for i in range(len(self._btd) - 1)]
+            l = [M[c[i+1]:c[i+2], c[i]:c[i+1]].toarray() for i in range(len(self._btd) - 1)]
+            return d, u, l
+
+        P = blocks(self.spgeom.Pk(k, dtype=complex128, format='csr'))
+        if self.spgeom.orthogonal:
+            S = None
+        else:
+            S = blocks(self.spgeom.Sk(k, dtype=complex128, format='csr'))
+        self._k = (k, (P, S))
+        return P, S
+
+    def _matrix(self, E, k):
+        """ Blocks of the inverse Green function, and the scattering matrices of the electrodes """
+        (Pd, Pu, Pl), S = self._blocks_k(k)
+        Ed = E
+        if np.isrealobj(Ed) or Ed.imag == 0:
+            Ed = E.real + 1j * self.eta
+
+        if S is None:
+            d = [-P for P in Pd]
+            for a in d:
+                a.flat[::a.shape[0] + 1] += Ed
+            u = [-P for P in Pu]
+            l = [-P for P in Pl]
+        else:
+            Sd, Su, Sl = S
+            d = [Ed * s - p for s, p in zip(Sd, Pd)]
+            u = [Ed * s - p for s, p in zip(Su, Pu)]
+            l = [Ed * s - p for s, p in zip(Sl, Pl)]
+
+        gamma = []
+        for elec, b, idx in zip(self.elecs, self._elec_block, self._elec_idx):
+            SE = elec.self_energy(E, k)
+            d[b][idx.reshape(-1, 1), idx.reshape(1, -1)] -= SE
+            gamma.append(1j * (SE - conjugate(SE.T)))
+        return (d, u, l), gamma
+
+    def _column(self, A, j):
+        """ All blocks of block-column `j` of the Green function """
+        d, u, l = A
+        nb = len(d)
+        G = [None] * nb
+        gL = [None] * nb
+        gR = [None] * nb
+        for i in range(j):
+            if i == 0:
+                gL[i] = inv(d[i])
+            else:
+                gL[i] = inv(d[i] - dot(dot(l[i-1], gL[i-1]), u[i-1]), True)
+        for i in range(nb - 1, j, -1):
+            if i == nb - 1:
+                gR[i] = inv(d[i])
+            else:
+                gR[i] = inv(d[i] - dot(dot(u[i], gR[i+1]), l[i]), True)
+
+        Gjj = d[j].copy()
+        if j > 0:
+            Gjj -= dot(dot(l[j-1], gL[j-1]), u[j-1])
+        if j < nb - 1:
+            Gjj -= dot(dot(u[j], gR[j+1]), l[j])
+        G[j] = inv(Gjj, True)
+        for i in range(j + 1, nb):
+            G[i] = -dot(gR[i], dot(l[i-1], G[i-1]))
+        for i in range(j - 1, -1, -1):
+            G[i] = -dot(gL[i], dot(u[i], G[i+1]))
+        return G
+
+    def green_column(self, E, k=(0, 0, 0), elec=0):
+        """ Columns of the Green function corresponding to the orbitals of electrode `elec`
+
+        Parameters
+        ----------
+        E : float or complex
+           the energy, real energies get the imaginary part `eta` in the device
+        k : (3,) of float, optional
+           k-point
+        elec : int, optional
+           the electrode index
+
+        Returns
+        -------
+        numpy.ndarray : ``G[orbitals, elec_orbitals]`` with shape ``(len(self), no_elec)``
+        """
+        A, _ = self._matrix(E, k)
+        idx = self._elec_idx[elec]
+        G = self._column(A, self._elec_block[elec])
+        return self._unpivot(np.concatenate([g[:, idx] for g in G]))
+
+    def spectral_column(self, E, k=(0, 0, 0), elec=0):
+        r""" Columns of the spectral function of electrode `elec` corresponding to its orbitals
+
+        The spectral function is :math:`\mathbf A_e = \mathbf G\boldsymbol\Gamma_e\mathbf G^\dagger`.
+
+        Parameters
+        ----------
+        E : float or complex
+           the energy, real energies get the imaginary part `eta` in the device
+        k : (3,) of float, optional
+           k-point
+        elec : int, optional
+           the electrode index
+
+        Returns
+        -------
+        numpy.ndarray : ``A[orbitals, elec_orbitals]`` with shape ``(len(self), no_elec)``
+        """
+        A, gamma = self._matrix(E, k)
+        b = self._elec_block[elec]
+        idx = self._elec_idx[elec]
+        G = self._column(A, b)
+        Gc = np.concatenate([g[:, idx] for g in G])
+        Gee = G[b][idx, :][:, idx]
+        return self._unpivot(dot(dot(Gc, gamma[elec]), conjugate(Gee.T)))
+
+    def _S_dot(self, k, X):
+        """ ``S X`` for the block-column `X` (list of blocks) """
+        S = self._blocks_k(k)[1]
+        if S is None:
+            return X
+        Sd, Su, Sl = S
+        nb = len(X)
+        SX = [dot(Sd[i], X[i]) for i in range(nb)]
+        for i in range(nb - 1):
+            SX[i] += dot(Su[i], X[i+1])
+            SX[i+1] += dot(Sl[i], X[i])
+        return SX
+
+    def DOS(self, E, k=(0, 0, 0)):
+        r""" Orbital resolved density of states :math:`-\Im[\mathbf G\mathbf S]_{\nu\nu}/\pi`
+
+        Only the diagonal and first off-diagonal blocks of the Green function are calculated.
+
+        Parameters
+        ----------
+        E : float or complex
+           the energy, real energies get the imaginary part `eta` in the device
+        k : (3,) of float, optional
+           k-point
+
+        Returns
+        -------
+        numpy.ndarray : DOS for each of the `orbitals`
+        """
+        (d, u, l), _ = self._matrix(E, k)
+        S = self._blocks_k(k)[1]
+        nb = len(d)
+
+        # Right connected Green functions (the first one is the fully connected)
+        gR = [None] * nb
+        gR[-1] = inv(d[-1])
+        for i in range(nb - 2, -1, -1):
+            gR[i] = inv(d[i] - dot(dot(u[i], gR[i+1]), l[i]), True)
+
+        G = gR[0]
+        dos = []
+        for i in range(nb):
+            if S is None:
+                GS = G.diagonal().copy()
+            else:
+                GS = (G * S[0][i].T).sum(1)
+                if i > 0:
+                    # G[i, i-1] S[i-1, i]
+                    GS += (Gl * S[1][i-1].T).sum(1)
+            if i < nb - 1:
+                # G[i+1, i]
+                Gl = -dot(gR[i+1], dot(l[i], G))
+                if S is not None:
+                    # G[i, i+1] S[i+1, i]
+                    Gu = -dot(dot(G, u[i]), gR[i+1])
+                    GS += (Gu * S[2][i].T).sum(1)
+                G = gR[i+1] - dot(dot(Gl, u[i]), gR[i+1])
+            dos.append(GS)
+        return self._unpivot(-np.concatenate(dos).imag / pi)
+
+    def ADOS(self, E, k=(0, 0, 0), elec=0):
+        r""" Orbital resolved spectral density of states from electrode `elec`, :math:`\Re[\mathbf A_e\mathbf S]_{\nu\nu}/2\pi`
+
+        Parameters
+        ----------
+        E : float or complex
+           the energy, real energies get the imaginary part `eta` in the device
+        k : (3,) of float, optional
+           k-point
+        elec : int, optional
+           the electrode index
+
+        Returns
+        -------
+        numpy.ndarray : ADOS for each of the `orbitals`
+        """
+        A, gamma = self._matrix(E, k)
+        idx = self._elec_idx[elec]
+        Gc = [g[:, idx] for g in self._column(A, self._elec_block[elec])]
+        SG = self._S_dot(k, Gc)
+        ados = [(dot(g, gamma[elec]) * conjugate(sg)).sum(1).real for g, sg in zip(Gc, SG)]
+        return self._unpivot(np.concatenate(ados) / (2 * pi))
+
+    def transmission(self, E, k=(0, 0, 0), elec_from=0, elec_to=1):
+        r""" Transmission from `elec_from` to `elec_to`, :math:`\mathrm{Tr}[\mathbf G\boldsymbol\Gamma_{\mathrm{from}}\mathbf G^\dagger\boldsymbol\Gamma_{\mathrm{to}}]`
+
+        Only the block-column of the Green function of `elec_from` is calculated.
+
+        Parameters
+        ----------
+        E : float or complex
+           the energy, real energies get the imaginary part `eta` in the device
+        k : (3,) of float, optional
+           k-point
+        elec_from : int, optional
+           the electrode index the electrons originate from
+        elec_to : int, optional
+           the electrode index the electrons are transmitted to
+
+        Returns
+        -------
+        float : the transmission
+        """
+        A, gamma = self._matrix(E, k)
+        G = self._column(A, self._elec_block[elec_from])
+        G = G[self._elec_block[elec_to]][self._elec_idx[elec_to], :][:, self._elec_idx[elec_from]]
+        GG = dot(dot(G, gamma[elec_from]), conjugate(G.T))
+        return (GG * gamma[elec_to].T).sum().real
@@ -65,6 +65,9 @@ class DynamicalMatrix(SparseOrbitalBZ):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : numpy.ndarray, optional
+           only for ``format='array'``; an array (with the shape and data-type of the
+           returned array) which is filled and returned, allowing memory to be reused
 
         See Also
         --------
@@ -115,6 +118,9 @@ class DynamicalMatrix(SparseOrbitalBZ):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : sequence of numpy.ndarray, optional
+           only for ``format='array'``; 3 arrays (with the shape and data-type of the
+           returned arrays) which are filled and returned, allowing memory to be reused
 
         See Also
         --------
@@ -165,6 +171,9 @@ class DynamicalMatrix(SparseOrbitalBZ):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : sequence of numpy.ndarray, optional
+           only for ``format='array'``; 6 arrays (with the shape and data-type of the
+           returned arrays) which are filled and returned, allowing memory to be reused
 
         See Also
         --------
@@ -248,7 +257,9 @@ class DynamicalMatrix(SparseOrbitalBZ):
         Parameters
         ----------
         k : array_like*3, optional
-            the k-point at which to evaluate the eigenvalues at
+            the k-point at which to evaluate the eigenvalues at, for a list of k-points
+            (shape ``(nk, 3)``) all k-points are diagonalized in one batch and a list
+            with an `EigenvaluePhonon` per k-point is returned
         gauge : str, optional
             the gauge used for calculating the eigenvalues
         sparse : bool, optional
@@ -270,8 +281,10 @@ class DynamicalMatrix(SparseOrbitalBZ):
             hw = self.eigsh(k, gauge=gauge, eigvals_only=True, **kwargs)
         else:
             hw = self.eigh(k, gauge, eigvals_only=True, **kwargs)
-        info = {'k': k, 'gauge': gauge}
-        return EigenvaluePhonon(_correct_hw(hw), self, **info)
+        info = {'gauge': gauge}
+        if np.ndim(k) == 2:
+            return [EigenvaluePhonon(_correct_hw(hwk), self, k=kk, **info) for kk, hwk in zip(k, hw)]
+        return EigenvaluePhonon(_correct_hw(hw), self, k=k, **info)
 
     def eigenmode(self, k=(0, 0, 0), gauge='R', **kwargs):
         """ Calculate the eigenmodes at `k` and return an `EigenmodePhonon` object containing all eigenmodes
@@ -279,7 +292,9 @@ class DynamicalMatrix(SparseOrbitalBZ):
         Parameters
         ----------
         k : array_like*3, optional
-            the k-point at which to evaluate the eigenmodes at
+            the k-point at which to evaluate the eigenmodes at, for a list of k-points
+            (shape ``(nk, 3)``) all k-points are diagonalized in one batch and a list
+            with an `EigenmodePhonon` per k-point is returned
         gauge : str, optional
             the gauge used for calculating the eigenmodes
         sparse : bool, optional
@@ -301,9 +316,11 @@ class DynamicalMatrix(SparseOrbitalBZ):
             hw, v = self.eigsh(k, gauge=gauge, eigvals_only=False, **kwargs)
         else:
             hw, v = self.eigh(k, gauge, eigvals_only=False, **kwargs)
-        info = {'k': k, 'gauge': gauge}
+        info = {'gauge': gauge}
         # Since eigh returns the eigenvectors [:, i] we have to transpose
-        return EigenmodePhonon(v.T, _correct_hw(hw), self, **info)
+        if np.ndim(k) == 2:
+            return [EigenmodePhonon(vk.T, _correct_hw(hwk), self, k=kk, **info) for kk, hwk, vk in zip(k, hw, v)]
+        return EigenmodePhonon(v.T, _correct_hw(hw), self, k=k, **info)
 
     @staticmethod
     def read(sile, *args, **kwargs):
@@ -17,6 +17,10 @@ One may also plot real-space wavefunctions.
 
    DOS
    PDOS
+   DOS_tetrahedron
+   PDOS_tetrahedron
+   DOS_kpm
+   PDOS_kpm
    velocity
    velocity_matrix
    berry_phase
@@ -52,9 +56,11 @@ import numpy as np
 from numpy import find_common_type
 from numpy import floor, ceil
 from numpy import conj, dot, ogrid
-from numpy import cos, sin, pi
+from numpy import cos, sin, tan, sinh, pi
+from numpy import arccos, sqrt, vdot
 from numpy import int32, complex128
 from numpy import add, angle, sort
+from scipy.sparse import identity
 
 from sisl import units, constant
 from sisl.supercell import SuperCell
@@ -73,6 +79,8 @@ from .state import Coefficient, State, StateC
 
 
 __all__ = ['DOS', 'PDOS']
+__all__ += ['DOS_tetrahedron', 'PDOS_tetrahedron']
+__all__ += ['DOS_kpm', 'PDOS_kpm']
 __all__ += ['velocity', 'velocity_matrix']
 __all__ += ['spin_moment', 'inv_eff_mass_tensor', 'berry_phase']
 __all__ += ['wavefunction']
@@ -115,6 +123,9 @@ def DOS(E, eig, distribution='gaussian'):
     if isinstance(distribution, str):
         distribution = get_distribution(distribution)
 
+    # Calculate in the precision of the eigenvalues
+    eig = np.asarray(eig)
+    E = np.asarray(E, dtype=np.result_type(eig.dtype, np.float32))
     DOS = distribution(E - eig[0])
     for i in range(1, len(eig)):
         DOS += distribution(E - eig[i])
@@ -197,6 +208,10 @@ def PDOS(E, eig, state, S=None, distribution='gaussian', spin=None):
     if isinstance(distribution, str):
         distribution = get_distribution(distribution)
 
+    # Calculate in the precision of the eigenstates
+    state = np.asarray(state)
+    E = np.asarray(E, dtype=dtype_complex_to_real(np.result_type(state.dtype, np.float32)))
+
     # Figure out whether we are dealing with a non-collinear calculation
     if S is None:
         class S(object):
@@ -252,6 +267,554 @@ def PDOS(E, eig, state, S=None, distribution='gaussian', spin=None):
     return PDOS
 
 
+def _tetrahedron_de(ei, ej):
+    """ Energy differences of the corners, limited to avoid divergences for (nearly) degenerate corners """
+    return np.maximum(ei - ej, 1e-8)
+
+
+def _tetrahedron_weights(E, eig, bloechl):
+    r""" Weights of the corners of tetrahedra for the density of states at `E`
+
+    Parameters
+    ----------
+    E : float
+       energy
+    eig : (n, 4)
+       sorted energies at the corners of the tetrahedra
+    bloechl : bool
+       whether the Bloechl correction is added
+
+    Returns
+    -------
+    numpy.ndarray : weights with shape ``(n, 4)``, the sum of the corner weights is the DOS of the tetrahedron
+    """
+    w = np.zeros_like(eig)
+    if bloechl:
+        dos1 = np.zeros(len(eig), dtype=eig.dtype)
+    e1, e2, e3, e4 = eig[:, 0], eig[:, 1], eig[:, 2], eig[:, 3]
+
+    # The derivatives of the integration weights for the occupied part of the tetrahedra
+    # (P. E. Bloechl, O. Jepsen and O. K. Andersen, PRB 49, 16223 (1994))
+    i = np.logical_and(e1 <= E, E < e2).nonzero()[0]
+    if len(i) > 0:
+        e1, e2, e3, e4 = eig[i, 0], eig[i, 1], eig[i, 2], eig[i, 3]
+        x = E - e1
+        e21, e31, e41 = _tetrahedron_de(e2, e1), _tetrahedron_de(e3, e1), _tetrahedron_de(e4, e1)
+        C = x ** 3 / (4 * e21 * e31 * e41)
+        dC = 3 * x ** 2 / (4 * e21 * e31 * e41)
+        K = 1 / e21 + 1 / e31 + 1 / e41
+        w[i, 0] = dC * (4 - x * K) - C * K
+        w[i, 1] = (dC * x + C) / e21
+        w[i, 2] = (dC * x + C) / e31
+        w[i, 3] = (dC * x + C) / e41
+        if bloechl:
+            dos1[i] = 6 * x / (e21 * e31 * e41)
+
+    e1, e2, e3, e4 = eig[:, 0], eig[:, 1], eig[:, 2], eig[:, 3]
+    i = np.logical_and(e2 <= E, E < e3).nonzero()[0]
+    if len(i) > 0:
+        e1, e2, e3, e4 = eig[i, 0], eig[i, 1], eig[i, 2], eig[i, 3]
+        x1, x2, y3, y4 = E - e1, E - e2, e3 - E, e4 - E
+        e31, e41 = _tetrahedron_de(e3, e1), _tetrahedron_de(e4, e1)
+        e32, e42 = _tetrahedron_de(e3, e2), _tetrahedron_de(e4, e2)
+        C1 = x1 ** 2 / (4 * e41 * e31)
+        C2 = x1 * x2 * y3 / (4 * e41 * e32 * e31)
+        C3 = x2 ** 2 * y4 / (4 * e42 * e32 * e41)
+        dC1 = x1 / (2 * e41 * e31)
+        dC2 = (x2 * y3 + x1 * y3 - x1 * x2) / (4 * e41 * e32 * e31)
+        dC3 = (2 * x2 * y4 - x2 ** 2) / (4 * e42 * e32 * e41)
+        C12, C23, C123 = C1 + C2, C2 + C3, C1 + C2 + C3
+        dC12, dC23, dC123 = dC1 + dC2, dC2 + dC3, dC1 + dC2 + dC3
+        w[i, 0] = dC1 + dC12 * y3 / e31 - C12 / e31 + dC123 * y4 / e41 - C123 / e41
+        w[i, 1] = dC123 + dC23 * y3 / e32 - C23 / e32 + dC3 * y4 / e42 - C3 / e42
+        w[i, 2] = dC12 * x1 / e31 + C12 / e31 + dC23 * x2 / e32 + C23 / e32
+        w[i, 3] = dC123 * x1 / e41 + C123 / e41 + dC3 * x2 / e42 + C3 / e42
+        if bloechl:
+            dos1[i] = (6 - 6 * (e31 + e42) * x2 / (e32 * e42)) / (e31 * e41)
+
+    e1, e2, e3, e4 = eig[:, 0], eig[:, 1], eig[:, 2], eig[:, 3]
+    i = np.logical_and(e3 <= E, E < e4).nonzero()[0]
+    if len(i) > 0:
+        e1, e2, e3, e4 = eig[i, 0], eig[i, 1], eig[i, 2], eig[i, 3]
+        y = e4 - E
+        e41, e42, e43 = _tetrahedron_de(e4, e1), _tetrahedron_de(e4, e2), _tetrahedron_de(e4, e3)
+        C = y ** 3 / (4 * e41 * e42 * e43)
+        dC = -3 * y ** 2 / (4 * e41 * e42 * e43)
+        K = 1 / e41 + 1 / e42 + 1 / e43
+        w[i, 0] = (C - dC * y) / e41
+        w[i, 1] = (C - dC * y) / e42
+        w[i, 2] = (C - dC * y) / e43
+        w[i, 3] = -dC * (4 - y * K) - C * K
+        if bloechl:
+            dos1[i] = -6 * y / (e41 * e42 * e43)
+
+    if bloechl:
+        # Derivative of the correction: dw_i = DOS(E) / 40 \sum_j (e_j - e_i)
+        w += (dos1 / 40).reshape(-1, 1) * (eig.sum(1).reshape(-1, 1) - 4 * eig)
+    return w
+
+
+def _tetrahedron_occupation(E, eig, bloechl):
+    r""" Integration weights of the corners of tetrahedra for the states below `E`
+
+    Parameters
+    ----------
+    E : float
+       energy
+    eig : (n, 4)
+       sorted energies at the corners of the tetrahedra
+    bloechl : bool
+       whether the Bloechl correction is added
+
+    Returns
+    -------
+    numpy.ndarray : weights with shape ``(n, 4)``, the sum of the corner weights is the occupied fraction of the tetrahedron
+    """
+    w = np.zeros_like(eig)
+    if bloechl:
+        dos = np.zeros(len(eig), dtype=eig.dtype)
+    e1, e2, e3, e4 = eig[:, 0], eig[:, 1], eig[:, 2], eig[:, 3]
+
+    # Fully occupied tetrahedra
+    w[E >= e4, :] = 0.25
+
+    # (P. E. Bloechl, O. Jepsen and O. K. Andersen, PRB 49, 16223 (1994))
+    i = np.logical_and(e1 <= E, E < e2).nonzero()[0]
+    if len(i) > 0:
+        e1, e2, e3, e4 = eig[i, 0], eig[i, 1], eig[i, 2], eig[i, 3]
+        x = E - e1
+        e21, e31, e41 = _tetrahedron_de(e2, e1), _tetrahedron_de(e3, e1), _tetrahedron_de(e4, e1)
+        C = x ** 3 / (4 * e21 * e31 * e41)
+        w[i, 0] = C * (4 - x * (1 / e21 + 1 / e31 + 1 / e41))
+        w[i, 1] = C * x / e21
+        w[i, 2] = C * x / e31
+        w[i, 3] = C * x / e41
+        if bloechl:
+            dos[i] = 3 * x ** 2 / (e21 * e31 * e41)
+
+    e1, e2, e3, e4 = eig[:, 0], eig[:, 1], eig[:, 2], eig[:, 3]
+    i = np.logical_and(e2 <= E, E < e3).nonzero()[0]
+    if len(i) > 0:
+        e1, e2, e3, e4 = eig[i, 0], eig[i, 1], eig[i, 2], eig[i, 3]
+        x1, x2, y3, y4 = E - e1, E - e2, e3 - E, e4 - E
+        e21 = e2 - e1
+        e31, e41 = _tetrahedron_de(e3, e1), _tetrahedron_de(e4, e1)
+        e32, e42 = _tetrahedron_de(e3, e2), _tetrahedron_de(e4, e2)
+        C1 = x1 ** 2 / (4 * e41 * e31)
+        C2 = x1 * x2 * y3 / (4 * e41 * e32 * e31)
+        C3 = x2 ** 2 * y4 / (4 * e42 * e32 * e41)
+        C12, C23, C123 = C1 + C2, C2 + C3, C1 + C2 + C3
+        w[i, 0] = C1 + C12 * y3 / e31 + C123 * y4 / e41
+        w[i, 1] = C123 + C23 * y3 / e32 + C3 * y4 / e42
+        w[i, 2] = C12 * x1 / e31 + C23 * x2 / e32
+        w[i, 3] = C123 * x1 / e41 + C3 * x2 / e42
+        if bloechl:
+            dos[i] = (3 * e21 + 6 * x2 - 3 * (e31 + e42) * x2 ** 2 / (e32 * e42)) / (e31 * e41)
+
+    e1, e2, e3, e4 = eig[:, 0], eig[:, 1], eig[:, 2], eig[:, 3]
+    i = np.logical_and(e3 <= E, E < e4).nonzero()[0]
+    if len(i) > 0:
+        e1, e2, e3, e4 = eig[i, 0], eig[i, 1], eig[i, 2], eig[i, 3]
+        y = e4 - E
+        e41, e42, e43 = _tetrahedron_de(e4, e1), _tetrahedron_de(e4, e2), _tetrahedron_de(e4, e3)
+        C = y ** 3 / (4 * e41 * e42 * e43)
+        w[i, 0] = 0.25 - C * y / e41
+        w[i, 1] = 0.25 - C * y / e42
+        w[i, 2] = 0.25 - C * y / e43
+        w[i, 3] = 0.25 - C * (4 - y * (1 / e41 + 1 / e42 + 1 / e43))
+        if bloechl:
+            dos[i] = 3 * y ** 2 / (e41 * e42 * e43)
+
+    if bloechl:
+        # Correction: dw_i = DOS(E) / 40 \sum_j (e_j - e_i)
+        w += (dos / 40).reshape(-1, 1) * (eig.sum(1).reshape(-1, 1) - 4 * eig)
+    return w
+
+
+def _tetrahedron_index(tetra, eig):
+    """ Sorted corner energies of all tetrahedra and bands, and the corresponding k-point indices
+
+    Returns
+    -------
+    eig : (ntet * nb, 4)
+    idx : (ntet * nb, 4)
+       index into the flattened `eig` (``ik * nb + ib``)
+    """
+    nb = eig.shape[1]
+    # Index of each corner in the flattened eigenvalue array
+    idx = (tetra.reshape(-1, 4, 1) * nb + _a.arangei(nb).reshape(1, 1, -1)).transpose(0, 2, 1).reshape(-1, 4)
+    eig = eig.ravel()[idx]
+    i = (_a.arangei(len(idx)).reshape(-1, 1), np.argsort(eig, axis=1))
+    return eig[i], idx[i]
+
+
+def _fermi_level(eig, w, occupation, q, q_tol=1e-10, max_iter=100):
+    r""" Solve :math:`\sum_i w_i f(\epsilon_i - \mu) = q` for the Fermi-level :math:`\mu`
+
+    The eigenvalues are sorted and the weights cumulated once to find the zero temperature
+    Fermi-level. From this estimate the Fermi-level is bracketed and then refined using
+    the Illinois variant of regula falsi (safeguarded by bisection).
+
+    Parameters
+    ----------
+    eig : numpy.ndarray
+       eigenvalues (of any shape)
+    w : float or numpy.ndarray
+       weights of the eigenvalues (broadcastable to `eig`), the charge of a fully occupied state
+    occupation : callable
+       occupation function ``occupation(eig, mu=mu)``, must be 1 for fully occupied states
+    q : float
+       seeked charge
+    q_tol : float, optional
+       tolerance of charge
+    max_iter : int, optional
+       maximum number of refinement iterations
+
+    Returns
+    -------
+    float : the Fermi-level
+    """
+    E = eig.ravel()
+    idx = np.argsort(E)
+    E = E[idx]
+    cw = np.cumsum(np.broadcast_to(w, eig.shape).ravel()[idx])
+    if q < -q_tol or cw[-1] + q_tol < q:
+        raise ValueError('fermi_level: the charge {} cannot be reached with the states (total {}).'.format(q, cw[-1]))
+
+    def dq(mu):
+        return (occupation(eig, mu=mu) * w).sum() - q
+
+    # Zero temperature Fermi-level, in the middle of a gap if the charge is an integer number of states
+    i = min(np.searchsorted(cw, q - q_tol), len(E) - 1)
+    if abs(cw[i] - q) <= q_tol and i + 1 < len(E):
+        mu = (E[i] + E[i + 1]) / 2
+    else:
+        mu = E[i]
+    f = dq(mu)
+    if abs(f) <= q_tol:
+        return mu
+
+    # Bracket the Fermi-level, for q equal to the empty (full) charge the charge
+    # only converges (within the tolerance) far below (above) the states
+    step = max(E[-1] - E[0], 1.) * 1e-3
+    lo, f_lo, hi, f_hi = mu, f, mu, f
+    while f_lo > q_tol:
+        hi, f_hi = lo, f_lo
+        lo = lo - step
+        step *= 2
+        f_lo = dq(lo)
+        if not np.isfinite(lo):
+            raise ValueError('fermi_level: could not bracket the charge {}, lowest charge is {}.'.format(q, f_hi + q))
+    while f_hi < -q_tol:
+        lo, f_lo = hi, f_hi
+        hi = hi + step
+        step *= 2
+        f_hi = dq(hi)
+        if not np.isfinite(hi):
+            raise ValueError('fermi_level: could not bracket the charge {}, highest charge is {}.'.format(q, f_lo + q))
+
+    side = 0
+    for _ in range(max_iter):
+        if abs(f_lo) <= q_tol:
+            return lo
+        elif abs(f_hi) <= q_tol:
+            return hi
+        mu = hi - f_hi * (hi - lo) / (f_hi - f_lo)
+        if not lo < mu < hi:
+            mu = (lo + hi) / 2
+        f = dq(mu)
+        if f < 0:
+            lo, f_lo = mu, f
+            if side < 0:
+                f_hi /= 2
+            side = -1
+        else:
+            hi, f_hi = mu, f
+            if side > 0:
+                f_lo /= 2
+            side = 1
+        if hi - lo <= np.spacing(abs(mu)) * 4:
+            break
+    if abs(f) > q_tol:
+        warn('fermi_level: did not converge the charge to {} (error {}).'.format(q_tol, abs(f)))
+    return mu
+
+
+def DOS_tetrahedron(E, eig, mp, bloechl=False):
+    r""" Calculate the density of states (DOS) using the linear tetrahedron method
+
+    Contrary to `DOS` the eigenvalues are linearly interpolated between the k-points
+    of the Monkhorst-Pack grid. This converges the DOS with much coarser k-point grids.
+    The DOS is normalized as the Brillouin zone average, i.e. the integrated DOS
+    equals the number of bands.
+
+    Parameters
+    ----------
+    E : array_like
+       energies to calculate the DOS at
+    eig : array_like
+       electronic eigenvalues at the k-points in `mp`, shape ``(len(mp), nb)``, e.g.
+       ``mp.asarray().eigh()``
+    mp : MonkhorstPack
+       the Monkhorst-Pack grid the eigenvalues are calculated at (may be reduced by symmetry)
+    bloechl : bool, optional
+       add the Bloechl correction of the linear interpolation. This does not change
+       the total DOS.
+
+    See Also
+    --------
+    DOS : DOS calculated using a distribution function
+    PDOS_tetrahedron : projected DOS using the linear tetrahedron method
+    sisl.physics.MonkhorstPack.tetrahedra : the tetrahedra of the Monkhorst-Pack grid
+
+    Returns
+    -------
+    numpy.ndarray : DOS calculated at energies, has same length as `E`
+    """
+    E = _a.asarrayd(E).ravel()
+    tetra = mp.tetrahedra()
+    eig, _ = _tetrahedron_index(tetra, _a.asarrayd(eig).reshape(len(mp), -1))
+    # All tetrahedra have the same volume
+    DOS = _a.emptyd(len(E))
+    for ie, e in enumerate(E):
+        DOS[ie] = _tetrahedron_weights(e, eig, bloechl).sum()
+    return DOS / len(tetra)
+
+
+def PDOS_tetrahedron(E, eig, weight, mp, bloechl=False):
+    r""" Calculate the projected density of states (PDOS) using the linear tetrahedron method
+
+    The projections onto the orbitals are linearly interpolated together with the
+    eigenvalues between the k-points of the Monkhorst-Pack grid, see `DOS_tetrahedron`.
+
+    Parameters
+    ----------
+    E : array_like
+       energies to calculate the projected-DOS from
+    eig : array_like
+       electronic eigenvalues at the k-points in `mp`, shape ``(len(mp), nb)``
+    weight : array_like
+       projections of the states at the k-points in `mp`, shape ``(len(mp), nb, ...)``, e.g.
+       :math:`\psi^*_{i,\nu} [\mathbf S | \psi_{i}\rangle]_\nu` as returned by ``mp.asarray().eigenstate(wrap=lambda es: es.norm2(False))``.
+       For symmetry reduced grids the projections are assumed equal for equivalent k-points.
+    mp : MonkhorstPack
+       the Monkhorst-Pack grid the eigenvalues are calculated at
+    bloechl : bool, optional
+       add the Bloechl correction of the linear interpolation.
+
+    See Also
+    --------
+    PDOS : PDOS calculated using a distribution function
+    DOS_tetrahedron : total DOS using the linear tetrahedron method
+
+    Returns
+    -------
+    numpy.ndarray
+        projected DOS calculated at energies, has dimension ``weight.shape[2:] + (len(E),)``
+    """
+    E = _a.asarrayd(E).ravel()
+    tetra = mp.tetrahedra()
+    eig = _a.asarrayd(eig).reshape(len(mp), -1)
+    weight = np.asarray(weight)
+    shape = weight.shape[2:]
+    weight = weight.reshape(eig.size, -1)
+    eig, idx = _tetrahedron_index(tetra, eig)
+
+    PDOS = np.empty([weight.shape[1], len(E)], dtype=dtype_complex_to_real(weight.dtype))
+    for ie, e in enumerate(E):
+        # Sum corner weights for each of the k-points and bands
+        w = np.bincount(idx.ravel(), _tetrahedron_weights(e, eig, bloechl).ravel(), minlength=len(weight))
+        PDOS[:, ie] = dot(w, weight).real
+    return PDOS.reshape(shape + (len(E),)) / len(tetra)
+
+
+def _kpm_kernel(N, kernel):
+    """ Damping factors of the Chebyshev moments for the kernel polynomial method """
+    if callable(kernel):
+        return kernel(N)
+    n = _a.aranged(N)
+    if kernel == 'jackson':
+        q = pi / (N + 1)
+        return ((N - n + 1) * cos(q * n) + sin(q * n) / tan(q)) / (N + 1)
+    elif kernel == 'lorentz':
+        l = 4.
+        return sinh(l * (1 - n / N)) / sinh(l)
+    raise ValueError("kpm: unknown kernel '{}', must be one of [jackson, lorentz]".format(kernel))
+
+
+def _kpm_matrix(H, k, bounds, kwargs):
+    """ Sparse Hamiltonian at `k` scaled to the spectrum ``[-1, 1]``, and the scaling (``E = a x + b``) """
+    if not H.orthogonal:
+        raise ValueError("kpm: the kernel polynomial method requires an orthogonal basis")
+    M = H.Hk(k, dtype=complex128, format='csr', **kwargs)
+    if bounds is None:
+        # Gershgorin discs bound the spectrum
+        d = M.diagonal().real
+        r = _a.asarrayd(abs(M).sum(1)).ravel() - abs(d)
+        bounds = (d - r).min(), (d + r).max()
+    # Small margin to stay within the convergence radius
+    a = (bounds[1] - bounds[0]) / (2 - 0.02)
+    b = (bounds[1] + bounds[0]) / 2
+    M = (M - identity(M.shape[0], dtype=M.dtype, format='csr') * b) * (1 / a)
+    return M.tocsr(), a, b
+
+
+def _kpm_moments(M, V, N, rows=None):
+    r""" Chebyshev moments :math:`\mu_n = \sum_r\langle v_r|T_n(\mathbf M)|v_r\rangle` of the vectors (columns) `V`
+
+    If `rows` is ``None`` the trace moments are calculated (2 moments per matrix-vector product),
+    otherwise the moments of the diagonal elements `rows`, :math:`\sum_r v^*_{ir}[T_n(\mathbf M) v_r]_i`
+    with shape ``(N, len(rows))``.
+    """
+    a0 = V
+    a1 = M.dot(V)
+    if rows is None:
+        mu = _a.emptyd(N)
+        mu[0] = vdot(V, V).real
+        if N > 1:
+            mu[1] = vdot(V, a1).real
+        n = 1
+        while 2 * n < N:
+            mu[2 * n] = 2 * vdot(a1, a1).real - mu[0]
+            if 2 * n + 1 < N:
+                a2 = M.dot(a1)
+                a2 *= 2
+                a2 -= a0
+                mu[2 * n + 1] = 2 * vdot(a2, a1).real - mu[1]
+                a0, a1 = a1, a2
+            n += 1
+        return mu
+
+    Vr = conj(V[rows])
+    mu = _a.emptyd([N, len(rows)])
+    mu[0] = (Vr * V[rows]).sum(1).real
+    if N > 1:
+        mu[1] = (Vr * a1[rows]).sum(1).real
+    for n in range(2, N):
+        a2 = M.dot(a1)
+        a2 *= 2
+        a2 -= a0
+        mu[n] = (Vr * a2[rows]).sum(1).real
+        a0, a1 = a1, a2
+    return mu
+
+
+def _kpm_reconstruct(E, mu, a, b, kernel):
+    """ DOS from the Chebyshev moments `mu` (first dimension), the energy is the last dimension """
+    N = mu.shape[0]
+    x = (_a.asarrayd(E).ravel() - b) / a
+    DOS = np.zeros(mu.shape[1:] + x.shape)
+    idx = (np.abs(x) < 1).nonzero()[0]
+    T = cos(np.outer(_a.aranged(N), arccos(x[idx])))
+    T[1:] *= 2
+    mu = mu * _kpm_kernel(N, kernel).reshape((-1,) + (1,) * (mu.ndim - 1))
+    DOS[..., idx] = np.tensordot(mu, T, axes=(0, 0)) / (pi * a * sqrt(1 - x[idx] ** 2))
+    return DOS
+
+
+def _kpm_random(no, R):
+    """ Random phase vectors (columns) """
+    return np.exp(2j * pi * np.random.rand(no, R))
+
+
+def DOS_kpm(E, H, k=(0, 0, 0), N=256, R=16, kernel='jackson', bounds=None, **kwargs):
+    r""" Calculate the density of states (DOS) using the kernel polynomial method (KPM)
+
+    The DOS is expanded in :math:`N` Chebyshev polynomials of the (scaled) Hamiltonian, the
+    trace of the moments is estimated stochastically from `R` random phase vectors. Only sparse
+    matrix-vector products are required, hence the computational cost scales linearly with the number
+    of orbitals. The energy resolution is roughly :math:`\pi\Delta/N` (Jackson kernel)
+    where :math:`\Delta` is the spectral width.
+
+    The DOS is normalized as `DOS`, i.e. the integrated DOS equals the number of orbitals.
+    Brillouin zone averages may be calculated using the `BrillouinZone` calls, e.g.
+    ``bz.asaverage().call(DOS_kpm, E, H)``.
+
+    Parameters
+    ----------
+    E : array_like
+       energies to calculate the DOS at
+    H : Hamiltonian
+       an orthogonal Hamiltonian
+    k : array_like, optional
+       k-point of the Hamiltonian
+    N : int, optional
+       number of Chebyshev moments
+    R : int, optional
+       number of random vectors used for the stochastic trace
+    kernel : {'jackson', 'lorentz'} or callable, optional
+       kernel used to damp the Gibbs oscillations, a callable must return the damping factors
+       of the `N` moments. The Lorentz kernel (:math:`\lambda=4`) mimics a Lorentzian broadening.
+    bounds : (2,) of float, optional
+       lower and upper bound of the spectrum, defaults to the Gershgorin bounds
+    **kwargs : dict, optional
+       passed to `Hamiltonian.Hk` (e.g. ``spin``)
+
+    See Also
+    --------
+    DOS : DOS calculated from the eigenvalues
+    PDOS_kpm : projected DOS using the kernel polynomial method
+
+    Returns
+    -------
+    numpy.ndarray : DOS calculated at energies, has same length as `E`
+    """
+    M, a, b = _kpm_matrix(H, k, bounds, kwargs)
+    mu = _kpm_moments(M, _kpm_random(M.shape[0], R), N) / R
+    return _kpm_reconstruct(E, mu, a, b, kernel)
+
+
+def PDOS_kpm(E, H, k=(0, 0, 0), N=256, R=16, orbitals=None, kernel='jackson', bounds=None, **kwargs):
+    r""" Calculate the projected (local) density of states (PDOS) using the kernel polynomial method (KPM)
+
+    For a subset of `orbitals` the moments of the diagonal elements are calculated exactly (one
+    vector per orbital), otherwise the diagonal of all orbitals is estimated stochastically
+    from `R` random phase vectors (requiring larger `R` for the same accuracy as `DOS_kpm`).
+
+    Parameters
+    ----------
+    E : array_like
+       energies to calculate the PDOS at
+    H : Hamiltonian
+       an orthogonal Hamiltonian
+    k : array_like, optional
+       k-point of the Hamiltonian
+    N : int, optional
+       number of Chebyshev moments
+    R : int, optional
+       number of random vectors used for the stochastic diagonal (not used if `orbitals` is specified)
+    orbitals : array_like of int, optional
+       orbitals to calculate the PDOS of (exactly), defaults to a stochastic estimate of all orbitals
+    kernel : {'jackson', 'lorentz'} or callable, optional
+       kernel used to damp the Gibbs oscillations, see `DOS_kpm`
+    bounds : (2,) of float, optional
+       lower and upper bound of the spectrum, defaults to the Gershgorin bounds
+    **kwargs : dict, optional
+       passed to `Hamiltonian.Hk` (e.g. ``spin``)
+
+    See Also
+    --------
+    PDOS : PDOS calculated from the eigenstates
+    DOS_kpm : total DOS using the kernel polynomial method
+
+    Returns
+    -------
+    numpy.ndarray
+        projected DOS calculated at energies, has dimension ``(len(orbitals), len(E))``
+    """
+    M, a, b = _kpm_matrix(H, k, bounds, kwargs)
+    no = M.shape[0]
+    if orbitals is None:
+        rows = _a.arangei(no)
+        mu = _kpm_moments(M, _kpm_random(no, R), N, rows) / R
+    else:
+        rows = _a.asarrayi(orbitals).ravel()
+        V = np.zeros([no, len(rows)], dtype=complex128)
+        V[rows, _a.arangei(len(rows))] = 1.
+        mu = _kpm_moments(M, V, N, rows)
+    return _kpm_reconstruct(E, mu, a, b, kernel)
+
+
 def spin_moment(state, S=None):
     r""" Calculate the spin magnetic moment (also known as spin texture)
 
@@ -1224,6 +1787,7 @@ class _electron_State(object):
             # Calculate the overlap matrix
             if not self.parent.orthogonal:
                 opt = {'k': self.info.get('k', (0, 0, 0)),
+                       'dtype': self.dtype,
                        'format': format}
                 gauge = self.info.get('gauge', None)
                 if not gauge is None:
@@ -1436,7 +2000,7 @@ class StateCElectron(_electron_State, StateC):
            precision used to find degenerate states.
         """
         try:
-            opt = {'k': self.info.get('k', (0, 0, 0))}
+            opt = {'k': self.info.get('k', (0, 0, 0)), 'dtype': self.dtype}
             gauge = self.info.get('gauge', None)
             if not gauge is None:
                 opt['gauge'] = gauge
@@ -1472,7 +2036,7 @@ class StateCElectron(_electron_State, StateC):
            precision used to find degenerate states.
         """
         try:
-            opt = {'k': self.info.get('k', (0, 0, 0))}
+            opt = {'k': self.info.get('k', (0, 0, 0)), 'dtype': self.dtype}
             gauge = self.info.get('gauge', None)
             if not gauge is None:
                 opt['gauge'] = gauge
@@ -1521,7 +2085,7 @@ class StateCElectron(_electron_State, StateC):
             # Ensure we are dealing with the r gauge
             self.change_gauge('r')
 
-            opt = {'k': self.info.get('k', (0, 0, 0))}
+            opt = {'k': self.info.get('k', (0, 0, 0)), 'dtype': self.dtype}
             gauge = self.info.get('gauge', None)
             if not gauge is None:
                 opt['gauge'] = gauge
@@ -83,6 +83,9 @@ class EnergyDensityMatrix(_realspace_DensityMatrix):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : numpy.ndarray, optional
+           only for ``format='array'``; an array (with the shape and data-type of the
+           returned array) which is filled and returned, allowing memory to be reused
         spin : int, optional
            if the energy density matrix is a spin polarized one can extract the specific spin direction
            matrix by passing an integer (0 or 1). If the energy density matrix is not `Spin.POLARIZED`
@@ -137,6 +140,9 @@ class EnergyDensityMatrix(_realspace_DensityMatrix):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : sequence of numpy.ndarray, optional
+           only for ``format='array'``; 3 arrays (with the shape and data-type of the
+           returned arrays) which are filled and returned, allowing memory to be reused
         spin : int, optional
            if the energy density matrix is a spin polarized one can extract the specific spin direction
            matrix by passing an integer (0 or 1). If the energy density matrix is not `Spin.POLARIZED`
@@ -191,6 +197,9 @@ class EnergyDensityMatrix(_realspace_DensityMatrix):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : sequence of numpy.ndarray, optional
+           only for ``format='array'``; 6 arrays (with the shape and data-type of the
+           returned arrays) which are filled and returned, allowing memory to be reused
         spin : int, optional
            if the energy density matrix is a spin polarized one can extract the specific spin direction
            matrix by passing an integer (0 or 1). If the energy density matrix is not `Spin.POLARIZED`
@@ -6,6 +6,7 @@ from sisl._help import _range as range
 import sisl._array as _a
 from .distribution import get_distribution
 from .electron import EigenvalueElectron, EigenstateElectron
+from .electron import _tetrahedron_index, _tetrahedron_occupation, _fermi_level
 from .sparse import SparseOrbitalBZSpin
 
 __all__ = ['Hamiltonian']
@@ -76,7 +77,10 @@ class Hamiltonian(SparseOrbitalBZSpin):
         Parameters
         ----------
         k : array_like
-           the k-point to setup the Hamiltonian at
+           the k-point to setup the Hamiltonian at.
+           For an ``(nk, 3)`` array the Hamiltonian is calculated for all k-points
+           in one pass. With ``format='array'`` the returned array has shape
+           ``(nk, no, no)``, otherwise a list of matrices is returned.
         dtype : numpy.dtype , optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
@@ -88,6 +92,9 @@ class Hamiltonian(SparseOrbitalBZSpin):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : numpy.ndarray, optional
+           only for ``format='array'``; an array (with the shape and data-type of the
+           returned array) which is filled and returned, allowing memory to be reused
         spin : int, optional
            if the Hamiltonian is a spin polarized one can extract the specific spin direction
            matrix by passing an integer (0 or 1). If the Hamiltonian is not `Spin.POLARIZED`
@@ -130,7 +137,10 @@ class Hamiltonian(SparseOrbitalBZSpin):
         Parameters
         ----------
         k : array_like
-           the k-point to setup the Hamiltonian at
+           the k-point to setup the Hamiltonian at.
+           For an ``(nk, 3)`` array the derivatives are calculated for all k-points.
+           With ``format='array'`` each direction has shape ``(nk, no, no)``,
+           otherwise a list with the derivatives for each k-point is returned.
         dtype : numpy.dtype , optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
@@ -142,6 +152,9 @@ class Hamiltonian(SparseOrbitalBZSpin):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : sequence of numpy.ndarray, optional
+           only for ``format='array'``; 3 arrays (with the shape and data-type of the
+           returned arrays) which are filled and returned, allowing memory to be reused
         spin : int, optional
            if the Hamiltonian is a spin polarized one can extract the specific spin direction
            matrix by passing an integer (0 or 1). If the Hamiltonian is not `Spin.POLARIZED`
@@ -184,7 +197,10 @@ class Hamiltonian(SparseOrbitalBZSpin):
         Parameters
         ----------
         k : array_like
-           the k-point to setup the Hamiltonian at
+           the k-point to setup the Hamiltonian at.
+           For an ``(nk, 3)`` array the derivatives are calculated for all k-points.
+           With ``format='array'`` each direction has shape ``(nk, no, no)``,
+           otherwise a list with the derivatives for each k-point is returned.
         dtype : numpy.dtype , optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
@@ -196,6 +212,9 @@ class Hamiltonian(SparseOrbitalBZSpin):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'dense'`).
+        out : sequence of numpy.ndarray, optional
+           only for ``format='array'``; 6 arrays (with the shape and data-type of the
+           returned arrays) which are filled and returned, allowing memory to be reused
         spin : int, optional
            if the Hamiltonian is a spin polarized one can extract the specific spin direction
            matrix by passing an integer (0 or 1). If the Hamiltonian is not `Spin.POLARIZED`
@@ -264,7 +283,9 @@ class Hamiltonian(SparseOrbitalBZSpin):
         Parameters
         ----------
         k : array_like*3, optional
-            the k-point at which to evaluate the eigenvalues at
+            the k-point at which to evaluate the eigenvalues at, for a list of k-points
+            (shape ``(nk, 3)``) all k-points are diagonalized in one batch and a list
+            with an `EigenvalueElectron` per k-point is returned
         gauge : str, optional
             the gauge used for calculating the eigenvalues
         sparse : bool, optional
@@ -286,11 +307,12 @@ class Hamiltonian(SparseOrbitalBZSpin):
             e = self.eigsh(k, gauge=gauge, eigvals_only=True, **kwargs)
         else:
             e = self.eigh(k, gauge, eigvals_only=True, **kwargs)
-        info = {'k': k,
-                'gauge': gauge}
+        info = {'gauge': gauge}
         if 'spin' in kwargs:
             info['spin'] = kwargs['spin']
-        return EigenvalueElectron(e, self, **info)
+        if np.ndim(k) == 2:
+            return [EigenvalueElectron(ek, self, k=kk, **info) for kk, ek in zip(k, e)]
+        return EigenvalueElectron(e, self, k=k, **info)
 
     def eigenstate(self, k=(0, 0, 0), gauge='R', **kwargs):
         """ Calculate the eigenstates at `k` and return an `EigenstateElectron` object containing all eigenstates
@@ -298,7 +320,9 @@ class Hamiltonian(SparseOrbitalBZSpin):
         Parameters
         ----------
         k : array_like*3, optional
-            the k-point at which to evaluate the eigenstates at
+            the k-point at which to evaluate the eigenstates at, for a list of k-points
+            (shape ``(nk, 3)``) all k-points are diagonalized in one batch and a list
+            with an `EigenstateElectron` per k-point is returned
         gauge : str, optional
             the gauge used for calculating the eigenstates
         sparse : bool, optional
@@ -320,11 +344,13 @@ class Hamiltonian(SparseOrbitalBZSpin):
             e, v = self.eigsh(k, gauge=gauge, eigvals_only=False, **kwargs)
         else:
             e, v = self.eigh(k, gauge, eigvals_only=False, **kwargs)
-        info = {'k': k, 'gauge': gauge}
+        info = {'gauge': gauge}
         if 'spin' in kwargs:
             info['spin'] = kwargs['spin']
         # Since eigh returns the eigenvectors [:, i] we have to transpose
-        return EigenstateElectron(v.T, e, self, **info)
+        if np.ndim(k) == 2:
+            return [EigenstateElectron(vk.T, ek, self, k=kk, **info) for kk, ek, vk in zip(k, e, v)]
+        return EigenstateElectron(v.T, e, self, k=k, **info)
 
     @staticmethod
     def read(sile, *args, **kwargs):
@@ -426,15 +452,18 @@ class Hamiltonian(SparseOrbitalBZSpin):
     def fermi_level(self, bz, distribution='fermi_dirac', q=None, q_tol=1e-10):
         """ Calculate the Fermi-level using a Brillouinzone sampling and a target charge
 
-        The Fermi-level will be calculated using an iterative approach by first calculating all eigenvalues
-        and subsequently fitting the Fermi level to the final charge (`q`).
+        The Fermi-level will be calculated by first calculating all eigenvalues and subsequently
+        fitting the Fermi level to the final charge (`q`). The zero temperature Fermi-level brackets
+        the solution which is then refined using a safeguarded secant method.
 
         Parameters
         ----------
         bz : Brillouinzone
             sampled k-points and weights, the ``bz.parent`` will be equal to this object upon return
         distribution : str, func
-            used distribution, must accept the keyword ``mu`` as parameter for the Fermi-level
+            used distribution, must accept the keyword ``mu`` as parameter for the Fermi-level.
+            If ``'tetrahedron'`` the charge is integrated using the linear tetrahedron method
+            which requires `bz` to be a `MonkhorstPack` grid, see `sisl.physics.electron.DOS_tetrahedron`.
         q : float, optional
             seeked charge, if not set will be equal to ``self.geometry.q0``.
         q_tol : float, optional
@@ -450,7 +479,10 @@ class Hamiltonian(SparseOrbitalBZSpin):
         if q is None:
             q = self.geometry.q0
 
-        if isinstance(distribution, str):
+        tetrahedron = distribution == 'tetrahedron'
+        if tetrahedron:
+            tetra = bz.tetrahedra()
+        elif isinstance(distribution, str):
             distribution = get_distribution(distribution)
 
         # We have two cases, either a spin-polarized calculation, or all others.
@@ -459,23 +491,18 @@ class Hamiltonian(SparseOrbitalBZSpin):
             # We need both spin eigenvalues
             eig = np.stack([bz.asarray().eigh(spin=0),
                             bz.asarray().eigh(spin=1)], axis=1)
+            w = bz.weight.reshape(-1, 1, 1)
         else:
             eig = bz.asarray().eigh()
-        w = bz.weight.reshape(-1, 1)
-
-        # Find Fermi-level
-        E_min = eig.min()
-        E_max = eig.max()
-
-        # We start by guessing on 10 (so we can faster move down)
-        Ef = 10.
-        qt = (distribution(eig, mu=Ef) * w).sum()
-        while abs(qt - q) > q_tol:
-            if qt > q:
-                E_max = Ef
-            elif qt < q:
-                E_min = Ef
-            Ef = (E_min + E_max) / 2
-            qt = (distribution(eig, mu=Ef) * w).sum()
-
-        return Ef
+            w = bz.weight.reshape(-1, 1)
+
+        if tetrahedron:
+            # Linearly interpolated occupations, all tetrahedra have the same volume
+            # and each corner holds a quarter of the tetrahedron
+            eig, _ = _tetrahedron_index(tetra, eig.reshape(len(bz), -1))
+            w = 0.25 / len(tetra)
+
+            def distribution(eig, mu):
+                return _tetrahedron_occupation(mu, eig, False) * 4
+
+        return _fermi_level(eig, w, distribution, q, q_tol)
@@ -1,26 +1,162 @@
 from __future__ import print_function, division
 
+import os
+import hashlib
+from glob import glob
+from functools import partial
+
 import numpy as np
 from numpy import dot, amax, conjugate
-from numpy import subtract
-from numpy import empty, zeros_like, empty_like, identity
-from numpy import complex128
+from numpy import add, subtract, multiply, negative
+from numpy import empty, zeros, identity
 from numpy import abs as _abs
+from scipy.sparse.linalg import splu
 
 from sisl.messages import warn, info
+from sisl._help import dtype_complex_to_real, dtype_real_to_complex, _imap
+from sisl._help import _range as range
+from sisl.sparse_geometry import _SparseGeometry
 from sisl.utils.mathematics import fnorm
 from sisl.utils.ranges import array_arange
 import sisl._array as _a
 import sisl.linalg as lin
-from sisl.linalg import solve, inv
+from sisl.linalg import solve, inv, eig_destroy
 from sisl.physics.brillouinzone import BrillouinZone, MonkhorstPack
 from sisl.physics.bloch import Bloch
+from sisl.physics.sparse import _dtype
 
 
 __all__ = ['SelfEnergy', 'SemiInfinite']
 __all__ += ['RecursiveSI', 'RealSpaceSE']
 
 
+def _hash_update(h, *args):
+    """ Update the hash `h` with the content of all arguments """
+    for arg in args:
+        if isinstance(arg, _SparseGeometry):
+            g = arg.geometry
+            _hash_update(h, arg.__class__.__name__, arg.orthogonal, g.cell, g.xyz, g.nsc, g.lasto)
+            for dim in range(arg.dim):
+                csr = arg.tocsr(dim)
+                csr.sort_indices()
+                _hash_update(h, csr.shape, csr.indptr, csr.indices, csr.data)
+        elif isinstance(arg, np.ndarray):
+            h.update('{}{}'.format(arg.dtype.str, arg.shape).encode())
+            h.update(np.ascontiguousarray(arg).tobytes())
+        else:
+            h.update(repr(arg).encode())
+
+
+def _bloch_block(bloch, func, k, idx):
+    """ Rows and columns `idx` of the Bloch unfolded matrix of ``func(k=...)`` at `k`
+
+    Equivalent to ``bloch(func, k)[idx, idx.T]`` without creating the full unfolded matrix, only
+    one folded matrix is kept at a time.
+    """
+    B = bloch.bloch
+    M = None
+    K_unfold = bloch.unfold_points(k)
+    for K in K_unfold:
+        m = func(k=K)
+        if M is None:
+            # Unfolded cell (first lattice vector fastest) and folded index of the rows/columns
+            cell, i = np.divmod(idx, m.shape[0])
+            R = np.stack([cell % B[0], cell // B[0] % B[1], cell // (B[0] * B[1])], axis=1)
+            i = i.reshape(-1, 1)
+            M = zeros([len(idx), len(idx)], dtype=dtype_real_to_complex(m.dtype))
+        phase = np.exp(2j * np.pi * dot(R, K))
+        M += conjugate(phase).reshape(-1, 1) * m[i, i.T] * phase.reshape(1, -1)
+    M /= len(K_unfold)
+    return M
+
+
+def _schur_complement(A, idx, chunk=256):
+    """ Dense Schur complement ``A[idx, idx] - A[idx, I] A[I, I]^-1 A[I, idx]`` of the sparse matrix `A`
+
+    The remaining indices ``I`` are removed using a sparse LU factorization, the right-hand sides
+    are solved in chunks of `chunk` columns to limit the memory usage.
+    """
+    I = np.delete(_a.arangei(A.shape[0]), idx)
+    S = A[idx, :][:, idx].toarray()
+    if len(I) == 0:
+        return S
+    ACI = A[idx, :][:, I]
+    AIC = A[I, :][:, idx].tocsc()
+    lu = splu(A[I, :][:, I].tocsc())
+    for i in range(0, len(idx), chunk):
+        S[:, i:i + chunk] -= ACI.dot(lu.solve(AIC[:, i:i + chunk].toarray()))
+    return S
+
+
+class _SelfEnergyCache(object):
+    """ Persistent on-disk cache of self-energies (or Green functions)
+
+    Each entry is stored in a separate ``.npy`` file named by its key. Entries are
+    evicted in least-recently-used order (by modification time, which is updated upon access)
+    when the total size exceeds `max_size`.
+    """
+
+    def __init__(self, path, max_size):
+        self.path = path
+        self.max_size = max_size
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    @staticmethod
+    def key(content, *args):
+        """ Key of an entry from the (copied) hash of the content and additional arguments """
+        h = content.copy()
+        _hash_update(h, *args)
+        return h.hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key + '.npy')
+
+    def get(self, key):
+        """ Return the stored entry for `key`, or ``None`` if not present """
+        f = self._file(key)
+        try:
+            value = np.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        # Mark as recently used
+        os.utime(f, None)
+        return value
+
+    def set(self, key, value):
+        """ Store `value` for `key` and evict entries if the cache is too big """
+        f = self._file(key)
+        tmp = f + '.{}.tmp'.format(os.getpid())
+        with open(tmp, 'wb') as fh:
+            np.save(fh, value)
+        # Atomic replacement so concurrent readers never see partial files
+        os.rename(tmp, f)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for f in glob(os.path.join(self.path, '*.npy')):
+            try:
+                st = os.stat(f)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, f))
+        size = sum(e[1] for e in entries)
+        for _, fsize, f in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(f)
+            except OSError:
+                pass
+            size -= fsize
+
+    def clear(self):
+        """ Remove all entries """
+        for f in glob(os.path.join(self.path, '*.npy')):
+            os.remove(f)
+
+
 class SelfEnergy(object):
     """ Self-energy object able to calculate the dense self-energy for a given sparse matrix
 
@@ -29,6 +165,7 @@ class SelfEnergy(object):
 
     This is the base class for self-energies.
     """
+    _cache = None
 
     def __init__(self, *args, **kwargs):
         """ Self-energy class for constructing a self-energy. """
@@ -41,6 +178,66 @@ class SelfEnergy(object):
     def self_energy(self, E):
         raise NotImplementedError
 
+    def set_cache(self, path=None, max_size=1024 ** 3):
+        """ Store the calculated self-energies in a persistent on-disk cache
+
+        Results are looked up by a hash of the matrices of this object, the energy (including
+        the imaginary part), the k-point and the other arguments of the calculation.
+        Hence repeated calculations (also in other sessions) are read from disk.
+        The least recently used entries are removed when the cache exceeds `max_size`.
+
+        Parameters
+        ----------
+        path : str, optional
+           directory of the cache (created if it does not exist), several objects may share the directory.
+           If ``None`` caching is disabled.
+        max_size : int, optional
+           maximum size of the cache in bytes
+
+        Examples
+        --------
+        >>> SE = RecursiveSI(H, '-A').set_cache('se_cache') # doctest: +SKIP
+        >>> SE.self_energy(np.linspace(-1, 1, 100)) # doctest: +SKIP
+
+        Returns
+        -------
+        self : to allow chaining
+        """
+        if path is None:
+            self._cache = None
+        else:
+            self._cache = _SelfEnergyCache(path, max_size)
+        return self
+
+    def _cache_content(self, h):
+        """ Update the hash `h` with the content defining the self-energies of this object """
+        raise NotImplementedError
+
+    def _cache_key(self, E, **kwargs):
+        """ Items of the cache key at the energy `E` for the keyword arguments passed to `_cache_call` """
+        return tuple(sorted(kwargs.items()))
+
+    def _cache_call(self, name, func, E, *args, **kwargs):
+        """ Call ``func(E, *args, **kwargs)`` for the energies not found in the cache
+
+        The entries are keyed by `name`, each energy in `E`, `args` and the items returned by
+        `_cache_key` for `kwargs`. The results are stacked along the first dimension.
+        """
+        cache = self._cache
+        if cache is None:
+            return func(E, *args, **kwargs)
+
+        content = hashlib.sha1()
+        self._cache_content(content)
+        keys = [cache.key(content, name, complex(e), *(args + self._cache_key(e, **kwargs))) for e in E]
+        values = [cache.get(key) for key in keys]
+        miss = [i for i, v in enumerate(values) if v is None]
+        if len(miss) > 0:
+            for i, v in zip(miss, func(E[miss], *args, **kwargs)):
+                cache.set(keys[i], v)
+                values[i] = v
+        return np.stack(values)
+
     def __getattr__(self, attr):
         """ Overload attributes from the hosting object """
         pass
@@ -112,7 +309,29 @@ class SemiInfinite(SelfEnergy):
 
 
 class RecursiveSI(SemiInfinite):
-    """ Self-energy object using the Lopez-Sancho Lopez-Sancho algorithm """
+    """ Self-energy object using the Lopez-Sancho Lopez-Sancho algorithm
+
+    Alternatively the self-energy may be calculated from the eigenmodes of the
+    transfer matrix which requires a single generalized eigenvalue problem (of twice the electrode size).
+    This is much faster than the recursion for small imaginary parts of the energy.
+
+    Parameters
+    ----------
+    spgeom : SparseGeometry
+       any sparse geometry matrix which may return matrices
+    infinite : str
+       axis specification for the semi-infinite direction (`+A`/`-A`/`+B`/`-B`/`+C`/`-C`)
+    eta : float, optional
+       the default imaginary part of the self-energy calculation
+    method : {'sancho', 'transfer', 'auto'}
+       the default algorithm, the Lopez-Sancho recursion (``'sancho'``) or the transfer matrix
+       (``'transfer'``). ``'auto'`` uses the transfer matrix for small imaginary parts
+       of the energy and electrodes with less than 500 orbitals, otherwise the Lopez-Sancho recursion.
+    """
+
+    def __init__(self, spgeom, infinite, eta=1e-6, method='sancho'):
+        self.method = method
+        super(RecursiveSI, self).__init__(spgeom, infinite, eta)
 
     def __getattr__(self, attr):
         """ Overload attributes from the hosting object """
@@ -161,204 +380,367 @@ class RecursiveSI(SemiInfinite):
         # Delete all values in columns, but keep them to retain the supercell information
         self.spgeom1._csr.delete_columns(cols, keep_shape=True)
 
-    def self_energy(self, E, k=None, dtype=None, eps=1e-14, bulk=False):
-        r""" Return a dense matrix with the self-energy at energy `E` and k-point `k` (default Gamma).
-
-        Parameters
-        ----------
-        E : float/complex
-          energy at which the calculation will take place
-        k : array_like, optional
-          k-point at which the self-energy should be evaluated.
-          the k-point should be in units of the reciprocal lattice vectors, and
-          the semi-infinite component will be automatically set to zero.
-        dtype : numpy.dtype
-          the resulting data type
-        eps : float, optional
-          convergence criteria for the recursion
-        bulk : bool, optional
-          if true, :math:`E\cdot \mathbf S - \mathbf H -\boldsymbol\Sigma` is returned, else
-          :math:`\boldsymbol\Sigma` is returned (default).
+    def _matrices_k(self, k, dtype):
+        """ Dense electrode matrices at `k`, these are calculated once for all energies
 
         Returns
         -------
-        self-energy : the self-energy corresponding to the semi-infinite direction
+        P0, S0 : the on-site matrices (``S0`` is None for orthogonal matrices)
+        P1, S1 : the coupling matrices (``S1`` is None for orthogonal matrices)
+        P1H, S1H : the Hermitian conjugate of the coupling matrices
         """
-        if E.imag == 0.:
-            E = E.real + 1j * self.eta
+        sp0 = self.spgeom0
+        sp1 = self.spgeom1
 
-        # Get k-point
-        k = self._correct_k(k)
+        P0 = sp0.Pk(k, dtype=dtype, format='array')
+        P1 = sp1.Pk(k, dtype=dtype, format='array')
+        P1H = conjugate(P1.T)
+        if sp1.orthogonal:
+            S0 = S1 = S1H = None
+        else:
+            S0 = sp0.Sk(k, dtype=dtype, format='array')
+            S1 = sp1.Sk(k, dtype=dtype, format='array')
+            S1H = conjugate(S1.T)
+        return P0, S0, P1, S1, P1H, S1H
+
+    @staticmethod
+    def _workspace(n, dtype):
+        """ Allocate the work arrays used in the solvers
+
+        The LU and solution arrays are Fortran ordered such that LAPACK works in-place.
+        The forward/backward couplings are stored consecutively such that their products
+        may be calculated in one call.
+        """
+        ab = empty([2 * n, n], dtype=dtype)
+        return {'GB': empty([n, n], dtype=dtype),
+                'GS': empty([n, n], dtype=dtype),
+                'ab': ab,
+                'alpha': ab[:n],
+                'beta': ab[n:],
+                'tmp': empty([n, n], dtype=dtype),
+                'prod': empty([2 * n, 2 * n], dtype=dtype),
+                'abs': empty([n, n], dtype=dtype_complex_to_real(dtype)),
+                'lu': empty([n, n], dtype=dtype, order='F'),
+                'rhs': empty([n, 2 * n], dtype=dtype, order='F'),
+        }
 
-        if dtype is None:
-            dtype = complex128
+    @staticmethod
+    def _initialize(E, M, work):
+        r""" Initialize the bulk inverse Green function and couplings at `E` in the work arrays
 
-        sp0 = self.spgeom0
-        sp1 = self.spgeom1
+        :math:`\mathbf S_0 E - \mathbf H_0`, :math:`\mathbf H_1 - \mathbf S_1 E` and
+        :math:`\mathbf H_1^\dagger - \mathbf S_1^\dagger E`.
+        """
+        P0, S0, P1, S1, P1H, S1H = M
+        GB = work['GB']
+        alpha = work['alpha']
+        beta = work['beta']
 
         # As the SparseGeometry inherently works for
         # orthogonal and non-orthogonal basis, there is no
         # need to have two algorithms.
-        GB = sp0.Sk(k, dtype=dtype, format='array') * E - sp0.Pk(k, dtype=dtype, format='array')
-        n = GB.shape[0]
-
-        ab = empty([n, 2, n], dtype=dtype)
-        shape = ab.shape
+        if S0 is None:
+            negative(P0, out=GB)
+            GB.flat[::GB.shape[0] + 1] += E
+            alpha[:, :] = P1
+            beta[:, :] = P1H
+        else:
+            multiply(S0, E, out=GB)
+            subtract(GB, P0, out=GB)
+            multiply(S1, -E, out=alpha)
+            alpha += P1
+            multiply(S1H, -E, out=beta)
+            beta += P1H
 
-        # Get direct arrays
-        alpha = ab[:, 0, :].view()
-        beta = ab[:, 1, :].view()
+    def _sancho(self, E, M, work, eps, bulk):
+        """ Lopez-Sancho recursion at energy `E` for the matrices `M` (from `_matrices_k`)
 
-        # Get solve step arary
-        ab2 = ab.view()
-        ab2.shape = (n, 2 * n)
+        All calculations are done in the arrays of `work` (from `_workspace`).
+        The four products of the forward/backward couplings are calculated in a single
+        matrix multiplication.
 
-        if sp1.orthogonal:
-            alpha[:, :] = sp1.Pk(k, dtype=dtype, format='array')
-            beta[:, :] = conjugate(alpha.T)
-        else:
-            P = sp1.Pk(k, dtype=dtype, format='array')
-            S = sp1.Sk(k, dtype=dtype, format='array')
-            alpha[:, :] = P - S * E
-            beta[:, :] = conjugate(P.T) - conjugate(S.T) * E
-            del P, S
+        Returns
+        -------
+        GS : the surface quantity (``work['GS']``)
+        GB : the bulk inverse Green function (``work['GB']``)
+        """
+        self._initialize(E, M, work)
+        GB = work['GB']
+        GS = work['GS']
+        ab = work['ab']
+        alpha = work['alpha']
+        beta = work['beta']
+        prod = work['prod']
+        lu = work['lu']
+        rhs = work['rhs']
+        n = GB.shape[0]
 
         # Surface Green function (self-energy)
         if bulk:
-            GS = GB.copy()
+            GS[:, :] = GB
         else:
-            GS = zeros_like(GB)
+            GS.fill(0.)
 
-        # Specifying dot with 'out' argument should be faster
-        tmp = empty_like(GS)
         while True:
-            tab = solve(GB, ab2).reshape(shape)
-
-            dot(alpha, tab[:, 1, :], tmp)
+            lu[:, :] = GB
+            rhs[:, :n] = alpha
+            rhs[:, n:] = beta
+            # In-place for the Fortran ordered work arrays
+            tab = solve(lu, rhs, True, True)
+
+            # [alpha; beta] . [tA, tB]
+            dot(ab, tab, prod)
             # Update bulk Green function
-            subtract(GB, tmp, out=GB)
-            subtract(GB, dot(beta, tab[:, 0, :]), out=GB)
+            subtract(GB, prod[:n, n:], out=GB)
+            subtract(GB, prod[n:, :n], out=GB)
             # Update surface self-energy
-            GS -= tmp
+            subtract(GS, prod[:n, n:], out=GS)
 
             # Update forward/backward
-            alpha[:, :] = dot(alpha, tab[:, 0, :])
-            beta[:, :] = dot(beta, tab[:, 1, :])
+            alpha[:, :] = prod[:n, :n]
+            beta[:, :] = prod[n:, n:]
 
             # Convergence criteria, it could be stricter
-            if _abs(alpha).max() < eps:
-                # Return the pristine Green function
-                del ab, alpha, beta, ab2, tab, GB
-                if bulk:
-                    return GS
-                return - GS
+            if amax(_abs(alpha, out=work['abs'])) < eps:
+                return GS, GB
 
-        raise ValueError(self.__class__.__name__+': could not converge self-energy calculation')
+    def _transfer(self, E, M, work, eps, bulk):
+        r""" Surface quantities at energy `E` from the eigenmodes of the transfer matrix
 
-    def self_energy_lr(self, E, k=None, dtype=None, eps=1e-14, bulk=False):
-        r""" Return two dense matrices with the left/right self-energy at energy `E` and k-point `k` (default Gamma).
+        The Bloch modes :math:`\psi_{j+1} = \lambda\psi_j` of the semi-infinite direction fulfill
+        :math:`\lambda^2\boldsymbol\alpha\mathbf u - \lambda\mathbf A\mathbf u + \boldsymbol\beta\mathbf u = 0`
+        which is solved as a generalized eigenvalue problem of twice the size.
+        The :math:`n` modes decaying into the semi-infinite direction define the transfer matrix
+        :math:`\mathbf T = \mathbf U\boldsymbol\Lambda\mathbf U^{-1}` and
+        the self-energy :math:`\boldsymbol\Sigma = \boldsymbol\alpha\mathbf T`, the remaining modes
+        define the self-energy of the opposite direction.
 
-        Note calculating the LR self-energies simultaneously requires that their chemical potentials are the same.
-        I.e. only when the reference energy is equivalent in the left/right schemes does this make sense.
+        Returns the same quantities as `_sancho`, `eps` is not used.
+        """
+        self._initialize(E, M, work)
+        GB = work['GB']
+        GS = work['GS']
+        alpha = work['alpha']
+        beta = work['beta']
+        n = GB.shape[0]
+        dtype = GB.dtype
+
+        a = np.zeros([2 * n, 2 * n], dtype=dtype, order='F')
+        b = np.zeros([2 * n, 2 * n], dtype=dtype, order='F')
+        r = _a.arangei(n)
+        a[r, r + n] = 1
+        negative(beta, out=a[n:, :n])
+        a[n:, n:] = GB
+        b[r, r] = 1
+        b[n:, n:] = alpha
+        w, v = eig_destroy(a, b, homogeneous_eigvals=True)
+        del a, b
+
+        # Sort according to |lambda|, infinite eigenvalues (singular couplings) are last
+        with np.errstate(divide='ignore', invalid='ignore'):
+            idx = np.argsort(_abs(w[0]) / _abs(w[1]))
+
+        # Decaying modes, psi_{j+1} = T psi_j, use u which is finite for lambda == 0
+        i = idx[:n]
+        U = v[:n, i]
+        T = solve(U.T, (U * (w[0, i] / w[1, i])).T, True, True).T
+        SE = dot(alpha, T)
+        # Modes decaying in the opposite direction, psi_{j-1} = T psi_j, use lambda u which is
+        # finite for lambda == inf
+        i = idx[n:]
+        U = v[n:, i]
+        T = solve(U.T, (U * (w[1, i] / w[0, i])).T, True, True).T
+        SEo = dot(beta, T)
+
+        if bulk:
+            subtract(GB, SE, out=GS)
+        else:
+            negative(SE, out=GS)
+        subtract(GB, SE, out=GB)
+        subtract(GB, SEo, out=GB)
+        return GS, GB
+
+    def _method(self, method, E, n):
+        """ Name of the solver used for the energy `E` and electrode size `n` """
+        if method is None:
+            method = self.method
+        method = method.lower()
+        if method == 'auto':
+            # The number of Lopez-Sancho iterations grows for small eta, while
+            # the generalized eigenvalue problem becomes expensive for large electrodes
+            if E.imag < 1e-4 and n <= 500:
+                method = 'transfer'
+            else:
+                method = 'sancho'
+        return method
+
+    def _solver(self, method, E, n):
+        """ Return the solver method for the energy `E` and electrode size `n` """
+        method = self._method(method, E, n)
+        if method == 'sancho':
+            return self._sancho
+        elif method == 'transfer':
+            return self._transfer
+        raise ValueError(self.__class__.__name__ + ': unknown method {}, must be one of [sancho, transfer, auto].'.format(method))
+
+    def _energies(self, E):
+        """ Energies with the hosting ``eta`` for real energies, scalars are returned as a complex number """
+        E = np.asarray(E)
+        E = np.where(E.imag == 0., E.real + 1j * self.eta, E)
+        if E.ndim == 0:
+            return complex(E)
+        return E.ravel()
+
+    def self_energy(self, E, k=None, dtype=None, eps=1e-14, bulk=False, method=None):
+        r""" Return a dense matrix with the self-energy at energy `E` and k-point `k` (default Gamma).
+
+        When `E` is an array the electrode matrices at `k` are only calculated once and the
+        work arrays are re-used for all energies.
 
         Parameters
         ----------
-        E : float/complex
-          energy at which the calculation will take place, if complex, the hosting ``eta`` won't be used.
+        E : float/complex or array_like
+          energy at which the calculation will take place
         k : array_like, optional
           k-point at which the self-energy should be evaluated.
           the k-point should be in units of the reciprocal lattice vectors, and
           the semi-infinite component will be automatically set to zero.
-        dtype : numpy.dtype, optional
-          the resulting data type, default to ``np.complex128``
+        dtype : numpy.dtype
+          the resulting data type
         eps : float, optional
           convergence criteria for the recursion
         bulk : bool, optional
           if true, :math:`E\cdot \mathbf S - \mathbf H -\boldsymbol\Sigma` is returned, else
           :math:`\boldsymbol\Sigma` is returned (default).
+        method : {'sancho', 'transfer', 'auto'}, optional
+          algorithm used, defaults to the `method` of this object
 
         Returns
         -------
-        left : the left self-energy
-        right : the right self-energy
+        self-energy : the self-energy corresponding to the semi-infinite direction, with shape ``(len(E), no, no)`` if `E` is an array
         """
-        if E.imag == 0.:
-            E = E.real + 1j * self.eta
+        E = self._energies(E)
 
         # Get k-point
         k = self._correct_k(k)
 
         if dtype is None:
-            dtype = complex128
+            dtype = dtype_real_to_complex(_dtype(None))
+
+        SE = self._cache_call('self_energy', self._self_energy, np.atleast_1d(E),
+                              k, dtype, eps, bulk, method=method)
+        if isinstance(E, complex):
+            return SE[0]
+        return SE
+
+    def _self_energy(self, E, k, dtype, eps, bulk, method=None):
+        """ Self-energies for all energies `E` (array), see `self_energy` """
+        M = self._matrices_k(k, dtype)
+        n = M[0].shape[0]
+        work = self._workspace(n, dtype)
+
+        SE = empty([len(E), n, n], dtype=dtype)
+        for i, e in enumerate(E):
+            GS = self._solver(method, e, n)(e, M, work, eps, bulk)[0]
+            if bulk:
+                SE[i] = GS
+            else:
+                negative(GS, out=SE[i])
+        return SE
 
-        sp0 = self.spgeom0
-        sp1 = self.spgeom1
+    def self_energy_lr(self, E, k=None, dtype=None, eps=1e-14, bulk=False, method=None):
+        r""" Return two dense matrices with the left/right self-energy at energy `E` and k-point `k` (default Gamma).
 
-        # As the SparseGeometry inherently works for
-        # orthogonal and non-orthogonal basis, there is no
-        # need to have two algorithms.
-        SmH0 = sp0.Sk(k, dtype=dtype, format='array') * E - sp0.Pk(k, dtype=dtype, format='array')
-        GB = SmH0.copy()
-        n = GB.shape[0]
+        Note calculating the LR self-energies simultaneously requires that their chemical potentials are the same.
+        I.e. only when the reference energy is equivalent in the left/right schemes does this make sense.
 
-        ab = empty([n, 2, n], dtype=dtype)
-        shape = ab.shape
+        When `E` is an array the electrode matrices at `k` are only calculated once and the
+        work arrays are re-used for all energies.
 
-        # Get direct arrays
-        alpha = ab[:, 0, :].view()
-        beta = ab[:, 1, :].view()
+        Parameters
+        ----------
+        E : float/complex or array_like
+          energy at which the calculation will take place, if complex, the hosting ``eta`` won't be used.
+        k : array_like, optional
+          k-point at which the self-energy should be evaluated.
+          the k-point should be in units of the reciprocal lattice vectors, and
+          the semi-infinite component will be automatically set to zero.
+        dtype : numpy.dtype, optional
+          the resulting data type, default to ``np.complex128`` (``np.complex64`` in single precision, see `set_precision`)
+        eps : float, optional
+          convergence criteria for the recursion
+        bulk : bool, optional
+          if true, :math:`E\cdot \mathbf S - \mathbf H -\boldsymbol\Sigma` is returned, else
+          :math:`\boldsymbol\Sigma` is returned (default).
+        method : {'sancho', 'transfer', 'auto'}, optional
+          algorithm used, defaults to the `method` of this object
 
-        # Get solve step arary
-        ab2 = ab.view()
-        ab2.shape = (n, 2 * n)
+        Returns
+        -------
+        left : the left self-energy, with shape ``(len(E), no, no)`` if `E` is an array
+        right : the right self-energy, with shape ``(len(E), no, no)`` if `E` is an array
+        """
+        E = self._energies(E)
 
-        if sp1.orthogonal:
-            alpha[:, :] = sp1.Pk(k, dtype=dtype, format='array')
-            beta[:, :] = conjugate(alpha.T)
-        else:
-            P = sp1.Pk(k, dtype=dtype, format='array')
-            S = sp1.Sk(k, dtype=dtype, format='array')
-            alpha[:, :] = P - S * E
-            beta[:, :] = conjugate(P.T) - conjugate(S.T) * E
-            del P, S
+        # Get k-point
+        k = self._correct_k(k)
 
-        # Surface Green function (self-energy)
-        if bulk:
-            GS = GB.copy()
-        else:
-            GS = zeros_like(GB)
+        if dtype is None:
+            dtype = dtype_real_to_complex(_dtype(None))
 
-        # Specifying dot with 'out' argument should be faster
-        tmp = empty_like(GS)
-        while True:
-            tab = solve(GB, ab2).reshape(shape)
+        SE = self._cache_call('self_energy_lr', self._self_energy_lr, np.atleast_1d(E),
+                              k, dtype, eps, bulk, method=method)
+        if isinstance(E, complex):
+            return SE[0, 0], SE[0, 1]
+        return SE[:, 0], SE[:, 1]
 
-            dot(alpha, tab[:, 1, :], tmp)
-            # Update bulk Green function
-            subtract(GB, tmp, out=GB)
-            subtract(GB, dot(beta, tab[:, 0, :]), out=GB)
-            # Update surface self-energy
-            GS -= tmp
+    def _self_energy_lr(self, E, k, dtype, eps, bulk, method=None):
+        """ Left/right self-energies for all energies `E` (array), see `self_energy_lr`
 
-            # Update forward/backward
-            alpha[:, :] = dot(alpha, tab[:, 0, :])
-            beta[:, :] = dot(beta, tab[:, 1, :])
+        Returns
+        -------
+        numpy.ndarray : the left and right self-energies with shape ``(len(E), 2, no, no)``
+        """
+        M = self._matrices_k(k, dtype)
+        P0, S0 = M[:2]
+        n = P0.shape[0]
+        work = self._workspace(n, dtype)
+
+        def lr(E, L, R):
+            GS, GB = self._solver(method, E, n)(E, M, work, eps, bulk)
+            if self.semi_inf_dir == 1:
+                # GS is the "right" self-energy
+                L, R = R, L
+            # E S - H
+            SmH0 = work['tmp']
+            if S0 is None:
+                negative(P0, out=SmH0)
+                SmH0.flat[::n + 1] += E
+            else:
+                multiply(S0, E, out=SmH0)
+                subtract(SmH0, P0, out=SmH0)
+            if bulk:
+                add(GB, SmH0, out=R)
+                subtract(R, GS, out=R)
+                L[:, :] = GS
+            else:
+                subtract(SmH0, GB, out=R)
+                add(R, GS, out=R)
+                negative(GS, out=L)
 
-            # Convergence criteria, it could be stricter
-            if _abs(alpha).max() < eps:
-                # Return the pristine Green function
-                del ab, alpha, beta, ab2, tab
-                if self.semi_inf_dir == 1:
-                    # GS is the "right" self-energy
-                    if bulk:
-                        return GB - GS + SmH0, GS
-                    return GS - GB + SmH0, - GS
-                # GS is the "left" self-energy
-                if bulk:
-                    return GS, GB - GS + SmH0
-                return - GS, GS - GB + SmH0
-
-        raise ValueError(self.__class__.__name__+': could not converge self-energy (LR) calculation')
+        SE = empty([len(E), 2, n, n], dtype=dtype)
+        for i, e in enumerate(E):
+            lr(e, SE[i, 0], SE[i, 1])
+        return SE
+
+    def _cache_key(self, E, method=None):
+        """ The solver used at the energy `E` is part of the cache key """
+        return (self._method(method, E, len(self.spgeom0)),)
+
+    def _cache_content(self, h):
+        """ Update the hash `h` with the electrode matrices """
+        _hash_update(h, self.__class__.__name__, self.semi_inf, self.semi_inf_dir,
+                     self.spgeom0, self.spgeom1)
 
 
 class RealSpaceSE(SelfEnergy):
@@ -416,6 +798,8 @@ class RealSpaceSE(SelfEnergy):
             'eta': 1e-6,
             # The BrillouinZone used for integration
             'bz': None,
+            # Pool used to calculate the k-points in parallel (an integer is the number of threads)
+            'pool': None,
         }
         self.update_option(**options)
 
@@ -605,27 +989,39 @@ class RealSpaceSE(SelfEnergy):
            if true, :math:`\mathbf S^{\mathcal{R}} E - \mathbf H^{\mathcal{R}} - \boldsymbol\Sigma^\mathcal{R}`
            is returned, otherwise :math:`\boldsymbol\Sigma^\mathcal{R}` is returned
         dtype : numpy.dtype, optional
-          the resulting data type, default to ``np.complex128``
+          the resulting data type, default to ``np.complex128`` (``np.complex64`` in single precision, see `set_precision`)
         coupling: bool, optional
            if True, only the self-energy terms located on the coupling geometry (`coupling_geometry`)
-           are returned
+           are returned. Since the self-energy only couples to these orbitals (:math:`C`), only the
+           coupling block of the Green function is calculated and the remaining orbitals (:math:`I`) are
+           removed using a sparse factorization:
+
+           .. math::
+              \boldsymbol\Sigma^{\mathcal{R}}_{CC} = \mathbf A_{CC} - \mathbf A_{CI}\mathbf A_{II}^{-1}\mathbf A_{IC}
+                - \mathbf G^{\mathcal{R}}_{CC}{}^{-1}
+
+           with :math:`\mathbf A = \mathbf S^{\mathcal{R}} E - \mathbf H^{\mathcal{R}}`.
         """
         if dtype is None:
-            dtype = complex128
+            dtype = dtype_real_to_complex(_dtype(None))
         if E.imag == 0:
             E = E.real + 1j * self._options['eta']
-        invG = inv(self.green(E, dtype=dtype), True)
+        A = self._calc['S0'] * E - self._calc['P0']
         if coupling:
-            orbs = self._calc['orbs']
+            invG = inv(self.green(E, dtype=dtype, coupling=True), True)
+            orbs = self._calc['orbs'].ravel()
+            A = A.tocsr()
+            # A_CC - A_CI A_II^-1 A_IC
+            AC = _schur_complement(A, orbs).astype(dtype, copy=False)
             if bulk:
-                return invG[orbs, orbs.T]
-            return ((self._calc['S0'] * E - self._calc['P0']).astype(dtype, copy=False).toarray() - invG)[orbs, orbs.T]
-        else:
-            if bulk:
-                return invG
-            return (self._calc['S0'] * E - self._calc['P0']).astype(dtype, copy=False).toarray() - invG
+                return invG + A[orbs, :][:, orbs].toarray().astype(dtype, copy=False) - AC
+            return AC - invG
+        invG = inv(self.green(E, dtype=dtype), True)
+        if bulk:
+            return invG
+        return A.astype(dtype, copy=False).toarray() - invG
 
-    def green(self, E, dtype=None):
+    def green(self, E, dtype=None, coupling=False):
         r""" Calculate the real-space Green function
 
         The real space Green function is calculated via:
@@ -633,13 +1029,43 @@ class RealSpaceSE(SelfEnergy):
         .. math::
             \mathbf G^\mathcal{R}(E) = \sum_{\mathbf k} \mathbf G_{\mathbf k}(E)
 
+        The k-points are added to the Green function as they are calculated. If the ``pool``
+        option is set the k-points are calculated in parallel (an integer
+        is the number of threads, otherwise an object with an ``imap`` method, e.g. a
+        `multiprocessing.pool.ThreadPool`).
+
         Parameters
         ----------
         E : float/complex
            energy to evaluate the real-space Green function at
         dtype : numpy.dtype, optional
-          the resulting data type, default to ``np.complex128``
+          the resulting data type, default to ``np.complex128`` (``np.complex64`` in single precision, see `set_precision`)
+        coupling : bool, optional
+           if True, only the Green function elements of the orbitals on the coupling atoms
+           (`real_space_coupling`) are calculated, i.e. the (Bloch unfolded) Green function is never
+           stored for the full real-space region
         """
+        if dtype is None:
+            dtype = dtype_real_to_complex(_dtype(None))
+
+        # Now we are to calculate the real-space self-energy
+        if E.imag == 0:
+            E = E.real + 1j * self._options['eta']
+
+        def green(E, dtype, coupling):
+            return np.stack([self._green(e, dtype, coupling) for e in E])
+        return self._cache_call('green', green, np.array([E]), dtype, coupling)[0]
+
+    def _cache_content(self, h):
+        """ Update the hash `h` with the parent and integration options """
+        opt = self._options
+        bz = opt['bz']
+        _hash_update(h, self.__class__.__name__, self.parent, self._unfold,
+                     opt['semi_axis'], opt['k_axis'], opt['trs'], bz.k, bz.weight,
+                     getattr(bz, '_trs', None))
+
+    def _green(self, E, dtype, coupling=False):
+        """ Real-space Green function at the complex energy `E`, see `green` """
         opt = self._options
 
         # Retrieve integration k-grid
@@ -650,13 +1076,6 @@ class RealSpaceSE(SelfEnergy):
         except:
             trs = opt['trs']
 
-        if dtype is None:
-            dtype = complex128
-
-        # Now we are to calculate the real-space self-energy
-        if E.imag == 0:
-            E = E.real + 1j * opt['eta']
-
         # Used axes
         s_ax = opt['semi_axis']
         k_ax = opt['k_axis']
@@ -734,28 +1153,48 @@ class RealSpaceSE(SelfEnergy):
 
         # Create functions used to calculate the real-space Green function
         # For TRS we only-calculate +k and average by using G(k) = G(-k)^T
-        # The extra arguments is because the internal decorator is actually pretty slow
-        # to filter out unused arguments.
-
-        # If using Bloch's theorem we need to wrap the Green function calculation
-        # as the method call.
-        if len(bloch) > 1:
-            def _func_bloch(k, no, tile, idx0, weight=None, parent=None):
-                return bloch(_calc_green, k, no=no, tile=tile, idx0=idx0)
-        else:
-            _func_bloch = _calc_green
 
         # Tiling indices
         idx0 = _a.arangei(tile)
         no = len(self.parent)
+        _calc_green = partial(_calc_green, no=no, tile=tile, idx0=idx0)
 
-        # calculate the Green function
-        G = bz.asaverage().call(_func_bloch, no=no, tile=tile, idx0=idx0)
+        # If using Bloch's theorem we need to wrap the Green function calculation
+        # as the method call.
+        if coupling:
+            orbs = self._calc['orbs'].ravel()
+            def _func(k):
+                return _bloch_block(bloch, _calc_green, k, orbs)
+        elif len(bloch) > 1:
+            def _func(k):
+                return bloch(_calc_green, k)
+        else:
+            _func = _calc_green
+
+        bk = bz.k
+        bw = bz.weight
+        def _func_w(ik):
+            G = _func(bk[ik])
+            G *= bw[ik]
+            return G
+
+        # calculate the Green function, the k-point contributions are added as they
+        # are calculated (in order)
+        G = None
+        for Gk in self._k_iter(_func_w, len(bz)):
+            if G is None:
+                G = Gk
+            else:
+                G += Gk
         if trs:
             # Faster to do it once, than per G
             return (G + G.T) * 0.5
         return G
 
+    def _k_iter(self, func, nk):
+        """ Iterate ``func(ik)`` for all k-point indices, possibly in parallel using the ``pool`` option """
+        return _imap(func, nk, self._options['pool'])
+
     def clear(self):
         """ Clears the internal arrays created in `RealSpaceSE.initialize` """
         del self._calc
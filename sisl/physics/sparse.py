@@ -10,18 +10,82 @@ from sisl._help import _range as range
 from sisl.sparse import isspmatrix
 from sisl.sparse_geometry import SparseOrbital
 from .spin import Spin
+from ._phase import _dense_out
 from ._matrix_k import matrix_k, matrix_k_nc, matrix_k_so, matrix_k_nc_diag
 from ._matrix_dk import matrix_dk
 from ._matrix_ddk import matrix_ddk
 
 
 __all__ = ['SparseOrbitalBZ', 'SparseOrbitalBZSpin']
+__all__ += ['set_precision', 'get_precision']
 
 
 # Filter warnings from the sparse library
 warnings.filterwarnings("ignore", category=SparseEfficiencyWarning)
 
 
+# The (real) data-type used for k-dependent matrices when no data-type is requested
+_PRECISION = {'double': np.float64, 'single': np.float32}
+_precision = ['double']
+
+
+def set_precision(precision):
+    """ Set the default precision of the k-dependent matrices and all quantities calculated from them
+
+    In ``'single'`` precision `Pk`, `Sk`, `dPk` etc. return `numpy.float32` (:math:`\Gamma`-point) or
+    `numpy.complex64` matrices when no `dtype` is requested, and the self-energies default to `numpy.complex64`.
+    Hence eigenvalues, eigenstates, velocities and the (projected) DOS are all calculated in single precision
+    which halves the memory (and memory traffic). Use ``eigh(..., refine=True)`` to retrieve eigenvalues
+    with double precision accuracy.
+
+    Parameters
+    ----------
+    precision : {'double', 'single'}
+       the default precision
+    """
+    if precision not in _PRECISION:
+        raise ValueError("set_precision: precision must be one of [double, single]")
+    _precision[0] = precision
+
+
+def get_precision():
+    """ The default precision of the k-dependent matrices, see `set_precision` """
+    return _precision[0]
+
+
+def _dtype(dtype):
+    """ The requested data-type, or the real data-type of the default precision """
+    if dtype is None:
+        return _PRECISION[_precision[0]]
+    return dtype
+
+
+def _k_array(k):
+    """ A single k-point as a ``(3,)`` array, or several k-points as a ``(nk, 3)`` array """
+    k = np.asarray(k, np.float64)
+    if k.ndim == 2:
+        return np.ascontiguousarray(k)
+    return k.ravel()
+
+
+def _loop_dk(func, k, format, out):
+    """ Derivatives for all k-points by calling ``func(k, out)`` for each k-point
+
+    For ``format='array'`` each returned direction is an ``(nk, no, no)`` array, otherwise
+    a list with the derivatives of each k-point is returned.
+    """
+    if format != 'array':
+        if out is not None:
+            raise ValueError("out argument is only allowed for format='array'")
+        return [func(kk, None) for kk in k]
+    if out is None:
+        dk = [func(kk, None) for kk in k]
+        return type(dk[0])(np.stack(d) for d in zip(*dk))
+    for ik in range(k.shape[0]):
+        func(k[ik], [o[ik] for o in out])
+    return out
+
+
 class SparseOrbitalBZ(SparseOrbital):
     """ Sparse object containing the orbital connections in a Brillouin zone
 
@@ -198,7 +262,7 @@ class SparseOrbitalBZ(SparseOrbital):
 
     __iter__ = iter
 
-    def _Pk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', _dim=0):
+    def _Pk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None, _dim=0):
         """ Sparse matrix (``scipy.sparse.csr_matrix``) at `k` for a polarized system
 
         Parameters
@@ -210,10 +274,10 @@ class SparseOrbitalBZ(SparseOrbital):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        k = np.asarray(k, np.float64).ravel()
-        return matrix_k(gauge, self, _dim, self.sc, k, dtype, format)
+        k = _k_array(k)
+        return matrix_k(gauge, self, _dim, self.sc, k, _dtype(dtype), format, out)
 
-    def _dPk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', _dim=0):
+    def _dPk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None, _dim=0):
         """ Sparse matrix (``scipy.sparse.csr_matrix``) at `k` differentiated with respect to `k` for a polarized system
 
         Parameters
@@ -225,10 +289,13 @@ class SparseOrbitalBZ(SparseOrbital):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        k = np.asarray(k, np.float64).ravel()
-        return matrix_dk(gauge, self, _dim, self.sc, k, dtype, format)
+        k = _k_array(k)
+        dtype = _dtype(dtype)
+        if k.ndim == 2:
+            return _loop_dk(lambda kk, o: matrix_dk(gauge, self, _dim, self.sc, kk, dtype, format, o), k, format, out)
+        return matrix_dk(gauge, self, _dim, self.sc, k, dtype, format, out)
 
-    def _ddPk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', _dim=0):
+    def _ddPk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None, _dim=0):
         """ Sparse matrix (``scipy.sparse.csr_matrix``) at `k` double differentiated with respect to `k` for a polarized system
 
         Parameters
@@ -240,8 +307,11 @@ class SparseOrbitalBZ(SparseOrbital):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        k = np.asarray(k, np.float64).ravel()
-        return matrix_ddk(gauge, self, _dim, self.sc, k, dtype, format)
+        k = _k_array(k)
+        dtype = _dtype(dtype)
+        if k.ndim == 2:
+            return _loop_dk(lambda kk, o: matrix_ddk(gauge, self, _dim, self.sc, kk, dtype, format, o), k, format, out)
+        return matrix_ddk(gauge, self, _dim, self.sc, k, dtype, format, out)
 
     def Sk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', *args, **kwargs):
         r""" Setup the overlap matrix for a given k-point
@@ -268,7 +338,10 @@ class SparseOrbitalBZ(SparseOrbital):
         Parameters
         ----------
         k : array_like, optional
-           the k-point to setup the overlap at (default Gamma point)
+           the k-point to setup the overlap at (default Gamma point).
+           For an ``(nk, 3)`` array the overlap is calculated for all k-points
+           in one pass. With ``format='array'`` the returned array has shape
+           ``(nk, no, no)``, otherwise a list of matrices is returned.
         dtype : numpy.dtype, optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
@@ -280,6 +353,9 @@ class SparseOrbitalBZ(SparseOrbital):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'matrix'`).
+        out : numpy.ndarray, optional
+           only for ``format='array'``; an array (with the shape and data-type of the
+           returned array) which is filled and returned, allowing memory to be reused
 
         See Also
         --------
@@ -292,24 +368,31 @@ class SparseOrbitalBZ(SparseOrbital):
         """
         pass
 
-    def _Sk_diagonal(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', *args, **kwargs):
+    def _Sk_diagonal(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None, *args, **kwargs):
         """ For an orthogonal case we always return the identity matrix """
-        if dtype is None:
-            dtype = np.float64
+        dtype = _dtype(dtype)
+        k = _k_array(k)
         no = len(self)
         # In the "rare" but could be found situation where
         # the matrix only describes neighbouring couplings it is vital
         # to not return anything
         # TODO
         if format == 'array':
-            return np.diag(np.ones(no, dtype=dtype))
+            out = _dense_out(out, list(k.shape[:-1]) + [no, no], dtype)
+            # Set the diagonal of all k-points
+            np.einsum('...ii->...i', out)[...] = 1
+            return out
+        elif out is not None:
+            raise ValueError(self.__class__.__name__ + ".Sk out argument is only allowed for format='array'")
+        elif k.ndim == 2:
+            return [self._Sk_diagonal(kk, dtype=dtype, format=format) for kk in k]
         elif format == 'matrix' or format == 'dense':
             return np.diag(np.ones(no, dtype=dtype)).asmatrix()
         S = csr_matrix((no, no), dtype=dtype)
         S.setdiag(1.)
         return S.asformat(format)
 
-    def _Sk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _Sk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Overlap matrix in a ``scipy.sparse.csr_matrix`` at `k`.
 
         Parameters
@@ -321,7 +404,7 @@ class SparseOrbitalBZ(SparseOrbital):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        return self._Pk(k, dtype=dtype, gauge=gauge, format=format, _dim=self.S_idx)
+        return self._Pk(k, dtype=dtype, gauge=gauge, format=format, out=out, _dim=self.S_idx)
 
     def dSk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', *args, **kwargs):
         r""" Setup the :math:`k`-derivatie of the overlap matrix for a given k-point
@@ -349,7 +432,10 @@ class SparseOrbitalBZ(SparseOrbital):
         Parameters
         ----------
         k : array_like, optional
-           the k-point to setup the overlap at (default Gamma point)
+           the k-point to setup the overlap at (default Gamma point).
+           For an ``(nk, 3)`` array the derivatives are calculated for all k-points.
+           With ``format='array'`` each direction has shape ``(nk, no, no)``,
+           otherwise a list with the derivatives for each k-point is returned.
         dtype : numpy.dtype, optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
@@ -361,6 +447,9 @@ class SparseOrbitalBZ(SparseOrbital):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'matrix'`).
+        out : sequence of numpy.ndarray, optional
+           only for ``format='array'``; 3 arrays (with the shape and data-type of the
+           returned arrays) which are filled and returned, allowing memory to be reused
 
         See Also
         --------
@@ -373,7 +462,7 @@ class SparseOrbitalBZ(SparseOrbital):
         """
         pass
 
-    def _dSk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _dSk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Overlap matrix in a ``scipy.sparse.csr_matrix`` at `k` differentiated with respect to `k`
 
         Parameters
@@ -385,7 +474,7 @@ class SparseOrbitalBZ(SparseOrbital):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        return self._dPk(k, dtype=dtype, gauge=gauge, format=format, _dim=self.S_idx)
+        return self._dPk(k, dtype=dtype, gauge=gauge, format=format, out=out, _dim=self.S_idx)
 
     def ddSk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', *args, **kwargs):
         r""" Setup the double :math:`k`-derivatie of the overlap matrix for a given k-point
@@ -413,7 +502,10 @@ class SparseOrbitalBZ(SparseOrbital):
         Parameters
         ----------
         k : array_like, optional
-           the k-point to setup the overlap at (default Gamma point)
+           the k-point to setup the overlap at (default Gamma point).
+           For an ``(nk, 3)`` array the derivatives are calculated for all k-points.
+           With ``format='array'`` each direction has shape ``(nk, no, no)``,
+           otherwise a list with the derivatives for each k-point is returned.
         dtype : numpy.dtype, optional
            the data type of the returned matrix. Do NOT request non-complex
            data-type for non-Gamma k.
@@ -425,6 +517,9 @@ class SparseOrbitalBZ(SparseOrbital):
            the returned format of the matrix, defaulting to the ``scipy.sparse.csr_matrix``,
            however if one always requires operations on dense matrices, one can always
            return in `numpy.ndarray` (`'array'`) or `numpy.matrix` (`'matrix'`).
+        out : sequence of numpy.ndarray, optional
+           only for ``format='array'``; 6 arrays (with the shape and data-type of the
+           returned arrays) which are filled and returned, allowing memory to be reused
 
         See Also
         --------
@@ -437,7 +532,7 @@ class SparseOrbitalBZ(SparseOrbital):
         """
         pass
 
-    def _ddSk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _ddSk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Overlap matrix in a ``scipy.sparse.csr_matrix`` at `k` double differentiated with respect to `k`
 
         Parameters
@@ -449,7 +544,7 @@ class SparseOrbitalBZ(SparseOrbital):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        return self._ddPk(k, dtype=dtype, gauge=gauge, format=format, _dim=self.S_idx)
+        return self._ddPk(k, dtype=dtype, gauge=gauge, format=format, out=out, _dim=self.S_idx)
 
     def eig(self, k=(0, 0, 0), gauge='R', eigvals_only=True, **kwargs):
         """ Returns the eigenvalues of the physical quantity (using the non-Hermitian solver)
@@ -478,14 +573,64 @@ class SparseOrbitalBZ(SparseOrbital):
         the given k-point and calculate the eigenvalues.
 
         All subsequent arguments gets passed directly to :code:`scipy.linalg.eigh`
+
+        Parameters
+        ----------
+        k : array_like, optional
+           the k-point, or a list of k-points (shape ``(nk, 3)``) in which case the eigenvalues (and
+           eigenvectors) are returned as stacked arrays with the k-points along the first dimension
+        driver : {'evd', 'evr', 'evx'}, optional
+           the LAPACK driver, if this, ``subset_by_index``, ``subset_by_value`` or a list of k-points
+           is passed the eigenvalue problems are solved by `sisl.linalg.eigh_batch`
+        refine : bool, optional
+           refine the eigenvalues of a single precision diagonalization (``dtype=np.complex64`` or
+           `set_precision`) by the Rayleigh quotients of the eigenvectors in double precision,
+           the eigenvectors are unaltered.
         """
         dtype = kwargs.pop('dtype', None)
-        P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array')
-        if self.orthogonal:
-            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
+        return self._eigh(k, gauge, eigvals_only, dtype, kwargs)
+
+    def _eigh(self, k, gauge, eigvals_only, dtype, kwargs, **Pk_kwargs):
+        """ Diagonalize the matrix at one or more k-points, see `eigh` """
+        k = np.asarray(k, dtype=np.float64)
+        refine = kwargs.pop('refine', False)
+        only = eigvals_only and not refine
+        batch = k.ndim == 2 or any(key in kwargs for key in ('driver', 'subset_by_index', 'subset_by_value'))
+        P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array', **Pk_kwargs)
+        S = None
+        if not self.orthogonal:
+            S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
+        if batch:
+            # The LAPACK routines are only queried once for all k-points
+            out = lin.eigh_batch(P, S, eigvals_only=only, overwrite_a=True, overwrite_b=True, **kwargs)
+        else:
+            out = lin.eigh_destroy(P, S, eigvals_only=only, **kwargs)
+        if not refine:
+            return out
 
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
-        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+        e, v = out
+        if k.ndim == 1:
+            e = self._eigh_refine(k, gauge, v, Pk_kwargs)
+        else:
+            e = [self._eigh_refine(kk, gauge, vv, Pk_kwargs) for kk, vv in zip(k, v)]
+            if not isinstance(v, list):
+                e = np.stack(e)
+        if eigvals_only:
+            return e
+        return e, v
+
+    def _eigh_refine(self, k, gauge, v, Pk_kwargs):
+        """ Double precision eigenvalues from the Rayleigh quotients of the (single precision) eigenvectors `v`
+
+        The error of the Rayleigh quotient is quadratic in the error of the eigenvectors, and only
+        requires sparse matrix products.
+        """
+        dtype = np.promote_types(v.dtype, np.float64)
+        v = v.astype(dtype)
+        e = (np.conj(v) * self.Pk(k=k, dtype=dtype, gauge=gauge, **Pk_kwargs).dot(v)).sum(0).real
+        if not self.orthogonal:
+            e /= (np.conj(v) * self.Sk(k=k, dtype=dtype, gauge=gauge).dot(v)).sum(0).real
+        return e
 
     def eigsh(self, k=(0, 0, 0), n=10, gauge='R', eigvals_only=True, **kwargs):
         """ Calculates a subset of eigenvalues of the physical quantity  (default 10)
@@ -494,13 +639,28 @@ class SparseOrbitalBZ(SparseOrbital):
         the given k-point and calculate a subset of the eigenvalues using the sparse algorithms.
 
         All subsequent arguments gets passed directly to :code:`scipy.linalg.eigsh`
-        """
-        # We always request the smallest eigenvalues...
-        kwargs.update({'which': kwargs.get('which', 'SM')})
 
+        Parameters
+        ----------
+        window : (2,) of float, optional
+           calculate all eigenvalues in the window ``[window[0], window[1]]`` using shift-invert
+           spectral slicing, see `sisl.linalg.eigsh_window` (`n` is the initial number of
+           eigenvalues per slice). Additional arguments (``nslice``, ``pool``, ``tol``)
+           are passed to `sisl.linalg.eigsh_window`, also for non-orthogonal matrices.
+        """
+        window = kwargs.pop('window', None)
         dtype = kwargs.pop('dtype', None)
 
         P = self.Pk(k=k, dtype=dtype, gauge=gauge)
+        if window is not None:
+            S = None
+            if not self.orthogonal:
+                S = self.Sk(k=k, dtype=dtype, gauge=gauge)
+            return lin.eigsh_window(P, window[0], window[1], M=S, n=n,
+                                    return_eigenvectors=not eigvals_only, **kwargs)
+
+        # We always request the smallest eigenvalues...
+        kwargs.update({'which': kwargs.get('which', 'SM')})
         if not self.orthogonal:
             raise ValueError("The sparsity pattern is non-orthogonal, you cannot use the Arnoldi procedure with scipy")
 
@@ -634,7 +794,7 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         s += str(self.geometry).replace('\n', '\n ')
         return s + '\n}'
 
-    def _Pk_unpolarized(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _Pk_unpolarized(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Sparse matrix (``scipy.sparse.csr_matrix``) at `k`
 
         Parameters
@@ -646,9 +806,9 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        return self._Pk(k, dtype=dtype, gauge=gauge, format=format)
+        return self._Pk(k, dtype=dtype, gauge=gauge, format=format, out=out)
 
-    def _Pk_polarized(self, k=(0, 0, 0), spin=0, dtype=None, gauge='R', format='csr'):
+    def _Pk_polarized(self, k=(0, 0, 0), spin=0, dtype=None, gauge='R', format='csr', out=None):
         """ Sparse matrix (``scipy.sparse.csr_matrix``) at `k` for a polarized system
 
         Parameters
@@ -662,9 +822,9 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        return self._Pk(k, dtype=dtype, gauge=gauge, format=format, _dim=spin)
+        return self._Pk(k, dtype=dtype, gauge=gauge, format=format, out=out, _dim=spin)
 
-    def _Pk_non_colinear(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _Pk_non_colinear(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Sparse matrix (``scipy.sparse.csr_matrix``) at `k` for a non-collinear system
 
         Parameters
@@ -676,10 +836,10 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        k = np.asarray(k, np.float64).ravel()
-        return matrix_k_nc(gauge, self, self.sc, k, dtype, format)
+        k = _k_array(k)
+        return matrix_k_nc(gauge, self, self.sc, k, _dtype(dtype), format, out)
 
-    def _Pk_spin_orbit(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _Pk_spin_orbit(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Sparse matrix (``scipy.sparse.csr_matrix``) at `k` for a spin-orbit system
 
         Parameters
@@ -691,10 +851,10 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        k = np.asarray(k, np.float64).ravel()
-        return matrix_k_so(gauge, self, self.sc, k, dtype, format)
+        k = _k_array(k)
+        return matrix_k_so(gauge, self, self.sc, k, _dtype(dtype), format, out)
 
-    def _dPk_unpolarized(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _dPk_unpolarized(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Tuple of sparse matrix (``scipy.sparse.csr_matrix``) at `k`, differentiated with respect to `k`
 
         Parameters
@@ -706,9 +866,9 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        return self._dPk(k, dtype=dtype, gauge=gauge, format=format)
+        return self._dPk(k, dtype=dtype, gauge=gauge, format=format, out=out)
 
-    def _dPk_polarized(self, k=(0, 0, 0), spin=0, dtype=None, gauge='R', format='csr'):
+    def _dPk_polarized(self, k=(0, 0, 0), spin=0, dtype=None, gauge='R', format='csr', out=None):
         """ Tuple of sparse matrix (``scipy.sparse.csr_matrix``) at `k`, differentiated with respect to `k`
 
         Parameters
@@ -722,9 +882,9 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        return self._dPk(k, dtype=dtype, gauge=gauge, format=format, _dim=spin)
+        return self._dPk(k, dtype=dtype, gauge=gauge, format=format, out=out, _dim=spin)
 
-    def _Sk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _Sk(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Overlap matrix in a ``scipy.sparse.csr_matrix`` at `k`.
 
         Parameters
@@ -736,9 +896,9 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        return self._Pk(k, dtype=dtype, gauge=gauge, format=format, _dim=self.S_idx)
+        return self._Pk(k, dtype=dtype, gauge=gauge, format=format, out=out, _dim=self.S_idx)
 
-    def _Sk_non_colinear(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr'):
+    def _Sk_non_colinear(self, k=(0, 0, 0), dtype=None, gauge='R', format='csr', out=None):
         """ Overlap matrix (``scipy.sparse.csr_matrix``) at `k` for a non-collinear system
 
         Parameters
@@ -750,8 +910,8 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         gauge : {'R', 'r'}
            chosen gauge
         """
-        k = np.asarray(k, np.float64).ravel()
-        return matrix_k_nc_diag(gauge, self, self.S_idx, self.sc, k, dtype, format)
+        k = _k_array(k)
+        return matrix_k_nc_diag(gauge, self, self.S_idx, self.sc, k, _dtype(dtype), format, out)
 
     def eig(self, k=(0, 0, 0), gauge='R', eigvals_only=True, **kwargs):
         """ Returns the eigenvalues of the physical quantity (using the non-Hermitian solver)
@@ -798,20 +958,17 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         spin : int, optional
            the spin-component to calculate the eigenvalue spectrum of, note that
            this parameter is only valid for `Spin.POLARIZED` matrices.
+
+        See Also
+        --------
+        SparseOrbitalBZ.eigh : for lists of k-points and the LAPACK driver arguments
         """
         spin = kwargs.pop('spin', 0)
         dtype = kwargs.pop('dtype', None)
 
         if self.spin.kind == Spin.POLARIZED:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge, spin=spin, format='array')
-        else:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array')
-
-        if self.orthogonal:
-            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
-
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
-        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+            return self._eigh(k, gauge, eigvals_only, dtype, kwargs, spin=spin)
+        return self._eigh(k, gauge, eigvals_only, dtype, kwargs)
 
     def eigsh(self, k=(0, 0, 0), n=10, gauge='R', eigvals_only=True, **kwargs):
         """ Calculates a subset of eigenvalues of the physical quantity  (default 10)
@@ -826,16 +983,29 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         spin : int, optional
            the spin-component to calculate the eigenvalue spectrum of, note that
            this parameter is only valid for `Spin.POLARIZED` matrices.
+        window : (2,) of float, optional
+           calculate all eigenvalues in the window ``[window[0], window[1]]`` using shift-invert
+           spectral slicing, see `sisl.linalg.eigsh_window` (`n` is the initial number of
+           eigenvalues per slice). Additional arguments (``nslice``, ``pool``, ``tol``)
+           are passed to `sisl.linalg.eigsh_window`, also for non-orthogonal matrices.
         """
-        # We always request the smallest eigenvalues...
         spin = kwargs.pop('spin', 0)
+        window = kwargs.pop('window', None)
         dtype = kwargs.pop('dtype', None)
-        kwargs.update({'which': kwargs.get('which', 'SM')})
 
         if self.spin.kind == Spin.POLARIZED:
             P = self.Pk(k=k, dtype=dtype, spin=spin, gauge=gauge)
         else:
             P = self.Pk(k=k, dtype=dtype, gauge=gauge)
+        if window is not None:
+            S = None
+            if not self.orthogonal:
+                S = self.Sk(k=k, dtype=dtype, gauge=gauge)
+            return lin.eigsh_window(P, window[0], window[1], M=S, n=n,
+                                    return_eigenvectors=not eigvals_only, **kwargs)
+
+        # We always request the smallest eigenvalues...
+        kwargs.update({'which': kwargs.get('which', 'SM')})
         if not self.orthogonal:
             raise ValueError("The sparsity pattern is non-orthogonal, you cannot use the Arnoldi procedure with scipy")
 
@@ -64,3 +64,23 @@ def test_bloch_one_direction(nx, ny, nz):
         H_big = HB.Hk(K, format='array')
 
         assert np.allclose(H_unfold, H_big)
+
+
+@pytest.mark.parametrize("pool", [None, 2])
+def test_bloch_call_pool(pool):
+    b = Bloch([2, 3, 1], pool=pool)
+    H = get_H()
+    K = [0.1, 0.2, 0]
+    k_unfold = b.unfold_points(K)
+    HK = np.array([H.Hk(k, format='array') for k in k_unfold])
+    H_unfold = b.unfold(HK, k_unfold)
+    assert np.allclose(H_unfold, b(H.Hk, K, format='array'))
+    assert np.allclose(H_unfold, H.tile(2, 0).tile(3, 1).Hk(K, format='array'))
+
+
+def test_bloch_unfold_dtype():
+    b = Bloch([2, 1, 2])
+    H = get_H()
+    k_unfold = b.unfold_points([0.1, 0, 0.2])
+    HK = [H.Hk(k, format='array', dtype=np.float32) for k in k_unfold]
+    assert b.unfold(HK, k_unfold).dtype == np.complex64
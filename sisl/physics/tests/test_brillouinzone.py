@@ -6,7 +6,7 @@ from itertools import product
 import math as m
 import numpy as np
 
-from sisl import SislError, geom
+from sisl import SislError, SislWarning, geom
 from sisl import Geometry, Atom, SuperCell, SuperCellChild
 from sisl import BrillouinZone, BandStructure
 from sisl import MonkhorstPack
@@ -250,6 +250,65 @@ class TestBrillouinZone(object):
         assert np.allclose((asarray / len(bz)).sum(0), asaverage)
         bz.asnone().eigh()
 
+    @pytest.mark.parametrize("pool", [2, 'thread'])
+    def test_as_pool(self, pool):
+        from multiprocessing.pool import ThreadPool
+        from sisl import geom, Hamiltonian
+        g = geom.graphene()
+        H = Hamiltonian(g)
+        H.construct([[0.1, 1.44], [0, -2.7]])
+
+        def wrap(eig):
+            return eig[::-1]
+
+        bz = MonkhorstPack(H, [3, 3, 1], trs=False)
+        asarray = bz.asarray().eigh(wrap=wrap)
+        asaverage = bz.asaverage().eigh()
+        assum = bz.assum().eigh()
+
+        if pool == 'thread':
+            pool = ThreadPool(2)
+        bz.set_pool(pool)
+        # Results are returned (and reduced) in k-point order
+        assert np.array_equal(asarray, bz.asarray().eigh(wrap=wrap))
+        assert np.array_equal(asarray, np.array(bz.aslist().eigh(wrap=wrap)))
+        assert np.array_equal(asarray, np.array([a for a in bz.asyield().eigh(wrap=wrap)]))
+        assert np.array_equal(asaverage, bz.asaverage().eigh())
+        assert np.array_equal(assum, bz.assum().eigh())
+        bz.asnone().eigh()
+        assert bz.set_pool(None)._bz_pool is None
+
+    def test_as_pool_process(self):
+        import multiprocessing
+        from sisl import geom, Hamiltonian
+        g = geom.graphene()
+        H = Hamiltonian(g)
+        H.construct([[0.1, 1.44], [0, -2.7]])
+
+        bz = MonkhorstPack(H, [5, 3, 1], trs=False)
+        asarray = bz.asarray().eigh()
+        asaverage = bz.asaverage().eigh()
+        pool = multiprocessing.Pool(2)
+        try:
+            bz.set_pool(pool)
+            assert np.array_equal(asarray, bz.asarray().eigh())
+            assert np.array_equal(asaverage, bz.asaverage().eigh())
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def test_as_pool_no_fork(self, monkeypatch):
+        import sisl.physics.brillouinzone as bzm
+        from sisl import geom, Hamiltonian
+        monkeypatch.setattr(bzm, '_fork_context', lambda: None)
+        g = geom.graphene()
+        H = Hamiltonian(g)
+        H.construct([[0.1, 1.44], [0, -2.7]])
+        bz = MonkhorstPack(H, [3, 3, 1], trs=False)
+        asarray = bz.asarray().eigh()
+        with pytest.warns(SislWarning):
+            assert np.array_equal(asarray, bz.set_pool(2).asarray().eigh())
+
     def test_as_single(self):
         from sisl import geom, Hamiltonian
         g = geom.graphene()
@@ -328,6 +387,97 @@ class TestBrillouinZone(object):
         assert np.allclose(asyield2, asaverage)
         assert np.allclose(assum, asaverage)
 
+    @pytest.mark.parametrize("N", [4, 5, 6])
+    @pytest.mark.parametrize("trs", [True, False])
+    def test_mp_symmetry(self, N, trs):
+        from sisl import Hamiltonian
+        g = geom.graphene()
+        H = Hamiltonian(g)
+        H.construct([[0.1, 1.44], [0, -2.7]])
+
+        full = MonkhorstPack(H, [N, N, 1], trs=False)
+        bz = MonkhorstPack(H, [N, N, 1], trs=trs, symmetry=True)
+        assert len(bz) < len(full)
+        assert bz.weight.sum() == pytest.approx(1.)
+        E = np.linspace(-8, 8, 50)
+        assert np.allclose(full.asaverage().DOS(E), bz.asaverage().DOS(E))
+
+        # Check the unfolding
+        k, idx = bz.unfold()
+        assert len(k) == len(full)
+        assert np.allclose(np.bincount(idx) / len(full), bz.weight)
+        for i in range(0, len(k), 3):
+            assert np.allclose(H.eigh(k[i]), H.eigh(bz.k[idx[i]]))
+
+        bz2 = bz.copy()
+        assert np.allclose(bz2.k, bz.k)
+        assert np.allclose(bz2.weight, bz.weight)
+        assert np.allclose(bz2.unfold()[1], idx)
+
+    def test_mp_symmetry_asgrid(self):
+        from sisl import Hamiltonian
+        H = Hamiltonian(Geometry([0] * 3, Atom(1, 1.1), sc=SuperCell(2.)))
+        H.construct([[0.1, 2.1], [0, -1]])
+        full = MonkhorstPack(H, [4] * 3, trs=False)
+        bz = MonkhorstPack(H, [4] * 3, symmetry=True)
+        assert len(bz) == 10
+        assert np.allclose(full.unfold()[1], np.arange(len(full)))
+
+        g1 = full.asgrid().eigh(wrap=lambda eig: eig[0])
+        g2 = bz.asgrid().eigh(wrap=lambda eig: eig[0])
+        assert np.allclose(g1.grid, g2.grid)
+
+    def test_mp_symmetry_geometry(self):
+        # A different atom breaks the x <-> y symmetry
+        g = Geometry([[0] * 3, [1, 0, 0]], [Atom(1, 1.1), Atom(2, 1.1)], sc=SuperCell(2.))
+        bz_sc = MonkhorstPack(g.sc, [4] * 3, symmetry=True)
+        bz = MonkhorstPack(g, [4] * 3, symmetry=True)
+        assert len(bz_sc) < len(bz)
+        assert bz.weight.sum() == pytest.approx(1.)
+
+    @pytest.mark.parametrize("displacement", [0, 0.5])
+    def test_mp_unfold_trs(self, displacement):
+        g = geom.graphene()
+        full = MonkhorstPack(g, [4, 5, 1], displacement=displacement, trs=False)
+        bz = MonkhorstPack(g, [4, 5, 1], displacement=displacement)
+        k, idx = bz.unfold()
+        assert np.allclose(k, full.k)
+        assert np.allclose(np.bincount(idx) / len(full), bz.weight)
+        # Either k or -k
+        dk = np.minimum(np.abs((bz.k[idx] - k + 0.5) % 1 - 0.5).sum(1),
+                        np.abs((bz.k[idx] + k + 0.5) % 1 - 0.5).sum(1))
+        assert np.allclose(dk, 0)
+
+    def test_mp_tetrahedra(self):
+        g = geom.graphene()
+        bz = MonkhorstPack(g, [4, 5, 3], trs=False)
+        tet = bz.tetrahedra()
+        assert tet.shape == (6 * len(bz), 4)
+        # Each k-point is the corner of 24 tetrahedra
+        assert np.all(np.bincount(tet.ravel()) == 24)
+        for t in tet[:10]:
+            dk = np.abs((bz.k[t[1:]] - bz.k[t[:-1]] + 0.5) % 1 - 0.5) * [4, 5, 3]
+            # corners are neighbouring grid points along one lattice direction
+            assert np.allclose(np.sort(dk, 1), [[0, 0, 1]] * 3)
+
+        bz = MonkhorstPack(g, [4, 5, 3])
+        tet_trs = bz.tetrahedra()
+        assert tet_trs.shape == tet.shape
+        assert tet_trs.max() == len(bz) - 1
+
+    @pytest.mark.xfail(raises=SislError)
+    def test_mp_tetrahedra_fail(self):
+        g = geom.graphene()
+        bz = MonkhorstPack(g, 2, trs=False)
+        bz.replace([0] * 3, MonkhorstPack(g, [2, 2, 2], size=[0.5] * 3, trs=False))
+        bz.tetrahedra()
+
+    @pytest.mark.xfail(raises=SislError)
+    def test_mp_symmetry_replace_fail(self):
+        g = geom.graphene()
+        bz = MonkhorstPack(g, [4, 4, 1], symmetry=True)
+        bz.replace([0] * 3, MonkhorstPack(g, [2, 2, 1], size=[0.25, 0.25, 1]))
+
     def test_replace_gamma(self):
         g = geom.graphene()
         bz = MonkhorstPack(g, 2, trs=False)
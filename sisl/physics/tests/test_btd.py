@@ -0,0 +1,116 @@
+from __future__ import print_function, division
+
+import pytest
+
+import numpy as np
+
+from sisl import geom, Hamiltonian, RecursiveSI
+from sisl import btd_pivot, btd_partition, DeviceGreen
+
+
+pytestmark = pytest.mark.btd
+
+
+def get_device(orthogonal, n=6):
+    g = geom.graphene(orthogonal=True)
+    if orthogonal:
+        H = Hamiltonian(g)
+        H.construct([(0.1, 1.44), (0, -2.7)])
+    else:
+        H = Hamiltonian(g, orthogonal=False)
+        H.construct([(0.1, 1.44), ((0, 1.), (-2.7, 0.1))])
+    D = H.tile(n, 0)
+    D.set_nsc(a=1)
+    return H, D
+
+
+def dense(D, elecs, E, k, eta):
+    S = D.Sk(k, format='array')
+    A = (E + 1j * eta) * S - D.Hk(k, format='array')
+    gamma = []
+    for SE, o in elecs:
+        se = SE.self_energy(E, k)
+        A[np.ix_(o, o)] -= se
+        gamma.append(1j * (se - se.T.conj()))
+    return np.linalg.inv(A), S, gamma
+
+
+def test_btd_partition():
+    H, D = get_device(True, 10)
+    rng = np.random.RandomState(1)
+    pivot = rng.permutation(D.no)
+    btd = btd_partition(D, pivot, 3, 2)
+    assert btd.sum() == D.no
+    assert btd[0] >= 3
+    assert btd[-1] >= 2
+
+    # All couplings are in the (block-)tridiagonal part
+    c = np.cumsum(btd) - 1
+    M = D.Hk([0, 0.1, 0])[pivot, :][:, pivot].tocoo()
+    b = np.searchsorted(c, M.row), np.searchsorted(c, M.col)
+    assert np.abs(b[0] - b[1]).max() <= 1
+
+
+def test_btd_pivot():
+    H, D = get_device(True, 10)
+    first = np.arange(H.no)
+    last = np.arange(D.no - H.no, D.no)
+    pivot = btd_pivot(D, first, last)
+    assert np.all(np.sort(pivot) == np.arange(D.no))
+    assert np.all(pivot[:H.no] == first)
+    assert np.all(pivot[-H.no:] == last)
+    btd = btd_partition(D, pivot, H.no, H.no)
+    assert len(btd) > 2
+    assert btd.max() < D.no // 2
+
+
+@pytest.mark.parametrize("orthogonal", [True, False])
+def test_btd_device_green(orthogonal):
+    H, D = get_device(orthogonal)
+    eL = np.arange(H.no)
+    eR = np.arange(D.no - H.no, D.no)
+    elecs = [(RecursiveSI(H, '-A'), eL), (RecursiveSI(H, '+A'), eR)]
+    dev = DeviceGreen(D, elecs, eta=1e-4)
+    assert len(dev) == D.no
+    assert len(dev.btd) > 2
+    str(dev)
+
+    for E, k in [(0.3, [0, 0.1, 0]), (-1.1, [0, 0.3, 0])]:
+        G, S, gamma = dense(D, elecs, E, k, 1e-4)
+        GRL = G[np.ix_(eR, eL)]
+        T = np.trace(gamma[1].dot(GRL).dot(gamma[0]).dot(GRL.T.conj())).real
+        assert np.allclose(dev.transmission(E, k), T)
+        assert np.allclose(dev.transmission(E, k, 1, 0), T)
+        assert np.allclose(dev.green_column(E, k, 0), G[:, eL])
+        assert np.allclose(dev.green_column(E, k, 1), G[:, eR])
+        assert np.allclose(dev.DOS(E, k), -G.dot(S).diagonal().imag / np.pi)
+        for i, e in enumerate([eL, eR]):
+            A = G[:, e].dot(gamma[i]).dot(G[:, e].T.conj())
+            assert np.allclose(dev.spectral_column(E, k, i), A[:, e])
+            assert np.allclose(dev.ADOS(E, k, i), A.dot(S).diagonal().real / (2 * np.pi))
+
+
+def test_btd_device_green_subset():
+    # A device region which is a subset of the orbitals (in a custom order)
+    H, D = get_device(False, 8)
+    eL = np.arange(H.no, 2 * H.no)
+    eR = np.arange(D.no - 2 * H.no, D.no - H.no)
+    dev_orbs = np.arange(H.no, D.no - H.no)
+    elecs = [(RecursiveSI(H, '-A'), eL), (RecursiveSI(H, '+A'), eR)]
+    pivot = np.concatenate([eL, dev_orbs[H.no:-H.no][::-1], eR])
+    dev = DeviceGreen(D, elecs, pivot=pivot, eta=1e-4)
+    assert np.all(dev.orbitals == dev_orbs)
+
+    Dsub = D.sub(D.o2a(dev_orbs, unique=True))
+    sub_elecs = [(elecs[0][0], eL - H.no), (elecs[1][0], eR - H.no)]
+    ref = DeviceGreen(Dsub, sub_elecs, eta=1e-4)
+    E, k = 0.2, [0, 0.2, 0]
+    assert np.allclose(dev.transmission(E, k), ref.transmission(E, k))
+    assert np.allclose(dev.DOS(E, k), ref.DOS(E, k))
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_btd_device_green_fail():
+    H, D = get_device(True)
+    # the electrode orbitals are not in the device region
+    DeviceGreen(D, [(RecursiveSI(H, '-A'), np.arange(H.no))], pivot=np.arange(1, D.no))
@@ -95,6 +95,19 @@ class TestDynamicalMatrix(object):
         assert np.allclose(ev.hw, em.hw)
         assert np.allclose(em.norm(), 1)
 
+    def test_eig_k_list(self, setup):
+        D = setup.D.copy()
+        D.construct(setup.func)
+        k = [[0] * 3, [0.2, 0.2, 0.2]]
+        ev = D.eigenvalue(k)
+        em = D.eigenmode(k)
+        assert len(ev) == 2
+        assert len(em) == 2
+        for i in range(2):
+            assert np.allclose(ev[i].hw, D.eigenvalue(k[i]).hw)
+            assert np.allclose(em[i].hw, ev[i].hw)
+            assert np.allclose(em[i].norm(), 1)
+
     def test_change_gauge(self, setup):
         D = setup.D.copy()
         D.construct(setup.func)
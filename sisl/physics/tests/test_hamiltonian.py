@@ -7,6 +7,7 @@ import numpy as np
 
 from sisl import Geometry, Atom, SuperCell, Hamiltonian, Spin, BandStructure, MonkhorstPack, BrillouinZone
 from sisl import Grid, SphericalOrbital, SislError
+from sisl import set_precision, get_precision
 from sisl.physics.electron import berry_phase
 
 
@@ -227,12 +228,109 @@ class TestHamiltonian(object):
         assert np.allclose(csr, arr)
         assert np.allclose(csr, coo)
 
+    @pytest.mark.parametrize("gauge", ['R', 'r'])
+    @pytest.mark.parametrize("dtype", [None, np.complex64])
+    def test_Hk_nk(self, setup, gauge, dtype):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((1., 2.), (0.1, 0.2))])
+        k = [[0, 0, 0], [0.15, 0.15, 0.15], [0.25, -0.1, 0.]]
+        Hk = H.Hk(k, gauge=gauge, dtype=dtype, format='array')
+        assert Hk.shape == (3, len(H), len(H))
+        Sk = H.Sk(k, gauge=gauge, dtype=dtype)
+        assert len(Sk) == 3
+        for i, kk in enumerate(k):
+            assert np.allclose(Hk[i], H.Hk(kk, gauge=gauge, dtype=dtype, format='array'))
+            assert np.allclose(Sk[i].toarray(), H.Sk(kk, gauge=gauge, dtype=dtype).toarray())
+
+    def test_Hk_nk_gamma(self, setup):
+        H = setup.H.copy()
+        H.construct([(0.1, 1.5), (1., 0.1)])
+        Hk = H.Hk(np.zeros([2, 3]), format='array')
+        assert Hk.dtype == np.float64
+        assert np.allclose(Hk[1], H.Hk(format='array'))
+        Sk = H.Sk(np.zeros([2, 3]), format='array')
+        assert np.allclose(Sk[0], np.identity(len(H)))
+
+    @pytest.mark.parametrize("gauge", ['R', 'r'])
+    def test_dHk_nk(self, setup, gauge):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((1., 2.), (0.1, 0.2))])
+        k = [[0, 0, 0], [0.15, 0.15, 0.15], [0.25, -0.1, 0.]]
+        dHk = H.dHk(k, gauge=gauge, format='array')
+        assert len(dHk) == 3
+        ddSk = H.ddSk(k, gauge=gauge, format='array')
+        assert len(ddSk) == 6
+        dSk = H.dSk(k, gauge=gauge)
+        assert len(dSk) == 3
+        for i, kk in enumerate(k):
+            for d, dk in zip(dHk, H.dHk(kk, gauge=gauge, format='array')):
+                assert d.shape == (3, len(H), len(H))
+                assert np.allclose(d[i], dk)
+            for d, dk in zip(ddSk, H.ddSk(kk, gauge=gauge, format='array')):
+                assert np.allclose(d[i], dk)
+            for d, dk in zip(dSk[i], H.dSk(kk, gauge=gauge)):
+                assert np.allclose(d.toarray(), dk.toarray())
+        out = np.empty([3, 3, len(H), len(H)], np.complex128)
+        assert H.dHk(k, gauge=gauge, format='array', out=out) is out
+        assert np.allclose(out, dHk)
+
+    def test_Hk_out(self, setup):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((1., 2.), (0.1, 0.2))])
+        k = [0.15, 0.15, 0.15]
+        out = np.empty([len(H), len(H)], np.complex128)
+        assert H.Hk(k, format='array', out=out) is out
+        assert np.allclose(out, H.Hk(k, format='array'))
+        # the buffer is overwritten, not accumulated
+        H.Hk(k, format='array', out=out)
+        assert np.allclose(out, H.Hk(k, format='array'))
+        assert H.Sk(k, format='array', out=out) is out
+        assert np.allclose(out, H.Sk(k, format='array'))
+        dout = np.empty([3, len(H), len(H)], np.complex128)
+        H.dHk(k, format='array', out=dout)
+        assert np.allclose(dout, H.dHk(k, format='array'))
+        ddout = np.empty([6, len(H), len(H)], np.complex128)
+        H.ddHk(k, format='array', out=ddout)
+        assert np.allclose(ddout, H.ddHk(k, format='array'))
+
+    def test_Sk_out_orthogonal(self, setup):
+        out = np.empty([len(setup.H), len(setup.H)])
+        assert setup.H.Sk(format='array', out=out) is out
+        assert np.allclose(out, np.identity(len(setup.H)))
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_Hk_out_dtype_fail(self, setup):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((1., 2.), (0.1, 0.2))])
+        out = np.empty([len(H), len(H)], np.complex64)
+        H.Hk([0.15, 0.15, 0.15], format='array', out=out)
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_Hk_out_format_fail(self, setup):
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((1., 2.), (0.1, 0.2))])
+        out = np.empty([len(H), len(H)], np.complex128)
+        H.Hk([0.15, 0.15, 0.15], out=out)
+
     @pytest.mark.xfail(raises=ValueError)
     def test_construct_raise(self, setup):
         # Test that construct fails with more than one
         # orbital
         setup.H2.construct([(0.1, 1.5), (1., 0.1)])
 
+    def test_construct_species(self, setup):
+        H = setup.HS2.copy()
+        onsite = np.stack(([[1., 0.1], [0.1, 2.]], np.identity(2)), axis=-1)
+        H.construct([(0.1, 1.5), ({(0, 0): onsite},
+                                   {('C', 'C'): [[-2.7, 0], [0, -0.5]]})])
+        assert H.nnz == 2 * 2 * 8
+        assert np.allclose(H.tocsr(0)[:2, :2].toarray(), [[1., 0.1], [0.1, 2.]])
+        assert np.allclose(H.tocsr(1)[:2, :2].toarray(), np.identity(2))
+        assert np.allclose(H.tocsr(0)[:2, 2:4].toarray(), [[-2.7, 0], [0, -0.5]])
+        # 2D blocks are used for all dimensions
+        assert np.allclose(H.tocsr(1)[:2, 2:4].toarray(), [[-2.7, 0], [0, -0.5]])
+        assert np.allclose(H.Hk().toarray(), H.Hk().toarray().T)
+
     def test_getitem1(self, setup):
         H = setup.H
         # graphene Hamiltonian
@@ -508,6 +606,64 @@ class TestHamiltonian(object):
         assert np.allclose(eig1, eig2, atol=1e-5)
         assert np.allclose(eig1, eig3, atol=1e-5)
 
+    def test_eigh_k_list(self, setup):
+        H = Hamiltonian(setup.g.tile(2, 0), orthogonal=False)
+        H.construct([(0.1, 1.5), ((1., 1.), (0.1, 0.1))])
+        k = [[0] * 3, [0.1, 0.2, 0], [0.25, 0.5, 0]]
+        eig = H.eigh(k)
+        assert eig.shape == (3, H.no)
+        for i in range(3):
+            assert np.allclose(eig[i], H.eigh(k[i]))
+        eig, v = H.eigh(k, eigvals_only=False, driver='evr', subset_by_index=(0, 1))
+        assert v.shape == (3, H.no, 2)
+        assert np.allclose(H.eigh(k[1], driver='evx', subset_by_index=(0, 1)), eig[1])
+
+    def test_eigenstate_k_list(self, setup):
+        H = Hamiltonian(setup.g.tile(2, 0), orthogonal=False)
+        H.construct([(0.1, 1.5), ((1., 1.), (0.1, 0.1))])
+        k = [[0] * 3, [0.1, 0.2, 0], [0.25, 0.5, 0]]
+        es = H.eigenstate(k)
+        ev = H.eigenvalue(k)
+        assert len(es) == 3
+        assert len(ev) == 3
+        for i in range(3):
+            es1 = H.eigenstate(k[i])
+            assert np.allclose(es[i].info['k'], k[i])
+            assert np.allclose(es[i].eig, es1.eig)
+            assert np.allclose(ev[i].eig, es1.eig)
+            assert np.allclose(es[i].norm2(), es1.norm2())
+            assert np.allclose(es[i].DOS(np.linspace(-1, 1, 5)), es1.DOS(np.linspace(-1, 1, 5)))
+
+    def test_eigh_single_precision(self, setup):
+        H = Hamiltonian(setup.g.tile(2, 0), orthogonal=False)
+        H.construct([(0.1, 1.5), ((1., 1.), (0.1, 0.1))])
+        k = [0.1, 0.2, 0]
+        E = np.linspace(-1, 1, 5)
+        ref = H.eigh(k)
+        set_precision('single')
+        try:
+            assert get_precision() == 'single'
+            assert H.Hk(k).dtype == np.complex64
+            assert H.Sk().dtype == np.float32
+            es = H.eigenstate(k)
+            assert es.eig.dtype == np.float32
+            assert es.state.dtype == np.complex64
+            assert es.velocity().dtype == np.float32
+            assert es.DOS(E).dtype == np.float32
+            assert es.PDOS(E).dtype == np.float32
+            eig = H.eigh(k, refine=True)
+            eigs = H.eigh([k, k], refine=True, driver='evd')
+        finally:
+            set_precision('double')
+        assert np.allclose(es.eig, ref, atol=1e-4)
+        assert eig.dtype == np.float64
+        assert np.allclose(eig, ref, rtol=0, atol=1e-9)
+        assert np.allclose(eigs, ref.reshape(1, -1), rtol=0, atol=1e-9)
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_set_precision_fail(self):
+        set_precision('half')
+
     def test_eig1(self, setup):
         # Test of eigenvalues
         R, param = [0.1, 1.5], [1., 0.1]
@@ -555,6 +711,25 @@ class TestHamiltonian(object):
             assert np.allclose(eig1, eig2, atol=1e-5)
             assert np.allclose(eig1, eig3, atol=1e-5)
 
+    def test_eigsh_window(self, setup):
+        HS = Hamiltonian(setup.g.tile(4, 0).tile(4, 1), orthogonal=False)
+        HS.construct([(0.1, 1.5), ((0.1, 1.), (-1., 0.1))])
+        for k in ([0] * 3, [0.2] * 3):
+            eig = HS.eigh(k)
+            eig = eig[np.logical_and(-1 <= eig, eig <= 1)]
+            assert np.allclose(eig, HS.eigsh(k, window=(-1, 1), n=2, nslice=2))
+            es = HS.eigenstate(k, sparse=True, window=(-1, 1))
+            assert np.allclose(eig, es.eig)
+            assert np.allclose(es.norm(), 1)
+
+    def test_eigsh_window_dirac(self, setup):
+        # the Dirac point at the window center is an exact eigenvalue at Gamma
+        H = Hamiltonian(setup.g.tile(3, 0).tile(3, 1))
+        H.construct([(0.1, 1.5), (0., -2.7)])
+        eig = H.eigh()
+        eig = eig[np.logical_and(-1 <= eig, eig <= 1)]
+        assert np.allclose(eig, H.eigsh(window=(-1, 1)))
+
     def test_gauge_eig(self, setup):
         # Test of eigenvalues
         R, param = [0.1, 1.5], [1., 0.1]
@@ -805,6 +980,102 @@ class TestHamiltonian(object):
         PDOS = es.PDOS(E)
         assert not np.allclose(PDOS.sum(0), DOS)
 
+    def test_dos_tetrahedron(self, setup):
+        from sisl.physics.electron import DOS_tetrahedron, PDOS_tetrahedron
+        HS = setup.HS.copy()
+        HS.construct([(0.1, 1.5), ((0., 1.), (1., 0.1))])
+        E = np.linspace(-4, 4, 100) + 0.0123
+        mp = MonkhorstPack(HS, [6, 6, 1])
+        eig = mp.asarray().eigh()
+        DOS = DOS_tetrahedron(E, eig, mp)
+        assert DOS.shape == E.shape
+        assert np.allclose(DOS, DOS_tetrahedron(E, eig, mp, bloechl=True))
+        # Integrated DOS is the number of bands (displaced to remove flat tetrahedra)
+        mp_displ = MonkhorstPack(HS, [6, 6, 1], displacement=[0.1, 0.23, 0], trs=False)
+        eig_displ = mp_displ.asarray().eigh()
+        E_int = np.linspace(eig_displ.min() - 0.1, eig_displ.max() + 0.1, 4000)
+        assert np.trapz(DOS_tetrahedron(E_int, eig_displ, mp_displ), E_int) == pytest.approx(len(HS), abs=1e-2)
+
+        # Equivalent for symmetry reduced and full grids
+        mp_full = MonkhorstPack(HS, [6, 6, 1], trs=False)
+        assert np.allclose(DOS_tetrahedron(E, mp_full.asarray().eigh(), mp_full),
+                           DOS_tetrahedron(E, eig, mp))
+        mp_sym = MonkhorstPack(HS, [6, 6, 1], symmetry=True)
+        assert np.allclose(DOS_tetrahedron(E, mp_sym.asarray().eigh(), mp_sym),
+                           DOS_tetrahedron(E, eig, mp))
+
+    @pytest.mark.parametrize("bloechl", [True, False])
+    def test_pdos_tetrahedron(self, setup, bloechl):
+        from sisl.physics.electron import DOS_tetrahedron, PDOS_tetrahedron
+        HS = setup.HS.copy()
+        HS.construct([(0.1, 1.5), ((0., 1.), (1., 0.1))])
+        E = np.linspace(-4, 4, 100) + 0.0123
+        mp = MonkhorstPack(HS, [6, 6, 1])
+        eig = mp.asarray().eigh()
+        weight = mp.asarray().eigenstate(wrap=lambda es: es.norm2(False))
+        PDOS = PDOS_tetrahedron(E, eig, weight, mp, bloechl)
+        assert PDOS.dtype.kind == 'f'
+        assert PDOS.shape == (len(HS), len(E))
+        assert np.allclose(PDOS.sum(0), DOS_tetrahedron(E, eig, mp))
+
+    @pytest.mark.xfail(raises=SislError)
+    def test_dos_tetrahedron_fail(self, setup):
+        from sisl.physics.electron import DOS_tetrahedron
+        mp = MonkhorstPack(setup.H, [6, 6, 1], size=[0.5, 0.5, 1])
+        DOS_tetrahedron([0.], np.zeros([len(mp), 2]), mp)
+
+    @pytest.mark.parametrize("kernel", ['jackson', 'lorentz'])
+    def test_dos_kpm(self, setup, kernel):
+        from sisl.physics.electron import DOS_kpm, PDOS_kpm
+        H = Hamiltonian(setup.g.tile(6, 0).tile(6, 1))
+        H.construct([(0.1, 1.5), (0.1, -1.)])
+        E = np.linspace(-3.4, 3.4, 801)
+        k = [0.1, 0.2, 0]
+        bounds = (-3.5, 3.5)
+        N = 64
+
+        # Reference from the exact moments of the eigenvalues
+        a, b = 7 / 1.98, 0.
+        x = np.arccos((H.eigh(k) - b) / a)
+        mu = np.cos(np.outer(np.arange(N), x)).sum(1)
+        n = np.arange(N)
+        if kernel == 'jackson':
+            q = np.pi / (N + 1)
+            mu *= ((N - n + 1) * np.cos(q * n) + np.sin(q * n) / np.tan(q)) / (N + 1)
+        else:
+            mu *= np.sinh(4 * (1 - n / N)) / np.sinh(4)
+        xE = (E - b) / a
+        T = np.cos(np.outer(n, np.arccos(xE)))
+        T[1:] *= 2
+        DOS = mu.dot(T) / (np.pi * a * np.sqrt(1 - xE ** 2))
+
+        PDOS = PDOS_kpm(E, H, k, N=N, orbitals=np.arange(len(H)), kernel=kernel, bounds=bounds)
+        assert PDOS.shape == (len(H), len(E))
+        assert np.allclose(PDOS.sum(0), DOS)
+        assert np.allclose(PDOS_kpm(E, H, k, N=N, orbitals=[1, 3], kernel=kernel, bounds=bounds), PDOS[[1, 3]])
+
+        # stochastic estimates
+        np.random.seed(1234)
+        kpm = DOS_kpm(E, H, k, N=N, R=32, kernel=kernel, bounds=bounds)
+        assert kpm.shape == E.shape
+        assert np.trapz(kpm, E) == pytest.approx(np.trapz(DOS, E), rel=1e-2)
+        assert np.abs(kpm - DOS).max() < 0.1 * DOS.max()
+        assert PDOS_kpm(E, H, k, N=N, R=2).shape == (len(H), len(E))
+
+        # Brillouin zone average
+        bz = BrillouinZone(H, [[0] * 3, k], [0.5, 0.5])
+        assert bz.asaverage().call(DOS_kpm, E, H, N=N).shape == E.shape
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_dos_kpm_kernel_fail(self, setup):
+        from sisl.physics.electron import DOS_kpm
+        DOS_kpm([0.], setup.H, kernel='unknown')
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_dos_kpm_orthogonal_fail(self, setup):
+        from sisl.physics.electron import DOS_kpm
+        DOS_kpm([0.], setup.HS)
+
     def test_pdos4(self, setup):
         # check whether the default S(Gamma) works
         # In this case we will assume an orthogonal
@@ -1266,6 +1537,80 @@ class TestHamiltonian(object):
         H.shift(-Ef)
         assert H.fermi_level(bz, q=1) == pytest.approx(0., abs=1e-6)
 
+    def test_fermi_level_charge(self, setup):
+        from sisl.physics.distribution import fermi_dirac
+        R, param = [0.1, 1.5], [(1., 1.), (2.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), orthogonal=False)
+        H.construct([R, param])
+        bz = MonkhorstPack(H, [10, 10, 1])
+        eig = bz.asarray().eigh()
+        for q in [0.2, 1, 1.7]:
+            Ef = H.fermi_level(bz, q=q)
+            qt = (fermi_dirac(eig, kT=0.1, mu=Ef) * bz.weight.reshape(-1, 1)).sum()
+            assert qt == pytest.approx(q, abs=1e-9)
+
+    def test_fermi_level_gap(self, setup):
+        from sisl.physics.distribution import get_distribution
+        # Zero temperature in an insulator is in the middle of the gap
+        H = Hamiltonian(Geometry([[0] * 3, [10] * 3], Atom(1, 1.), sc=[20] * 3))
+        H.construct([[0.1, 1.5], [1., 0.1]])
+        H[0, 0] = -1
+        bz = MonkhorstPack(H, [1, 1, 1])
+        Ef = H.fermi_level(bz, distribution=get_distribution('fd', smearing=1e-4), q=1)
+        assert Ef == pytest.approx(0.)
+
+    def test_fermi_level_limits(self, setup):
+        from sisl.physics.distribution import fermi_dirac
+        from sisl.physics.electron import _fermi_level
+        R, param = [0.1, 1.5], [(1., 1.), (2.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), orthogonal=False)
+        H.construct([R, param])
+        bz = MonkhorstPack(H, [10, 10, 1])
+        eig = bz.asarray().eigh()
+        w = bz.weight.reshape(-1, 1)
+        # the empty and full charge (summed in the same order as in _fermi_level)
+        cw = np.cumsum(np.broadcast_to(w, eig.shape).ravel()[np.argsort(eig.ravel())])
+        for q in [0, cw[-1]]:
+            Ef = _fermi_level(eig, w, fermi_dirac, q=q)
+            assert np.isfinite(Ef)
+            assert (fermi_dirac(eig, mu=Ef) * w).sum() == pytest.approx(q, abs=1e-9)
+            Ef = H.fermi_level(bz, q=q)
+            assert np.isfinite(Ef)
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_fermi_level_fail(self, setup):
+        R, param = [0.1, 1.5], [(1., 1.), (2.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), orthogonal=False)
+        H.construct([R, param])
+        H.fermi_level(MonkhorstPack(H, [2, 2, 1]), q=3)
+
+    def test_fermi_level_polarized(self, setup):
+        R, param = [0.1, 1.5], [(1., 1.2, 1.), (2.1, 2.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), spin=Spin('P'), orthogonal=False)
+        H.construct([R, param])
+        bz = MonkhorstPack(H, [10, 10, 1])
+        for distribution in ['fermi_dirac', 'tetrahedron']:
+            Ef = H.fermi_level(bz, distribution=distribution, q=1.3)
+            H.shift(-Ef)
+            assert H.fermi_level(bz, distribution=distribution, q=1.3) == pytest.approx(0., abs=1e-6)
+
+    def test_fermi_level_tetrahedron(self, setup):
+        from sisl.physics.electron import _tetrahedron_index, _tetrahedron_occupation
+        R, param = [0.1, 1.5], [(1., 1.), (2.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), orthogonal=False)
+        H.construct([R, param])
+        bz = MonkhorstPack(H, [10, 10, 1], displacement=[0.1, 0.23, 0], trs=False)
+        Ef = H.fermi_level(bz, distribution='tetrahedron', q=0.7)
+        H.shift(-Ef)
+        assert H.fermi_level(bz, distribution='tetrahedron', q=0.7) == pytest.approx(0., abs=1e-6)
+
+        # The Bloechl correction does not change the charge
+        tetra = bz.tetrahedra()
+        eig, _ = _tetrahedron_index(tetra, bz.asarray().eigh())
+        assert _tetrahedron_occupation(0., eig, False).sum() / len(tetra) == pytest.approx(0.7)
+        assert _tetrahedron_occupation(0., eig, True).sum() / len(tetra) == pytest.approx(0.7)
+        assert _tetrahedron_occupation(eig.max(), eig, True).sum() / len(tetra) == pytest.approx(2.)
+
     def test_edges1(self, setup):
         R, param = [0.1, 1.5], [1., 0.1]
         H = Hamiltonian(setup.g)
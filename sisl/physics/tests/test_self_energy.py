@@ -2,6 +2,7 @@ from __future__ import print_function, division
 
 import pytest
 
+import os
 import math as m
 import warnings
 import numpy as np
@@ -10,6 +11,7 @@ from sisl import Geometry, Atom, SuperCell, Hamiltonian
 from sisl import BrillouinZone
 from sisl import SelfEnergy, SemiInfinite, RecursiveSI
 from sisl import RealSpaceSE
+from sisl import set_precision
 
 
 pytestmark = pytest.mark.self_energy
@@ -63,6 +65,17 @@ def test_sancho_orthogonal_dtype(setup):
     assert np.allclose(s64, s128)
 
 
+def test_sancho_single_precision(setup):
+    SE = RecursiveSI(setup.H, '+A')
+    set_precision('single')
+    try:
+        s64 = SE.self_energy(0.1, [0, 0.1, 0])
+    finally:
+        set_precision('double')
+    assert s64.dtype == np.complex64
+    assert np.allclose(s64, SE.self_energy(0.1, [0, 0.1, 0]), atol=1e-4)
+
+
 def test_sancho_non_orthogonal(setup):
     SE = RecursiveSI(setup.HS, '-A')
     assert not np.allclose(SE.self_energy(0.1), SE.self_energy(0.1, bulk=True))
@@ -110,6 +123,97 @@ def test_sancho_lr(setup):
     assert np.allclose(RB_SER, R_SE)
 
 
+@pytest.mark.parametrize("bulk", [True, False])
+def test_sancho_energies(setup, bulk):
+    SE = RecursiveSI(setup.HS, '+A')
+    E = np.linspace(-1, 1, 5)
+    E[1] += 0.1j
+    k = [0, 0.13, 0]
+    s = SE.self_energy(E, k, bulk=bulk)
+    assert s.shape == (len(E), len(setup.HS), len(setup.HS))
+    for i, e in enumerate(E):
+        assert np.allclose(s[i], SE.self_energy(e, k, bulk=bulk))
+
+    L, R = SE.self_energy_lr(E, k, bulk=bulk)
+    assert L.shape == s.shape
+    assert np.allclose(R, s)
+    for i, e in enumerate(E):
+        Le, Re = SE.self_energy_lr(e, k, bulk=bulk)
+        assert np.allclose(L[i], Le)
+        assert np.allclose(R[i], Re)
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+@pytest.mark.parametrize("D", ['+A', '-A', '+B', '-B'])
+def test_sancho_transfer(setup, bulk, D):
+    E = np.linspace(-3, 3, 7)
+    k = [0.1, 0.13, 0]
+    for H in [setup.H, setup.HS]:
+        SE = RecursiveSI(H, D, eta=1e-4)
+        s = SE.self_energy(E, k, bulk=bulk, method='sancho')
+        assert np.allclose(s, SE.self_energy(E, k, bulk=bulk, method='transfer'))
+        # sancho is the default, 'auto' uses transfer for small eta
+        assert np.allclose(s, SE.self_energy(E, k, bulk=bulk))
+        n = len(H)
+        assert SE._solver(None, 1e-4j, n) == SE._sancho
+        assert SE._solver('auto', 1e-5j, n) == SE._transfer
+        assert SE._solver('auto', 1e-3j, n) == SE._sancho
+        L, R = SE.self_energy_lr(E, k, bulk=bulk, method='sancho')
+        Lt, Rt = RecursiveSI(H, D, eta=1e-4, method='transfer').self_energy_lr(E, k, bulk=bulk)
+        assert np.allclose(L, Lt)
+        assert np.allclose(R, Rt)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_sancho_method_fail(setup):
+    RecursiveSI(setup.H, '+A').self_energy(0.1, method='unknown')
+
+
+def test_sancho_cache(setup, sisl_tmp):
+    path = str(sisl_tmp.dir('se_cache'))
+    SE = RecursiveSI(setup.HS, '+A')
+    E = np.linspace(-1, 1, 5)
+    k = [0, 0.13, 0]
+    s = SE.self_energy(E, k)
+    L, R = SE.self_energy_lr(E, k)
+    SE.set_cache(path)
+    assert np.allclose(s, SE.self_energy(E, k))
+    assert np.allclose(s[2], SE.self_energy(E[2], k))
+    assert np.allclose(L, SE.self_energy_lr(E, k)[0])
+    assert np.allclose(R, SE.self_energy_lr(E, k)[1])
+
+    # A new object (same content) uses the cache without calculating
+    SE2 = RecursiveSI(setup.HS, '+A').set_cache(path)
+    def fail(*args, **kwargs):
+        raise ValueError
+    SE2._self_energy = fail
+    assert np.allclose(s, SE2.self_energy(E, k))
+
+    # The solver is part of the key (the default is sancho)
+    assert np.allclose(s, SE2.self_energy(E, k, method='sancho'))
+    with pytest.raises(ValueError):
+        SE2.self_energy(E, k, method='transfer')
+
+    # Different content, eta and arguments are not found in the cache
+    with pytest.raises(ValueError):
+        SE2.self_energy(E, k, bulk=True)
+    with pytest.raises(ValueError):
+        SE2.self_energy(E + 1e-3j, k)
+    HS = setup.HS.copy()
+    HS[0, 0] = 0.1
+    with pytest.raises(ValueError):
+        SE2.spgeom0 = RecursiveSI(HS, '+A').spgeom0
+        SE2.self_energy(E, k)
+
+    # Limit size (only the last entry remains)
+    size = min(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+    SE.set_cache(path, max_size=size)
+    SE.self_energy(E[:2] + 0.1, k)
+    assert len(os.listdir(path)) == 1
+    SE._cache.clear()
+    assert len(os.listdir(path)) == 0
+
+
 @pytest.mark.parametrize("k_axis", [None, 0, 1])
 @pytest.mark.parametrize("semi_axis", [None, 0, 1])
 @pytest.mark.parametrize("trs", [True, False])
@@ -148,6 +252,41 @@ def test_real_space_H(setup, k_axis, semi_axis, trs, bz, unfold):
     RSE.self_energy(0.1)
 
 
+@pytest.mark.parametrize("unfold", [1, 2, 3])
+def test_real_space_coupling_pool(setup, unfold):
+    RSE = RealSpaceSE(setup.HS, (unfold, 2, 1), eta=1e-2)
+    RSE.update_option(semi_axis=0, k_axis=1, dk=100)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        RSE.initialize()
+    orbs = RSE._calc['orbs']
+
+    G = RSE.green(0.1)
+    assert np.allclose(G[orbs, orbs.T], RSE.green(0.1, coupling=True))
+    SE = RSE.self_energy(0.1)
+    assert np.allclose(SE[orbs, orbs.T], RSE.self_energy(0.1, coupling=True))
+    SE = RSE.self_energy(0.1, bulk=True)
+    assert np.allclose(SE[orbs, orbs.T], RSE.self_energy(0.1, bulk=True, coupling=True))
+
+    RSE.update_option(pool=2)
+    assert np.allclose(G, RSE.green(0.1))
+
+
+def test_real_space_cache(setup, sisl_tmp):
+    path = str(sisl_tmp.dir('rse_cache'))
+    RSE = RealSpaceSE(setup.H, (2, 2, 1))
+    RSE.update_option(semi_axis=0, k_axis=1, dk=100)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        RSE.initialize()
+    G = RSE.green(0.1)
+    RSE.set_cache(path)
+    assert np.allclose(G, RSE.green(0.1))
+    assert np.allclose(G, RSE.green(0.1))
+    assert np.allclose(RSE.self_energy(0.1), RSE.set_cache().self_energy(0.1))
+    RSE.set_cache(path)._cache.clear()
+
+
 def test_real_space_H_dtype(setup):
     RSE = RealSpaceSE(setup.H, (2, 2, 1))
     RSE.update_option(semi_axis=0, k_axis=1, dk=100)
@@ -1,5 +1,7 @@
 from __future__ import print_function, division
 
+from itertools import product
+
 import numpy as np
 from numpy import dot
 
@@ -111,7 +113,10 @@ class Cuboid(PureShape):
         """ Return a sphere that encompass this cuboid """
         from .ellipsoid import Sphere
 
-        return Sphere(self.edge_length.max() / 2 * 3 ** .5, self.center.copy())
+        # For skewed cuboids the farthest corner may be further away
+        corners = dot(_a.arrayd(list(product([-0.5, 0.5], repeat=3))), self._v)
+        r = max(self.edge_length.max() / 2 * 3 ** .5, fnorm(corners).max())
+        return Sphere(r, self.center.copy())
 
     def toCuboid(self):
         """ Return a copy of itself """
@@ -37,6 +37,9 @@ def test_tosphere():
     assert cube.toSphere().radius == pytest.approx(1.5 * 3 ** 0.5)
     cube = Cuboid([1., 2., 3.])
     assert cube.toSphere().radius == pytest.approx(1.5 * 3 ** 0.5)
+    # skewed cuboid
+    cube = Cuboid([[1., 0, 0], [0.9, 0.1, 0], [0, 0, 1]])
+    assert cube.toSphere().radius == pytest.approx(0.5 * (1.9 ** 2 + 0.1 ** 2 + 1) ** 0.5)
 
 
 def test_toellipsoid():
@@ -10,7 +10,7 @@ import sisl._array as _a
 from .atom import Atom
 from .messages import warn, SislError, SislWarning, tqdm_eta
 from ._indices import index_sorted
-from ._help import get_dtype
+from ._help import get_dtype, _fork_context
 from ._help import _zip as zip, _range as range, _map as map
 from .utils.ranges import array_arange
 from .sparse import SparseCSR
@@ -220,6 +220,10 @@ class _SparseGeometry(object):
         Any attribute not found in the sparse class will
         be looked up in the hosting geometry.
         """
+        if attr.startswith('__') or '_geometry' not in self.__dict__:
+            # special methods (e.g. the pickle protocol) are not forwarded, nor any
+            # attribute before the geometry is set (while unpickling)
+            raise AttributeError(attr)
         return getattr(self.geometry, attr)
 
     # Make the indicis behave on the contained sparse matrix
@@ -434,7 +438,7 @@ class _SparseGeometry(object):
 
         return func
 
-    def construct(self, func, na_iR=1000, method='rand', eta=False):
+    def construct(self, func, na_iR=1000, method='rand', eta=False, n_workers=1):
         """ Automatically construct the sparse model based on a function that does the setting up of the elements
 
         This may be called in two variants.
@@ -446,8 +450,15 @@ class _SparseGeometry(object):
            the corresponding parameters.
            The second is the parameters
            corresponding to the ``R[i]`` elements.
-           In this second case all atoms must only have
-           one orbital.
+           In this second case the sparse matrix is created in one
+           go from the neighbour list of the geometry (`Geometry.neighbours`).
+           If all atoms have one orbital each parameter may be a single value (or one
+           value per dimension of the sparse matrix). Otherwise each parameter *must* be
+           a `dict` with species pairs as keys, ``param[i][isp, jsp]``, where the species
+           are either the species indices or the atomic tags (`Atom.tag`). The values are the
+           ``(isp.no, jsp.no)`` (or ``(isp.no, jsp.no, dim)``) blocks
+           coupling the orbitals of the two atoms. A missing ``(jsp, isp)`` block is taken
+           as the conjugate transpose of the ``(isp, jsp)`` block.
 
         Parameters
         ----------
@@ -471,6 +482,26 @@ class _SparseGeometry(object):
            method used in `Geometry.iter_block`, see there for details
         eta: bool, optional
            whether an ETA will be printed
+        n_workers : int, optional
+           number of processes used to call `func` (only used if `func` is callable).
+           The blocks from `Geometry.iter_block` are distributed to the processes and
+           each process returns the elements it has set. The elements from all blocks
+           are merged into this object in one go. If several blocks set the same element
+           the value set while looping the atom of the element's row wins, otherwise the block
+           with the largest atomic indices wins (independent of the order of the blocks).
+           The processes are forked and thus `func` need not be picklable, however, `func`
+           *must* only set elements in the sparse matrix passed to it (other side-effects
+           are lost). If processes cannot be forked (e.g. on Windows) the construction is serial.
+
+        Examples
+        --------
+        A carbon atom with two orbitals (on-site energies -1 and 1) in a graphene lattice
+
+        >>> C = Atom(6, [AtomicOrbital(n=2, l=0, R=1.5), AtomicOrbital(n=2, l=1, m=0, R=1.5)])
+        >>> H = Hamiltonian(geom.graphene(atom=C))
+        >>> H.construct([(0.1, 1.44), ({(0, 0): [[-1, 0], [0, 1]]}, {('C', 'C'): [[-2.7, 0], [0, -0.5]]})])
+        >>> H.nnz
+        32
 
         See Also
         --------
@@ -483,19 +514,28 @@ class _SparseGeometry(object):
             if not isinstance(func, (tuple, list)):
                 raise ValueError('Passed `func` which is not a function, nor tuple/list of `R, param`')
 
-            if np.any(np.diff(self.geometry.lasto) > 1):
-                raise ValueError("Automatically setting a sparse model "
-                              "for systems with atoms having more than 1 "
-                              "orbital *must* be done by your-self. You have to define a corresponding `func`.")
-
-            # Convert to a proper function
-            func = self.create_construct(func[0], func[1])
+            # Create eta-object
+            eta = tqdm_eta(self.na, self.__class__.__name__ + '.construct', 'atom', eta)
+            self._construct_shells(func[0], func[1])
+            eta.update(self.na)
+            eta.close()
+            return
 
         iR = self.geometry.iR(na_iR)
 
         # Create eta-object
         eta = tqdm_eta(self.na, self.__class__.__name__ + '.construct', 'atom', eta)
 
+        if n_workers > 1 and _fork_context() is None:
+            warn(self.__class__.__name__ + '.construct cannot fork processes on this platform, '
+                 'n_workers={} is ignored.'.format(n_workers))
+            n_workers = 1
+
+        if n_workers > 1:
+            self._construct_parallel(func, iR, method, eta, n_workers)
+            eta.close()
+            return
+
         # Do the loop
         for ias, idxs in self.geometry.iter_block(iR=iR, method=method):
 
@@ -511,6 +551,172 @@ class _SparseGeometry(object):
 
         eta.close()
 
+    def _construct_parallel(self, func, iR, method, eta, n_workers):
+        """ Call `func` on the atomic blocks in `n_workers` processes and merge the elements, see `construct` """
+        # Each process works on an empty copy of this object
+        sp = self.__class__(self.geometry, self.dim, self.dtype, max(1, self.nnz // max(1, len(self))),
+                            **self._cls_kwargs())
+
+        rows = []
+        cols = []
+        D = []
+        # Priority of the elements for duplicates, whether the element is in a row of a looped
+        # atom of its block and the first looped atom of its block
+        owner = []
+        block = []
+        if self.nnz > 0:
+            # Retain the current elements (they are overwritten by the new ones)
+            r, c, d = _construct_coo(self._csr)
+            rows.append(r)
+            cols.append(c)
+            D.append(d)
+            owner.append(np.zeros(len(r), np.bool_))
+            block.append(np.full(len(r), -1, np.int32))
+
+        pool = _fork_context().Pool(n_workers, initializer=_construct_init, initargs=(sp, func))
+        try:
+            blocks = self.geometry.iter_block(iR=iR, method=method)
+            for ias, r, c, d, o in pool.imap(_construct_block, blocks):
+                rows.append(r)
+                cols.append(c)
+                D.append(d)
+                owner.append(o)
+                block.append(np.full(len(r), ias.min(), np.int32))
+                eta.update(len(ias))
+        finally:
+            pool.close()
+            pool.join()
+
+        if len(rows) == 0:
+            return
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        D = np.concatenate(D)
+
+        # Sort elements and only retain the element with the highest priority for duplicates
+        idx = np.lexsort((np.concatenate(block), np.concatenate(owner), cols, rows))
+        rows, cols, D = rows[idx], cols[idx], D[idx, :]
+        idx = np.logical_or(np.diff(rows) != 0, np.diff(cols) != 0).nonzero()[0]
+        idx = np.append(idx, len(rows) - 1)
+        rows, cols, D = rows[idx], cols[idx], D[idx, :]
+        del idx
+
+        size = self._size
+        ptr = _a.emptyi([size + 1])
+        ptr[0] = 0
+        _a.cumsumi(np.bincount(rows, minlength=size), out=ptr[1:])
+        self._csr = SparseCSR((D, cols, ptr), shape=self._csr.shape, dtype=self.dtype)
+
+    def _construct_shells(self, R, param):
+        """ Create all sparse elements from shell parameters, see `construct` """
+        geom = self.geometry
+        na = geom.na
+        dim = self.dim
+        R = _a.asarrayd(R).ravel()
+        nshell = min(len(R), len(param))
+
+        if self._size == na:
+            # one element per atom
+            first = _a.arangei(na + 1)
+        else:
+            first = geom.firsto
+        nel = np.diff(first)
+        specie = geom.atoms.specie
+        nel_specie = _a.arrayi([nel[specie == i][0] if np.any(specie == i) else 0
+                                for i in range(len(geom.atoms.atom))])
+
+        def specie_index(a):
+            if isinstance(a, Integral):
+                return a
+            for i, atom in enumerate(geom.atoms.atom):
+                if atom.tag == a:
+                    return i
+            raise KeyError(self.__class__.__name__ + '.construct could not find atom with tag: ' + str(a))
+
+        def block(v, ni, nj):
+            v = np.asarray(v)
+            if v.ndim < 2:
+                # single value, or one value per dimension
+                return np.broadcast_to(v, (ni, nj, dim))
+            return np.broadcast_to(v.reshape(v.shape + (1,) * (3 - v.ndim)), (ni, nj, dim))
+
+        # Convert parameters to a list of (shell, specie_i, specie_j, block)
+        blocks = []
+        for i in range(nshell):
+            p = param[i]
+            if isinstance(p, dict):
+                p = dict(((specie_index(k[0]), specie_index(k[1])), v) for k, v in p.items())
+                for (si, sj), v in p.items():
+                    blocks.append((i, si, sj, block(v, nel_specie[si], nel_specie[sj])))
+                    if (sj, si) not in p and si != sj:
+                        v = np.conj(np.swapaxes(block(v, nel_specie[si], nel_specie[sj]), 0, 1))
+                        blocks.append((i, sj, si, v))
+            else:
+                if np.any(nel > 1):
+                    raise ValueError("Automatically setting a sparse model "
+                                     "for systems with atoms having more than 1 "
+                                     "orbital *must* be done by your-self or with species parameters. "
+                                     "You have to define a corresponding `func` or `dict` parameters.")
+                blocks.append((i, None, None, block(p, 1, 1)))
+
+        # Retrieve all neighbours in one go
+        ptr, col, _, shell = geom.neighbours(R[:nshell])
+        row = np.repeat(_a.arangei(na), np.diff(ptr))
+        isc = col // na
+        col = col % na
+
+        rows = []
+        cols = []
+        D = []
+        for i, si, sj, v in blocks:
+            idx = shell == i
+            if si is not None:
+                idx = np.logical_and(idx, specie[row] == si)
+                idx = np.logical_and(idx, specie[col] == sj)
+            idx = idx.nonzero()[0]
+            ni, nj = v.shape[:2]
+            r = first[row[idx]].reshape(-1, 1, 1) + _a.arangei(ni).reshape(1, -1, 1)
+            c = (first[col[idx]] + isc[idx] * self._size).reshape(-1, 1, 1) + _a.arangei(nj).reshape(1, 1, -1)
+            shape = (len(idx), ni, nj)
+            rows.append(np.broadcast_to(r, shape).ravel())
+            cols.append(np.broadcast_to(c, shape).ravel())
+            D.append(np.broadcast_to(v.reshape((1,) + v.shape), shape + (dim,)).reshape(-1, dim))
+
+        if len(blocks) > 0:
+            rows = np.concatenate(rows)
+            cols = np.concatenate(cols)
+            D = np.concatenate(D).astype(self.dtype, copy=False)
+        else:
+            rows = _a.emptyi([0])
+            cols = _a.emptyi([0])
+            D = np.empty([0, dim], self.dtype)
+
+        if self.nnz == 0:
+            # Sort according to rows (and columns)
+            idx = np.lexsort((cols, rows))
+            rows, cols, D = rows[idx], cols[idx], D[idx, :]
+        else:
+            # Merge with the already existing elements, the new elements are sorted
+            # after the existing ones and only the last of duplicates is retained
+            r, c, d = _construct_coo(self._csr)
+            new = np.concatenate((np.zeros(len(r), np.bool_), np.ones(len(rows), np.bool_)))
+            rows = np.concatenate((r, rows))
+            cols = np.concatenate((c, cols))
+            D = np.concatenate((d, D))
+            del r, c, d
+            idx = np.lexsort((new, cols, rows))
+            rows, cols, D = rows[idx], cols[idx], D[idx, :]
+            idx = np.logical_or(np.diff(rows) != 0, np.diff(cols) != 0).nonzero()[0]
+            idx = np.append(idx, len(rows) - 1)
+            rows, cols, D = rows[idx], cols[idx], D[idx, :]
+        del idx
+
+        size = self._size
+        ptr = _a.emptyi([size + 1])
+        ptr[0] = 0
+        _a.cumsumi(np.bincount(rows, minlength=size), out=ptr[1:])
+        self._csr = SparseCSR((D, cols, ptr), shape=self._csr.shape, dtype=self.dtype)
+
     @property
     def finalized(self):
         """ Whether the contained data is finalized and non-used elements have been removed """
@@ -765,6 +971,47 @@ class _SparseGeometry(object):
         return self
 
 
+def _construct_coo(csr):
+    """ Rows, columns and data of all elements in a `SparseCSR` """
+    ncol = csr.ncol
+    rows = (ncol > 0).nonzero()[0].astype(np.int32)
+    idx = array_arange(csr.ptr[rows], n=ncol[rows])
+    return np.repeat(rows, ncol[rows]), csr.col[idx], csr._D[idx, :]
+
+
+# State of the processes in `_SparseGeometry.construct`
+_construct_state = {}
+
+
+def _construct_init(sp, func):
+    _construct_state['sp'] = sp
+    _construct_state['func'] = func
+
+
+def _construct_block(block):
+    """ Call the construct function for a block of atoms and return (and remove) the set elements """
+    sp = _construct_state['sp']
+    func = _construct_state['func']
+    ias, idxs = block
+    idxs_xyz = sp.geometry[idxs, :]
+    for ia in ias:
+        func(sp, ia, idxs, idxs_xyz)
+
+    # Extract the set elements and clean the sparse matrix for the next block
+    csr = sp._csr
+    rows, cols, D = _construct_coo(csr)
+    rows_u = (csr.ncol > 0).nonzero()[0]
+    csr._D[array_arange(csr.ptr[rows_u], n=csr.ncol[rows_u]), :] = 0
+    csr.ncol[rows_u] = 0
+    csr._nnz = 0
+    # Whether the elements are in the rows of the looped atoms
+    if sp._size == sp.na:
+        owner = np.in1d(rows, ias)
+    else:
+        owner = np.in1d(sp.geometry.o2a(rows), ias)
+    return _a.asarrayi(ias), rows, cols, D, owner
+
+
 class SparseAtom(_SparseGeometry):
     """ Sparse object with number of rows equal to the total number of atoms in the `Geometry` """
 
@@ -700,6 +700,82 @@ class TestGeometry(object):
                 assert np.allclose(xa[j], xai[j])
                 assert np.allclose(d[j], di[j])
 
+    def test_close_index_brute(self, setup):
+        # passing idx uses the brute-force search
+        g = setup.g.repeat(4, 0).repeat(3, 1)
+        g.set_nsc([5, 5, 1])
+        idx = np.arange(g.na)
+        args = {'ret_xyz': True, 'ret_rij': True}
+        for ia in g:
+            i, xa, d = g.close(ia, R=(0.1, 1.5, 3.), **args)
+            ii, xai, di = g.close(ia, R=(0.1, 1.5, 3.), idx=idx, **args)
+            for j in range(3):
+                assert np.all(i[j] == ii[j])
+                assert np.allclose(xa[j], xai[j])
+                assert np.allclose(d[j], di[j])
+            for isc in [[0, 0, 0], [1, -1, 0], [-2, 2, 0]]:
+                i = g.close_sc(ia, isc, R=(0.1, 4.))
+                ii = g.close_sc(ia, isc, R=(0.1, 4.), idx=idx)
+                assert np.all(i[0] == ii[0])
+                assert np.all(i[1] == ii[1])
+
+    def test_within_index_brute(self, setup):
+        g = setup.g.repeat(4, 0).repeat(3, 1)
+        idx = np.arange(g.na)
+        shapes = [Sphere(0.1, g[3]), Cube(3., g[3])]
+        i = g.within(shapes)
+        ii = g.within(shapes, idx=idx)
+        assert np.all(i[0] == ii[0])
+        assert np.all(i[1] == ii[1])
+        for isc in [[0, 0, 0], [1, -1, 0]]:
+            i = g.within_sc(shapes, isc)
+            ii = g.within_sc(shapes, isc, idx=idx)
+            assert np.all(i[0] == ii[0])
+            assert np.all(i[1] == ii[1])
+
+    def test_close_index_update(self, setup):
+        g = setup.g.copy()
+        assert len(g.close(0, R=1.5)) == 4
+        # in-place changes are reflected
+        g.xyz[1, :] = [10., 10., 5.]
+        assert len(g.close(0, R=1.5)) == 1
+        g.xyz[1, :] += [5., 0., 0.]
+        assert len(g.close(0, R=1.5)) == 1
+        g.xyz[1, :] = setup.g.xyz[1, :]
+        assert len(g.close(0, R=1.5)) == 4
+        g.xyz = setup.g.xyz.copy()
+        assert len(g.close(0, R=1.5)) == 4
+        g.set_nsc([1, 1, 1])
+        assert len(g.close(0, R=1.5)) == 2
+        g.sc.cell[:, :] *= 2
+        g.set_nsc([3, 3, 1])
+        assert len(g.close(0, R=1.5)) == 2
+
+    def test_neighbours(self, setup):
+        g = setup.g.repeat(4, 0).repeat(3, 1)
+        R = (0.1, 1.5, 3.)
+        ptr, col, dist, shell = g.neighbours(R)
+        assert len(ptr) == g.na + 1
+        for ia in g:
+            sl = slice(ptr[ia], ptr[ia+1])
+            idx, d = g.close(ia, R=R, ret_rij=True)
+            for i in range(len(R)):
+                assert np.all(idx[i] == col[sl][shell[sl] == i])
+                assert np.allclose(d[i], dist[sl][shell[sl] == i])
+
+    def test_neighbours_atom(self, setup):
+        g = setup.g.repeat(4, 0).repeat(3, 1)
+        ptr, col, dist, shell = g.neighbours(1.5)
+        ptr1, col1, dist1, shell1 = g.neighbours(1.5, atom=[3, 1])
+        assert np.all(ptr1 == [0, 4, 8])
+        assert np.all(col1[:4] == col[ptr[3]:ptr[4]])
+        assert np.all(col1[4:] == col[ptr[1]:ptr[2]])
+        assert np.all(shell1 == 0)
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_neighbours_fail(self, setup):
+        setup.g.neighbours([1.5, 0.1])
+
     def test_within_inf1(self, setup):
         g = setup.g.translate([0.05] * 3)
         sc_3x3 = g.sc.tile(3, 0).tile(3, 1)
@@ -6,7 +6,7 @@ import math as m
 import numpy as np
 import scipy as sc
 
-from sisl import Geometry, Atom
+from sisl import Geometry, Atom, SislWarning
 from sisl.geom import fcc, graphene
 from sisl.sparse_geometry import *
 
@@ -124,6 +124,86 @@ class TestSparseAtom(object):
         s2 = s2.cut(2, 1)
         assert s1.spsame(s2)
 
+    def test_construct_shells_func(self, setup):
+        s1 = SparseAtom(setup.g, 2)
+        s1.construct([[0.1, 1.5], [1, (2, 3)]])
+        s2 = SparseAtom(setup.g, 2)
+        s2.construct(s2.create_construct([0.1, 1.5], [1, (2, 3)]))
+        assert s1.spsame(s2)
+        for i in range(2):
+            assert np.allclose(s1.tocsr(i).toarray(), s2.tocsr(i).toarray())
+
+    def test_construct_parallel(self, setup):
+        g = setup.g * (2, 2, 2)
+        s1 = SparseAtom(g, 2)
+        func = s1.create_construct([0.1, 1.5], [1, (2, 3)])
+        s1.construct(func, na_iR=4)
+        s2 = SparseAtom(g, 2)
+        s2[0, 0] = 10
+        s2[1, 0] = 10
+        s2.construct(func, na_iR=4, n_workers=2)
+        assert s1.spsame(s2)
+        for i in range(2):
+            assert np.allclose(s1.tocsr(i).toarray(), s2.tocsr(i).toarray())
+
+    def test_construct_parallel_merge(self, setup):
+        g = setup.g * (3, 3, 1)
+        na = g.na
+
+        def func(self, ia, idxs, idxs_xyz):
+            idx = self.geometry.close(ia, R=1.5, idx=idxs, idx_xyz=idxs_xyz)
+            # elements in other rows (from other blocks) are overwritten by the atom of the row
+            for ja in idx[idx < na]:
+                if self[ja, ia] == 0:
+                    self[ja, ia] = -1
+            self[ia, idx] = ia + 1
+
+        ref = SparseAtom(g)
+        for ia in range(na):
+            ref[ia, g.close(ia, R=1.5)] = ia + 1
+        for _ in range(3):
+            s = SparseAtom(g)
+            s.construct(func, na_iR=2, method='rand', n_workers=2)
+            assert s.spsame(ref)
+            assert np.allclose(s.tocsr().toarray(), ref.tocsr().toarray())
+
+    def test_construct_parallel_no_fork(self, setup, monkeypatch):
+        import sisl.sparse_geometry as sg
+        monkeypatch.setattr(sg, '_fork_context', lambda: None)
+        s1 = SparseAtom(setup.g, 2)
+        func = s1.create_construct([0.1, 1.5], [1, (2, 3)])
+        s1.construct(func)
+        s2 = SparseAtom(setup.g, 2)
+        with pytest.warns(SislWarning):
+            s2.construct(func, n_workers=2)
+        assert s1.spsame(s2)
+        for i in range(2):
+            assert np.allclose(s1.tocsr(i).toarray(), s2.tocsr(i).toarray())
+
+    def test_pickle(self, setup):
+        import pickle as p
+        s = SparseAtom(setup.g, 2)
+        s.construct([[0.1, 1.5], [1, (2, 3)]])
+        n = p.loads(p.dumps(s))
+        assert s.spsame(n)
+        assert n.geometry == s.geometry
+        for i in range(2):
+            assert np.allclose(s.tocsr(i).toarray(), n.tocsr(i).toarray())
+
+    def test_construct_shells_merge(self, setup):
+        s1 = SparseAtom(setup.g)
+        s1[0, 0] = 5
+        s1[0, setup.g.na_s - 1] = 6
+        s1.construct([[0.1, 1.5], [1, 2]])
+        s2 = SparseAtom(setup.g)
+        s2.construct([[0.1, 1.5], [1, 2]])
+        assert s1[0, 0] == 1
+        assert s1[0, setup.g.na_s - 1] == 6
+        assert s1.nnz == s2.nnz + 1
+        a1 = s1.tocsr().toarray()
+        a1[0, setup.g.na_s - 1] = 0
+        assert np.allclose(a1, s2.tocsr().toarray())
+
     def test_iter(self, setup):
         s1 = SparseAtom(setup.g)
         s1.construct([[0.1, 1.5], [1, 2]])